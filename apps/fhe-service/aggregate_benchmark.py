@@ -0,0 +1,109 @@
+"""
+Aggregation benchmark for FHE Service
+Sums N encrypted amounts with the aggregate endpoint and reports its throughput
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import requests
+
+BASE_URL = "http://localhost:8001"
+
+
+def encrypt_amounts(base_url: str, amounts: List[float], concurrency: int) -> List[str]:
+    """
+    Encrypt amounts to aggregate with the encrypt endpoint
+
+    Args:
+        base_url: URL of the service
+        amounts: Amounts to encrypt
+        concurrency: Number of concurrent clients
+
+    Returns:
+        Base64 encoded ciphertext of each amount
+    """
+    # requests sessions are not thread safe, so each client thread uses its own
+    local = threading.local()
+
+    def encrypt(amount: float) -> str:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        response = local.session.post(
+            f"{base_url}/api/fhe/encrypt",
+            json={"amount": amount, "function": "total"},
+        )
+        response.raise_for_status()
+        return response.json()["ciphertext"]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(encrypt, amounts))
+
+
+def benchmark(base_url: str, count: int, repetitions: int, concurrency: int):
+    """
+    Aggregate encrypted amounts and print the latency and throughput of aggregation
+
+    Args:
+        base_url: URL of the service
+        count: Number of amounts to aggregate
+        repetitions: Number of aggregations to time
+        concurrency: Number of concurrent clients used to encrypt amounts
+    """
+    amounts = [round(random.uniform(0.01, 99.99), 2) for _ in range(count)]
+    ciphertexts = encrypt_amounts(base_url, amounts, concurrency)
+
+    latencies = []
+    with requests.Session() as session:
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            response = session.post(
+                f"{base_url}/api/fhe/aggregate",
+                json={"ciphertexts": ciphertexts},
+            )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+        response = session.post(
+            f"{base_url}/api/fhe/decrypt",
+            json={"ciphertext": response.json()["ciphertext"], "function": "total"},
+        )
+        response.raise_for_status()
+
+    total = response.json()["amount"]
+    if abs(total - sum(amounts)) >= 0.01:
+        raise RuntimeError(f"Total mismatch: {sum(amounts):.2f} != {total}")
+
+    latency = sorted(latencies)[len(latencies) // 2]
+    print(
+        f"{count:>6} amounts: "
+        f"p50={latency * 1000:.1f}ms "
+        f"amounts/s={count / latency:.1f}"
+    )
+
+
+def main():
+    """Run the aggregation benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=BASE_URL, help="URL of the service")
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 10000],
+        help="Numbers of amounts to aggregate",
+    )
+    parser.add_argument("--repetitions", type=int, default=5, help="Aggregations per count")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent encrypt clients")
+    args = parser.parse_args()
+
+    for count in args.counts:
+        benchmark(args.url, count, args.repetitions, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Micro-batching request coalescer for FHE Service
+Groups concurrent requests into batches processed off the event loop
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+
+class RequestCoalescer:
+    """Queue items of concurrent requests and process them in batches on a worker pool"""
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        pool_size: int = 1,
+        name: str = "batch",
+    ):
+        """
+        Initialize request coalescer
+
+        Args:
+            process_batch: Blocking function processing a list of items,
+                           returning one result per item
+            max_batch_size: Maximum number of items in a batch
+            max_wait_ms: Maximum time to wait for a batch to fill (milliseconds)
+            pool_size: Number of batches processed concurrently
+                       (process_batch must be thread-safe if it's more than 1)
+            name: Name of the coalescer (for logging)
+        """
+        if max_batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("Maximum wait must not be negative")
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.pool_size = pool_size
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix=name)
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_env(cls, process_batch: Callable[[List[Any]], List[Any]], name: str = "batch"):
+        """
+        Create a request coalescer configured from environment variables
+
+        FHE_BATCH_MAX_SIZE, FHE_BATCH_MAX_WAIT_MS and FHE_BATCH_POOL_SIZE
+
+        Args:
+            process_batch: Blocking function processing a list of items
+            name: Name of the coalescer (for logging)
+        """
+        return cls(
+            process_batch,
+            max_batch_size=int(os.getenv("FHE_BATCH_MAX_SIZE", "64")),
+            max_wait_ms=float(os.getenv("FHE_BATCH_MAX_WAIT_MS", "5")),
+            pool_size=int(os.getenv("FHE_BATCH_POOL_SIZE", "1")),
+            name=name,
+        )
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit an item and wait for its result
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result of processing the item
+        """
+        if self._worker is None:
+            self._start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self):
+        """Stop collecting batches and shut down the worker pool"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        self._executor.shutdown(wait=True)
+
+    def _start(self):
+        """Start collecting batches on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.pool_size)
+        self._worker = asyncio.get_running_loop().create_task(self._collect())
+
+    async def _collect(self):
+        """Collect items into batches and dispatch them to the worker pool"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+
+            # wait for the batch to fill, up to the maximum wait
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # items keep queueing while all workers are busy, which makes the next batches larger
+            await self._slots.acquire()
+            loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Process a batch on the worker pool and resolve the future of each item"""
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+
+        try:
+            results = await loop.run_in_executor(self._executor, self._process, items)
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                # one invalid item must not fail the other requests of the batch
+                logger.warning(f"{self.name} batch of {len(items)} items failed, retrying one by one: {e}")
+                for item, future in batch:
+                    try:
+                        (result,) = await loop.run_in_executor(self._executor, self._process, [item])
+                    except Exception as item_error:
+                        if not future.done():
+                            future.set_exception(item_error)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+        else:
+            logger.debug(f"{self.name} batch of {len(items)} items processed")
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    def _process(self, items: List[Any]) -> List[Any]:
+        """Process items, checking there is one result per item"""
+        results = self.process_batch(items)
+        if len(results) != len(items):
+            raise RuntimeError(f"Expected {len(items)} results but got {len(results)}")
+        return results
@@ -6,10 +6,84 @@ Compiles circuits for homomorphic encryption operations
 from concrete import fhe
 import numpy as np
 from pathlib import Path
-import pickle
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from concrete.compiler import LweSecretKey
+import threading
+import time
 import os
+import zipfile
 from loguru import logger
 
+# Artifacts persisted in the keys directory
+SERVER_FILE = "server.zip"  # compiled library of the module, only needed for homomorphic operations
+CLIENT_FILE = "client.zip"  # client specs, needed to encrypt and decrypt
+SECRET_KEYS_FILE = "secret_keys.zip"  # secret keys, needed to encrypt and decrypt
+EVALUATION_KEYS_FILE = "evaluation_keys.bin"  # only needed for homomorphic operations
+
+# Aggregation sums encrypted amounts by chunks of AGGREGATE_CHUNK_SIZE with the total function,
+# then re-encrypts the partial totals and sums them the same way until a single total is left
+AGGREGATE_CHUNK_SIZE = 8
+MAX_AGGREGATE_AMOUNTS = 10_000  # the range of totals is sized for this many amounts
+
+# Rates of multiplications are integers scaled by RATE_SCALE (e.g., 10000 = 1.0)
+RATE_SCALE = 10_000
+MAX_RATE = 10.0  # products of larger rates have too much noise for the precision they need
+
+
+def create_payment_module():
+    """
+    Define the FHE module of the payment operations
+    
+    A new module is defined on each call, as modules accumulate
+    the inputsets (or ranges) they are compiled with
+    
+    Returns:
+        Module to compile, with amounts represented as integers (cents)
+    """
+    
+    @fhe.module()
+    class PaymentModule:
+        @fhe.function({"amount": "encrypted"})
+        def amount(amount):
+            """Encrypted amount, used to encrypt and decrypt amounts"""
+            return amount
+        
+        @fhe.function({"amount1": "encrypted", "amount2": "encrypted"})
+        def add(amount1, amount2):
+            """Add two encrypted amounts homomorphically"""
+            return amount1 + amount2
+        
+        @fhe.function({"amount": "encrypted", "rate": "clear"})
+        def multiply(amount, rate):
+            """Multiply encrypted amount by rate (for exchange rate conversion)"""
+            # Rate is a clear integer scaled by RATE_SCALE, and the product is only rescaled
+            # once decrypted, as dividing it would need a lookup table on the product,
+            # which is much larger than the 16-bit values table lookups support
+            return amount * rate
+        
+        # (one parameter per amount of a chunk, so it has AGGREGATE_CHUNK_SIZE parameters)
+        @fhe.function({f"amount{i}": "encrypted" for i in range(1, AGGREGATE_CHUNK_SIZE + 1)})
+        def total(amount1, amount2, amount3, amount4, amount5, amount6, amount7, amount8):
+            """Sum a chunk of encrypted amounts or partial totals (padded with encrypted zeros)"""
+            return amount1 + amount2 + amount3 + amount4 + amount5 + amount6 + amount7 + amount8
+        
+        # Encrypted amounts can be used as any input of add and multiply
+        # (amount is an identity, so its output and its input are the same ciphertext)
+        # Amounts to aggregate are encrypted for total instead (see FHECircuit.encrypt),
+        # as wires share precision, and amounts would get the much larger precision of totals
+        # Partial totals are not wired back into total either, as the noise of sums grows
+        # with each round, so they are re-encrypted between rounds (see FHECircuit.aggregate)
+        composition = fhe.Wired(
+            {
+                fhe.Wire(fhe.Output(amount, 0), fhe.Input(add, 0)),
+                fhe.Wire(fhe.Output(amount, 0), fhe.Input(add, 1)),
+                fhe.Wire(fhe.Output(amount, 0), fhe.Input(multiply, 0)),
+            }
+        )
+    
+    return PaymentModule
+
 
 class FHECircuit:
     """FHE Circuit for payment amount encryption/decryption"""
@@ -24,181 +98,476 @@ class FHECircuit:
         self.keys_dir = Path(keys_dir)
         self.keys_dir.mkdir(exist_ok=True)
         
-        self.circuit = None
+        self.module = None
+        self.client: Optional[fhe.Client] = None
+        self.server: Optional[fhe.Server] = None
+        self.evaluation_keys: Optional[fhe.EvaluationKeys] = None
         self.configuration = None
         
-    def compile_circuit(self, inputset: list = None):
+        # Set once encryption/decryption (client) and homomorphic operations (server) are ready
+        self.client_ready = threading.Event()
+        self.server_ready = threading.Event()
+        self.error: Optional[Exception] = None
+        
+        # Chunks of aggregations are summed concurrently (the runtime releases the GIL)
+        self.aggregate_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("FHE_AGGREGATE_WORKERS", str(os.cpu_count() or 1))),
+            thread_name_prefix="aggregate",
+        )
+        self._encrypted_zero: Optional[fhe.Value] = None
+        
+    def compile_circuit(self, inputset: list = None, rates: list = None):
         """
         Compile the FHE circuit for addition operations
         
         Args:
             inputset: List of sample inputs for compilation
                      Default: [0, 1, 2, ..., 999999] (0 to 999,999)
+                     Only its minimum and maximum are used, bounds are
+                     propagated from the declared range without sampling
+            rates: List of sample rates of multiplications (scaled by RATE_SCALE)
+                   Default: [0, ..., MAX_RATE * RATE_SCALE] (rates up to MAX_RATE)
+                   Only its minimum and maximum are used as well
         """
         if inputset is None:
-            # Default inputset: 0 to 999,999 (supports amounts up to 999,999.99)
+            # Default range: 0 to 999,999 (supports amounts up to 999,999.99)
             # We use integers to represent amounts (multiply by 100 for cents)
-            inputset = list(range(0, 1000000))
-        
-        logger.info(f"Compiling FHE circuit with inputset size: {len(inputset)}")
+            amounts = fhe.Interval(0, 999_999)
+        else:
+            amounts = fhe.Interval(min(inputset), max(inputset))
+        
+        if rates is None:
+            rates = fhe.Interval(0, int(MAX_RATE * RATE_SCALE))
+        else:
+            rates = fhe.Interval(min(rates), max(rates))
+        
+        # Partial totals of up to MAX_AGGREGATE_AMOUNTS amounts
+        totals = fhe.Interval(0, amounts.maximum * MAX_AGGREGATE_AMOUNTS)
+        
+        logger.info(f"Compiling FHE module with amounts in {amounts}")
+        
+        # All functions are compiled together, so they share a single keyset
+        # and a ciphertext of an amount can be used by any of them
+        self.module = create_payment_module().compile(
+            {
+                "amount": {"amount": amounts},
+                "add": {"amount1": amounts, "amount2": amounts},
+                "multiply": {"amount": amounts, "rate": rates},
+                "total": {f"amount{i}": totals for i in range(1, AGGREGATE_CHUNK_SIZE + 1)},
+            }
+        )
+        self.client = self.module.client
+        self.server = self.module.server
+        
+        logger.info("Module compilation completed successfully")
         
-        @fhe.compiler({"amount": "encrypted"})
-        def add_amount(amount: int) -> int:
-            """Add encrypted amount (placeholder for future homomorphic operations)"""
-            return amount
+    def generate_keys(self):
+        """Generate encryption keys shared by all functions of the module"""
+        if self.module is None:
+            raise RuntimeError("Circuit must be compiled before generating keys")
         
-        @fhe.compiler({"amount1": "encrypted", "amount2": "encrypted"})
-        def add_two_amounts(amount1: int, amount2: int) -> int:
-            """Add two encrypted amounts homomorphically"""
-            return amount1 + amount2
+        logger.info("Generating encryption keys...")
+        self.module.keygen()
+        self.evaluation_keys = self.client.evaluation_keys
+        self.client_ready.set()
+        self.server_ready.set()
+        logger.info("Keys generated successfully")
         
-        @fhe.compiler({"amount": "encrypted", "rate": "encrypted"})
-        def multiply_amount(amount: int, rate: int) -> int:
-            """Multiply encrypted amount by rate (for exchange rate conversion)"""
-            # Note: Concrete Python supports multiplication, but with limitations
-            # For now, we'll use a simplified approach
-            return amount * rate // 10000  # Rate is stored as integer (e.g., 10000 = 1.0)
+    def save_keys(self):
+        """Save the server library, the client specs and the keys to the keys directory"""
+        if self.module is None or self.client is None or not self.client.keys.are_generated:
+            raise RuntimeError("Circuit must be compiled and keys generated before saving")
         
-        # Compile the main circuit (add_amount)
-        logger.info("Compiling add_amount circuit...")
-        self.circuit = add_amount.compile(inputset)
+        logger.info(f"Saving circuit artifacts and keys to {self.keys_dir}")
+        
+        # Each file is written next to its final location and renamed,
+        # so a crash while saving never leaves partial artifacts behind
+        for name, save in [
+            (SERVER_FILE, self.server.save),
+            (CLIENT_FILE, self.client.save),
+            (SECRET_KEYS_FILE, self._save_secret_keys),
+            (EVALUATION_KEYS_FILE, lambda path: path.write_bytes(self.evaluation_keys.serialize())),
+        ]:
+            path = self.keys_dir / name
+            temporary = path.with_name(f"tmp.{name}")
+            save(temporary)
+            os.replace(temporary, path)
+        
+        logger.info(f"Circuit artifacts and keys saved successfully to {self.keys_dir}")
+        
+    def _save_secret_keys(self, path: Path):
+        """Save the secret keys of the module, one entry per key identifier"""
+        # pylint: disable-next=protected-access
+        secret_keys = self.client.keys._keyset.get_client_keys().get_secret_keys()
+        with zipfile.ZipFile(path, "w") as archive:
+            for key_id, secret_key in enumerate(secret_keys):
+                archive.writestr(f"{key_id}.bin", secret_key.serialize())
+        
+    def has_saved_keys(self) -> bool:
+        """Tell if the keys directory contains saved circuit artifacts and keys"""
+        return all(
+            (self.keys_dir / name).exists()
+            for name in (SERVER_FILE, CLIENT_FILE, SECRET_KEYS_FILE, EVALUATION_KEYS_FILE)
+        )
+        
+    def load_keys(self):
+        """
+        Load the client specs and the secret keys, which is enough to encrypt and decrypt
         
-        # Compile add_two_amounts circuit
-        logger.info("Compiling add_two_amounts circuit...")
-        self.add_circuit = add_two_amounts.compile(inputset)
+        The server library and the evaluation keys are loaded separately by `load_server`
+        """
+        for name in (CLIENT_FILE, SECRET_KEYS_FILE):
+            if not (self.keys_dir / name).exists():
+                raise FileNotFoundError(f"Keys file not found: {self.keys_dir / name}")
         
-        # Compile multiply_amount circuit
-        logger.info("Compiling multiply_amount circuit...")
-        self.multiply_circuit = multiply_amount.compile(inputset)
+        logger.info(f"Loading client specs and secret keys from {self.keys_dir}")
+        start = time.perf_counter()
         
-        logger.info("Circuit compilation completed successfully")
+        client = fhe.Client.load(self.keys_dir / CLIENT_FILE)
         
-    def generate_keys(self):
-        """Generate encryption keys for the circuit"""
-        if self.circuit is None:
-            raise RuntimeError("Circuit must be compiled before generating keys")
+        parameters = client.specs.program_info.get_keyset_info().secret_keys()
+        with zipfile.ZipFile(self.keys_dir / SECRET_KEYS_FILE) as archive:
+            secret_keys = {
+                key_id: LweSecretKey.deserialize(archive.read(f"{key_id}.bin"), parameter)
+                for key_id, parameter in enumerate(parameters)
+            }
         
-        logger.info("Generating encryption keys...")
-        self.circuit.keygen()
-        logger.info("Keys generated successfully")
+        # The keyset of the client is built from the saved secret keys
+        # (the module has no table lookup, so it has no bootstrapping keys to derive from them,
+        #  and the evaluation keys of the server are the saved ones, loaded by `load_server`)
+        client.keygen(initial_keys=secret_keys)
+        self.client = client
+        self.client_ready.set()
         
-    def save_keys(self, filename: str = "fhe_keys.pkl"):
-        """Save circuit and keys to file"""
-        if self.circuit is None:
-            raise RuntimeError("Circuit must be compiled and keys generated before saving")
+        logger.info(f"Client specs and secret keys loaded in {time.perf_counter() - start:.2f}s")
         
-        keys_path = self.keys_dir / filename
-        logger.info(f"Saving keys to {keys_path}")
+    def load_server(self):
+        """Load the server library and the evaluation keys, needed for homomorphic operations"""
+        if self.client is None:
+            raise RuntimeError("Keys must be loaded before the server")
         
-        # Save the circuit (which contains the keys)
-        with open(keys_path, "wb") as f:
-            pickle.dump({
-                "circuit": self.circuit,
-                "add_circuit": self.add_circuit,
-                "multiply_circuit": self.multiply_circuit
-            }, f)
+        for name in (SERVER_FILE, EVALUATION_KEYS_FILE):
+            if not (self.keys_dir / name).exists():
+                raise FileNotFoundError(f"Server file not found: {self.keys_dir / name}")
         
-        logger.info(f"Keys saved successfully to {keys_path}")
+        logger.info(f"Loading server and evaluation keys from {self.keys_dir}")
+        start = time.perf_counter()
         
-    def load_keys(self, filename: str = "fhe_keys.pkl"):
-        """Load circuit and keys from file"""
-        keys_path = self.keys_dir / filename
+        self.server = fhe.Server.load(self.keys_dir / SERVER_FILE)
+        self.evaluation_keys = fhe.EvaluationKeys.deserialize(
+            (self.keys_dir / EVALUATION_KEYS_FILE).read_bytes()
+        )
+        self.server_ready.set()
         
-        if not keys_path.exists():
-            raise FileNotFoundError(f"Keys file not found: {keys_path}")
+        logger.info(f"Server and evaluation keys loaded in {time.perf_counter() - start:.2f}s")
         
-        logger.info(f"Loading keys from {keys_path}")
+    def wait_client(self, timeout: Optional[float] = None):
+        """
+        Wait until encryption and decryption are ready
         
-        with open(keys_path, "rb") as f:
-            data = pickle.load(f)
-            self.circuit = data["circuit"]
-            self.add_circuit = data.get("add_circuit")
-            self.multiply_circuit = data.get("multiply_circuit")
+        Args:
+            timeout: Maximum time to wait (seconds), forever if None
+        """
+        self._wait(self.client_ready, timeout)
         
-        logger.info("Keys loaded successfully")
+    def wait_server(self, timeout: Optional[float] = None):
+        """
+        Wait until homomorphic operations are ready
         
-    def encrypt(self, amount: float) -> bytes:
+        Args:
+            timeout: Maximum time to wait (seconds), forever if None
+        """
+        self._wait(self.server_ready, timeout)
+        
+    def _wait(self, event: threading.Event, timeout: Optional[float]):
+        """Wait for an initialization step, failing if initialization failed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not event.is_set():
+            if self.error is not None:
+                raise RuntimeError(f"FHE circuit failed to initialize: {self.error}")
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("FHE circuit is not ready yet")
+            event.wait(0.1 if remaining is None else min(0.1, remaining))
+        
+    def encrypt(self, amount: float, function: str = "amount") -> bytes:
         """
         Encrypt a payment amount
         
         Args:
             amount: Payment amount (e.g., 100.50)
+            function: Function of the module to encrypt the amount for
+                      ("amount" for add and multiply, "total" for aggregate)
             
         Returns:
-            Encrypted ciphertext as bytes
+            Serialized encrypted ciphertext
         """
-        if self.circuit is None:
-            raise RuntimeError("Circuit must be compiled and keys loaded before encryption")
-        
-        # Convert amount to integer (multiply by 100 to preserve cents)
-        amount_int = int(amount * 100)
+        self.wait_client()
         
-        # Encrypt using the circuit
-        encrypted = self.circuit.encrypt(amount_int)
+        # Encrypt using the client
+        encrypted = self.client.encrypt(
+            *self._encryption_arguments(amount, function),
+            function_name=function,
+        )
         
-        return encrypted
+        return self._encrypted_amount(encrypted).serialize()
         
-    def decrypt(self, ciphertext: bytes) -> float:
+    def decrypt(self, ciphertext: bytes, function: str = "amount") -> float:
         """
         Decrypt a ciphertext to get the payment amount
         
         Args:
-            ciphertext: Encrypted ciphertext as bytes
+            ciphertext: Serialized encrypted ciphertext
+            function: Function of the module which produced the ciphertext
+                      ("amount" for encrypted amounts, "add" or "multiply" for results)
             
         Returns:
             Decrypted amount as float
         """
-        if self.circuit is None:
-            raise RuntimeError("Circuit must be compiled and keys loaded before decryption")
+        self.wait_client()
         
-        # Decrypt using the circuit
-        decrypted_int = self.circuit.decrypt(ciphertext)
+        # Decrypt using the function which produced the ciphertext
+        decrypted_int = self.client.decrypt(
+            fhe.Value.deserialize(ciphertext),
+            function_name=function,
+        )
         
-        # Convert back to float (divide by 100)
-        amount = decrypted_int / 100.0
+        # Convert back to float (divide by 100, and by RATE_SCALE for products)
+        return decrypted_int / self._scale(function)
         
-        return amount
+    def encrypt_batch(self, amounts: List[float], function: str = "amount") -> List[bytes]:
+        """
+        Encrypt many payment amounts at once
+        
+        Args:
+            amounts: Payment amounts (e.g., [100.50, 20.00])
+            function: Function of the module to encrypt the amounts for (see `encrypt`)
+            
+        Returns:
+            Serialized encrypted ciphertext of each amount
+        """
+        self.wait_client()
+        
+        samples = [self._encryption_arguments(amount, function) for amount in amounts]
+        
+        # Validate all amounts together and encrypt them in parallel
+        encrypted = self.client.encrypt_batch(samples, function_name=function)
+        
+        return [self._encrypted_amount(value).serialize() for value in encrypted]
+        
+    @staticmethod
+    def _scale(function: str) -> float:
+        """Factor between the amounts produced by a function of the module and their value"""
+        return 100.0 * RATE_SCALE if function == "multiply" else 100.0
+        
+    @staticmethod
+    def _encryption_arguments(amount: float, function: str) -> tuple:
+        """Arguments of a function of the module to encrypt an amount with"""
+        if function not in ("amount", "total"):
+            raise ValueError(f"Amounts cannot be encrypted for {function}")
+        
+        # Convert amount to integer (multiply by 100 to preserve cents)
+        amount_int = int(round(amount * 100))
+        
+        if function == "total":
+            return FHECircuit._total_arguments(amount_int)
+        return (amount_int,)
+        
+    @staticmethod
+    def _total_arguments(amount_int: int) -> tuple:
+        """Arguments of total to encrypt an amount (in cents) or a partial total with"""
+        # Amounts are encrypted as the first input of total, the other inputs are skipped
+        # (all inputs of total have the same range, so the ciphertext fits any of them)
+        return (amount_int, *([None] * (AGGREGATE_CHUNK_SIZE - 1)))
+        
+    @staticmethod
+    def _encrypted_amount(encrypted) -> fhe.Value:
+        """Ciphertext of the amount among the encrypted arguments of a function"""
+        return encrypted[0] if isinstance(encrypted, tuple) else encrypted
+        
+    def decrypt_batch(self, ciphertexts: List[bytes]) -> List[float]:
+        """
+        Decrypt many serialized ciphertexts at once
+        
+        Args:
+            ciphertexts: Serialized encrypted ciphertexts
+            
+        Returns:
+            Decrypted amount of each ciphertext
+        """
+        self.wait_client()
+        
+        values = [fhe.Value.deserialize(ciphertext) for ciphertext in ciphertexts]
+        
+        # Decrypt in parallel and convert back to float (divide by 100)
+        decrypted = self.client.decrypt_batch(values, function_name="amount")
+        return [decrypted_int / 100.0 for decrypted_int in decrypted]
         
     def add_homomorphic(self, ciphertext1: bytes, ciphertext2: bytes) -> bytes:
         """
         Add two encrypted amounts homomorphically
         
         Args:
-            ciphertext1: First encrypted amount
-            ciphertext2: Second encrypted amount
+            ciphertext1: First serialized encrypted amount
+            ciphertext2: Second serialized encrypted amount
             
         Returns:
-            Encrypted result of addition
+            Serialized encrypted result of addition (decrypt it with function="add")
         """
-        if self.add_circuit is None:
-            raise RuntimeError("Add circuit must be compiled before homomorphic addition")
+        self.wait_server()
         
-        # Perform homomorphic addition
-        result = self.add_circuit.encrypt_and_run(ciphertext1, ciphertext2)
+        # Perform homomorphic addition with the keys shared by the module
+        result = self.server.run(
+            fhe.Value.deserialize(ciphertext1),
+            fhe.Value.deserialize(ciphertext2),
+            evaluation_keys=self.evaluation_keys,
+            function_name="add",
+        )
         
-        return result
+        return result.serialize()
         
     def multiply_homomorphic(self, ciphertext: bytes, rate: float) -> bytes:
         """
         Multiply encrypted amount by rate homomorphically
         
         Args:
-            ciphertext: Encrypted amount
-            rate: Exchange rate (e.g., 1.5 for 150%)
+            ciphertext: Serialized encrypted amount
+            rate: Exchange rate (e.g., 1.5 for 150%), from 0 to MAX_RATE
             
         Returns:
-            Encrypted result of multiplication
+            Serialized encrypted result of multiplication (decrypt it with function="multiply")
         """
-        if self.multiply_circuit is None:
-            raise RuntimeError("Multiply circuit must be compiled before homomorphic multiplication")
+        if not 0 <= rate <= MAX_RATE:
+            raise ValueError(f"Rate must be between 0 and {MAX_RATE} (got {rate})")
+        
+        self.wait_server()
         
-        # Convert rate to integer (multiply by 10000)
-        rate_int = int(rate * 10000)
+        # Convert rate to integer (multiply by RATE_SCALE), it's a clear argument of multiply
+        rate_int = int(round(rate * RATE_SCALE))
         
         # Perform homomorphic multiplication
-        result = self.multiply_circuit.encrypt_and_run(ciphertext, rate_int)
+        result = self.server.run(
+            fhe.Value.deserialize(ciphertext),
+            rate_int,
+            evaluation_keys=self.evaluation_keys,
+            function_name="multiply",
+        )
+        
+        return result.serialize()
+        
+    def aggregate(self, ciphertexts: List[bytes]) -> bytes:
+        """
+        Sum many encrypted amounts homomorphically
+        
+        Amounts are split into chunks of AGGREGATE_CHUNK_SIZE, which are summed in parallel,
+        then their partial totals are re-encrypted and reduced the same way, so N amounts take
+        about log(N) / log(AGGREGATE_CHUNK_SIZE) rounds instead of N - 1 sequential additions
         
-        return result
+        Args:
+            ciphertexts: Serialized amounts encrypted for total (at most MAX_AGGREGATE_AMOUNTS)
+            
+        Returns:
+            Serialized encrypted total (decrypt it with function="total")
+        """
+        if len(ciphertexts) == 0:
+            raise ValueError("At least one ciphertext is required")
+        if len(ciphertexts) > MAX_AGGREGATE_AMOUNTS:
+            raise ValueError(f"At most {MAX_AGGREGATE_AMOUNTS} ciphertexts can be aggregated")
+        
+        self.wait_server()
+        
+        if self._encrypted_zero is None:
+            self._encrypted_zero = self._encrypted_amount(
+                self.client.encrypt(*self._total_arguments(0), function_name="total")
+            )
+        
+        values = [fhe.Value.deserialize(ciphertext) for ciphertext in ciphertexts]
+        
+        # A single amount is summed with zeros as well, so results always come from total
+        rounds = 0
+        while True:
+            chunks = [
+                values[start:start + AGGREGATE_CHUNK_SIZE]
+                for start in range(0, len(values), AGGREGATE_CHUNK_SIZE)
+            ]
+            values = list(self.aggregate_executor.map(self._sum_chunk, chunks))
+            rounds += 1
+            
+            if len(values) == 1:
+                break
+            values = self._reencrypt_partial_totals(values)
+        
+        logger.debug(f"Aggregated {len(ciphertexts)} amounts in {rounds} rounds")
+        return values[0].serialize()
+        
+    def _reencrypt_partial_totals(self, partial_totals: List[fhe.Value]) -> List[fhe.Value]:
+        """
+        Re-encrypt partial totals as fresh inputs of total
+        
+        Noise of a sum grows with the noise of its inputs, so results of total cannot be
+        summed by total again (refreshing them would need a lookup table, which is limited
+        to 16-bit values, and totals are larger)
+        """
+        decrypted = self.client.decrypt_batch(partial_totals, function_name="total")
+        encrypted = self.client.encrypt_batch(
+            [self._total_arguments(int(partial_total)) for partial_total in decrypted],
+            function_name="total",
+        )
+        return [self._encrypted_amount(value) for value in encrypted]
+        
+    def _sum_chunk(self, chunk: List[fhe.Value]) -> fhe.Value:
+        """Sum a chunk of at most AGGREGATE_CHUNK_SIZE encrypted amounts or partial totals"""
+        padding = [self._encrypted_zero] * (AGGREGATE_CHUNK_SIZE - len(chunk))
+        return self.server.run(
+            *chunk,
+            *padding,
+            evaluation_keys=self.evaluation_keys,
+            function_name="total",
+        )
+        
+    def initialize(self, force_recompile: bool = False):
+        """
+        Load saved keys, or compile the circuit and generate keys if there are none
+        
+        Encryption and decryption are ready as soon as the client specs and keys are loaded,
+        before the server library and the evaluation keys
+        
+        Args:
+            force_recompile: Force recompilation even if keys exist
+        """
+        try:
+            if self.has_saved_keys() and not force_recompile:
+                logger.info("Loading existing keys...")
+                self.load_keys()
+                self.load_server()
+            else:
+                logger.info("Compiling new circuit...")
+                self.compile_circuit()
+                self.generate_keys()
+                self.save_keys()
+        except Exception as e:
+            self.error = e
+            raise
+        
+    def initialize_in_background(self, force_recompile: bool = False) -> threading.Thread:
+        """
+        Initialize the circuit on a background thread (see `initialize`)
+        
+        Args:
+            force_recompile: Force recompilation even if keys exist
+            
+        Returns:
+            Thread initializing the circuit
+        """
+        def run():
+            try:
+                self.initialize(force_recompile=force_recompile)
+            except Exception as e:
+                logger.error(f"Failed to initialize FHE circuit: {e}")
+        
+        thread = threading.Thread(target=run, name="fhe-initialization", daemon=True)
+        thread.start()
+        return thread
 
 
 def initialize_circuit(keys_dir: str = "./keys", force_recompile: bool = False) -> FHECircuit:
@@ -213,16 +582,5 @@ def initialize_circuit(keys_dir: str = "./keys", force_recompile: bool = False)
         Initialized FHECircuit instance
     """
     circuit = FHECircuit(keys_dir=keys_dir)
-    keys_file = Path(keys_dir) / "fhe_keys.pkl"
-    
-    if keys_file.exists() and not force_recompile:
-        logger.info("Loading existing keys...")
-        circuit.load_keys()
-    else:
-        logger.info("Compiling new circuit...")
-        circuit.compile_circuit()
-        circuit.generate_keys()
-        circuit.save_keys()
-    
+    circuit.initialize(force_recompile=force_recompile)
     return circuit
-
@@ -0,0 +1,111 @@
+"""
+Load test for FHE Service
+Sends concurrent encrypt/decrypt requests and reports latency percentiles and throughput
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import requests
+
+BASE_URL = "http://localhost:8001"
+
+
+def percentile(latencies: List[float], fraction: float) -> float:
+    """
+    Get a percentile of latencies
+
+    Args:
+        latencies: Sorted latencies
+        fraction: Percentile as a fraction (e.g., 0.99)
+
+    Returns:
+        Latency at the percentile
+    """
+    index = min(len(latencies) - 1, int(round(fraction * (len(latencies) - 1))))
+    return latencies[index]
+
+
+def round_trip(session: requests.Session, base_url: str) -> Tuple[float, float]:
+    """
+    Encrypt a random amount and decrypt it back
+
+    Args:
+        session: HTTP session of the calling thread
+        base_url: URL of the service
+
+    Returns:
+        Latency of the encryption and of the decryption requests (seconds)
+    """
+    amount = round(random.uniform(0.01, 9999.99), 2)
+
+    start = time.perf_counter()
+    response = session.post(f"{base_url}/api/fhe/encrypt", json={"amount": amount})
+    response.raise_for_status()
+    encrypt_latency = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = session.post(
+        f"{base_url}/api/fhe/decrypt",
+        json={"ciphertext": response.json()["ciphertext"]},
+    )
+    response.raise_for_status()
+    decrypt_latency = time.perf_counter() - start
+
+    decrypted = response.json()["amount"]
+    if abs(decrypted - amount) >= 0.01:
+        raise RuntimeError(f"Amount mismatch: {amount} != {decrypted}")
+
+    return encrypt_latency, decrypt_latency
+
+
+def report(name: str, latencies: List[float], elapsed: float):
+    """
+    Print latency percentiles and throughput of requests
+
+    Args:
+        name: Name of the endpoint
+        latencies: Latencies of the requests (seconds)
+        elapsed: Duration of the whole load test (seconds)
+    """
+    latencies = sorted(latencies)
+    print(
+        f"{name:>8}: "
+        f"p50={percentile(latencies, 0.50) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.1f}ms "
+        f"rps={len(latencies) / elapsed:.1f}"
+    )
+
+
+def main():
+    """Run the load test"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=BASE_URL, help="URL of the service")
+    parser.add_argument("--requests", type=int, default=1000, help="Number of round trips")
+    parser.add_argument("--concurrency", type=int, default=64, help="Number of concurrent clients")
+    args = parser.parse_args()
+
+    # requests sessions are not thread safe, so each client thread uses its own
+    local = threading.local()
+
+    def run_round_trip(_):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return round_trip(local.session, args.url)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(run_round_trip, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.requests} round trips with {args.concurrency} concurrent clients in {elapsed:.1f}s")
+    report("encrypt", [encrypt for encrypt, _ in results], elapsed)
+    report("decrypt", [decrypt for _, decrypt in results], elapsed)
+
+
+if __name__ == "__main__":
+    main()
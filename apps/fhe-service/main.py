@@ -6,35 +6,45 @@ Provides FHE encryption/decryption endpoints for PayAgent Gateway
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import List, Literal, Optional
+import asyncio
 import uvicorn
 from loguru import logger
 import base64
 import os
 from utils import encode_ciphertext, decode_ciphertext, validate_amount, format_error_message
+from batching import RequestCoalescer
 
 # Import FHE circuit (will fail gracefully if Concrete Python not installed)
 try:
-    from circuit import initialize_circuit, FHECircuit
+    from circuit import MAX_AGGREGATE_AMOUNTS, FHECircuit
     FHE_AVAILABLE = True
 except ImportError:
+    MAX_AGGREGATE_AMOUNTS = 10_000
     FHE_AVAILABLE = False
     logger.warning("Concrete Python not installed. FHE features will be disabled.")
 
 # Configure logging
 logger.add("fhe-service.log", rotation="10 MB", level="INFO")
 
-# Initialize FHE circuit (if available)
+# Initialize FHE circuit (if available) in the background, so the service starts right away
+# (encryption/decryption requests wait for the client specs and keys, which load first,
+#  and homomorphic operations wait for the server library and evaluation keys)
+# (serve.py sets FHE_DEFERRED_INITIALIZATION to load it once before forking its workers)
 fhe_circuit = None
 if FHE_AVAILABLE:
-    try:
-        keys_dir = os.getenv("FHE_KEYS_DIR", "./keys")
-        fhe_circuit = initialize_circuit(keys_dir=keys_dir, force_recompile=False)
-        logger.info("FHE circuit initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize FHE circuit: {e}")
-        logger.warning("Falling back to placeholder mode")
-        FHE_AVAILABLE = False
+    keys_dir = os.getenv("FHE_KEYS_DIR", "./keys")
+    fhe_circuit = FHECircuit(keys_dir=keys_dir)
+    if os.getenv("FHE_DEFERRED_INITIALIZATION") != "1":
+        fhe_circuit.initialize_in_background(force_recompile=False)
+
+# Coalesce concurrent requests into batches processed off the event loop
+# (configured with FHE_BATCH_MAX_SIZE, FHE_BATCH_MAX_WAIT_MS and FHE_BATCH_POOL_SIZE)
+encrypt_coalescer = None
+decrypt_coalescer = None
+if FHE_AVAILABLE and fhe_circuit is not None:
+    encrypt_coalescer = RequestCoalescer.from_env(fhe_circuit.encrypt_batch, name="encrypt")
+    decrypt_coalescer = RequestCoalescer.from_env(fhe_circuit.decrypt_batch, name="decrypt")
 
 app = FastAPI(
     title="FHE Service",
@@ -52,6 +62,14 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown_coalescers():
+    """Stop request coalescers"""
+    for coalescer in (encrypt_coalescer, decrypt_coalescer):
+        if coalescer is not None:
+            await coalescer.close()
+
+
 # Request/Response Models
 class EncryptRequest(BaseModel):
     """Request model for encryption"""
@@ -61,6 +79,10 @@ class EncryptRequest(BaseModel):
         le=999999.99,
         description="Payment amount to encrypt (0.01 to 999,999.99)"
     )
+    function: Literal["amount", "total"] = Field(
+        "amount",
+        description="Operation the ciphertext is encrypted for (\"total\" to aggregate it)"
+    )
     
     @validator('amount')
     def validate_amount(cls, v):
@@ -79,6 +101,10 @@ class EncryptResponse(BaseModel):
 class DecryptRequest(BaseModel):
     """Request model for decryption"""
     ciphertext: str = Field(..., min_length=1, description="Base64 encoded ciphertext")
+    function: Literal["amount", "total"] = Field(
+        "amount",
+        description="Operation which produced the ciphertext (\"total\" for aggregations)"
+    )
     
     @validator('ciphertext')
     def validate_ciphertext(cls, v):
@@ -96,11 +122,46 @@ class DecryptResponse(BaseModel):
     amount: float = Field(..., description="Decrypted payment amount")
 
 
+class AggregateRequest(BaseModel):
+    """Request model for aggregation"""
+    ciphertexts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_AGGREGATE_AMOUNTS,
+        description=(
+            f"Base64 encoded ciphertexts of amounts encrypted with function=\"total\" "
+            f"(1 to {MAX_AGGREGATE_AMOUNTS:,})"
+        )
+    )
+
+
+class AggregateResponse(BaseModel):
+    """Response model for aggregation"""
+    ciphertext: str = Field(
+        ...,
+        description="Base64 encoded ciphertext of the total (decrypt it with function=\"total\")"
+    )
+    count: int = Field(..., description="Number of aggregated amounts")
+
+
+def fhe_enabled() -> bool:
+    """Tell if requests are processed with FHE (as opposed to the placeholder implementation)"""
+    return FHE_AVAILABLE and fhe_circuit is not None and fhe_circuit.error is None
+
+
 # Health Check
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "fhe-service"}
+    """Health check endpoint, reporting which parts of the FHE circuit are loaded"""
+    return {
+        "status": "healthy",
+        "service": "fhe-service",
+        "fhe": {
+            "enabled": fhe_enabled(),
+            "client_ready": fhe_circuit is not None and fhe_circuit.client_ready.is_set(),
+            "server_ready": fhe_circuit is not None and fhe_circuit.server_ready.is_set(),
+        },
+    }
 
 
 # Encryption Endpoint
@@ -121,10 +182,15 @@ async def encrypt_amount(request: EncryptRequest):
         
         logger.info(f"Encryption request received: amount={request.amount}")
         
-        if FHE_AVAILABLE and fhe_circuit is not None:
+        if fhe_enabled() and encrypt_coalescer is not None:
             # Real FHE encryption
             try:
-                ciphertext_bytes = fhe_circuit.encrypt(request.amount)
+                if request.function == "amount":
+                    ciphertext_bytes = await encrypt_coalescer.submit(request.amount)
+                else:
+                    ciphertext_bytes = await asyncio.to_thread(
+                        fhe_circuit.encrypt, request.amount, function=request.function
+                    )
                 ciphertext = encode_ciphertext(ciphertext_bytes)
                 logger.info(f"FHE encryption successful: amount={request.amount}")
             except Exception as e:
@@ -174,10 +240,15 @@ async def decrypt_amount(request: DecryptRequest):
             logger.warning(f"Invalid ciphertext format: {e}")
             raise HTTPException(status_code=400, detail=format_error_message(e))
         
-        if FHE_AVAILABLE and fhe_circuit is not None:
+        if fhe_enabled() and decrypt_coalescer is not None:
             # Real FHE decryption
             try:
-                amount = fhe_circuit.decrypt(ciphertext_bytes)
+                if request.function == "amount":
+                    amount = await decrypt_coalescer.submit(ciphertext_bytes)
+                else:
+                    amount = await asyncio.to_thread(
+                        fhe_circuit.decrypt, ciphertext_bytes, function=request.function
+                    )
                 logger.info(f"FHE decryption successful: amount={amount}")
             except Exception as e:
                 logger.error(f"FHE decryption failed: {e}")
@@ -198,8 +269,9 @@ async def decrypt_amount(request: DecryptRequest):
                 logger.error(f"Placeholder decryption failed: {e}")
                 raise HTTPException(status_code=400, detail=format_error_message(e))
         
-        # Validate decrypted amount
-        validate_amount(amount)
+        # Validate decrypted amount (totals can be above the maximum of a single amount)
+        if request.function == "amount":
+            validate_amount(amount)
         
         return DecryptResponse(amount=amount)
     except HTTPException:
@@ -212,6 +284,67 @@ async def decrypt_amount(request: DecryptRequest):
         raise HTTPException(status_code=500, detail=f"Decryption failed: {format_error_message(e)}")
 
 
+# Aggregation Endpoint
+@app.post("/api/fhe/aggregate", response_model=AggregateResponse)
+async def aggregate_amounts(request: AggregateRequest):
+    """
+    Sum many encrypted payment amounts without decrypting them
+    
+    Args:
+        request: AggregateRequest containing the ciphertexts to sum
+        
+    Returns:
+        AggregateResponse with the encrypted total
+    """
+    try:
+        logger.info(f"Aggregation request received: count={len(request.ciphertexts)}")
+        
+        # Decode ciphertexts
+        try:
+            ciphertexts = [decode_ciphertext(ciphertext) for ciphertext in request.ciphertexts]
+        except ValueError as e:
+            logger.warning(f"Invalid ciphertext format: {e}")
+            raise HTTPException(status_code=400, detail=format_error_message(e))
+        
+        if fhe_enabled():
+            # Real FHE aggregation (chunks are summed in parallel off the event loop)
+            try:
+                total_bytes = await asyncio.to_thread(fhe_circuit.aggregate, ciphertexts)
+                logger.info(f"FHE aggregation successful: count={len(ciphertexts)}")
+            except Exception as e:
+                logger.error(f"FHE aggregation failed: {e}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"FHE aggregation failed: {format_error_message(e)}"
+                )
+        else:
+            # Placeholder implementation (for testing without Concrete Python)
+            try:
+                amounts = []
+                for ciphertext_bytes in ciphertexts:
+                    decoded = ciphertext_bytes.decode('utf-8')
+                    if not decoded.startswith("encrypted_"):
+                        raise ValueError("Invalid ciphertext format")
+                    amounts.append(float(decoded.replace("encrypted_", "")))
+                total_bytes = f"encrypted_{round(sum(amounts), 2)}".encode()
+                logger.warning("Using placeholder aggregation (Concrete Python not available)")
+            except Exception as e:
+                logger.error(f"Placeholder aggregation failed: {e}")
+                raise HTTPException(status_code=400, detail=format_error_message(e))
+        
+        return AggregateResponse(ciphertext=encode_ciphertext(total_bytes), count=len(ciphertexts))
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Validation error: {e}")
+        raise HTTPException(status_code=400, detail=format_error_message(e))
+    except Exception as e:
+        logger.error(f"Aggregation error: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Aggregation failed: {format_error_message(e)}"
+        )
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
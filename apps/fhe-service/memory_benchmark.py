@@ -0,0 +1,134 @@
+"""
+Memory benchmark for FHE Service
+Starts the service with several workers and reports the memory used by all its processes
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import requests
+
+HOST = "127.0.0.1"
+PORT = 8101
+
+
+def child_processes(pid: int) -> List[int]:
+    """
+    Get the child processes of a process (Linux only)
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Process IDs of its children
+    """
+    children = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children", encoding="utf-8") as file:
+            children.extend(int(child) for child in file.read().split())
+    return children
+
+
+def memory_usage(pid: int) -> Dict[str, int]:
+    """
+    Get the resident and proportional set sizes of a process (Linux only)
+
+    Pages shared between processes are fully counted in the RSS of each of them,
+    and divided between them in their PSS, so the PSS of processes adds up to their memory usage
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        RSS and PSS of the process (bytes)
+    """
+    usage = {"rss": 0, "pss": 0}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as file:
+        for line in file:
+            key, _, value = line.partition(":")
+            if key.lower() in usage:
+                usage[key.lower()] = int(value.split()[0]) * 1024
+    return usage
+
+
+def wait_ready(url: str, workers: int, timeout: float):
+    """
+    Wait until every worker of the service can run homomorphic operations
+
+    Args:
+        url: URL of the service
+        workers: Number of workers
+        timeout: Maximum time to wait (seconds)
+    """
+    deadline = time.monotonic() + timeout
+    ready = 0
+    while ready < 4 * workers:
+        if time.monotonic() > deadline:
+            raise TimeoutError("Service did not become ready in time")
+        try:
+            fhe_status = requests.get(f"{url}/health", timeout=1).json().get("fhe", {})
+        except requests.RequestException:
+            fhe_status = {}
+        if fhe_status.get("server_ready"):
+            # requests are distributed between workers, so several in a row must be ready
+            ready += 1
+        else:
+            ready = 0
+            time.sleep(0.5)
+
+
+def measure(workers: int, share_keys: bool, timeout: float) -> Dict[str, int]:
+    """
+    Start the service and measure the memory used by all its processes
+
+    Args:
+        workers: Number of workers
+        share_keys: Whether keys are loaded once before forking the workers
+        timeout: Maximum time to wait for the service to be ready (seconds)
+
+    Returns:
+        Total RSS and PSS of the service (bytes)
+    """
+    command = [sys.executable, "serve.py", "--host", HOST, "--port", str(PORT)]
+    command += ["--workers", str(workers)]
+    if not share_keys:
+        command.append("--no-share")
+
+    url = f"http://{HOST}:{PORT}"
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(url, workers, timeout)
+
+        total = {"rss": 0, "pss": 0}
+        for pid in [process.pid] + child_processes(process.pid):
+            for key, value in memory_usage(pid).items():
+                total[key] += value
+        return total
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    """Run the memory benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--timeout", type=float, default=600, help="Startup timeout (seconds)")
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'keys':>10} {'rss (MB)':>10} {'pss (MB)':>10}")
+    for workers in args.workers:
+        for share_keys in (False, True):
+            usage = measure(workers, share_keys, args.timeout)
+            print(
+                f"{workers:>7} {'shared' if share_keys else 'per-worker':>10} "
+                f"{usage['rss'] / 2**20:>10.1f} {usage['pss'] / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Pre-forking server for FHE Service
+Loads the FHE circuit once, then forks workers which share its keys
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+from typing import List
+
+# Workers initialize the circuit themselves only if it's not loaded before forking
+os.environ.setdefault("FHE_DEFERRED_INITIALIZATION", "1")
+
+import uvicorn
+from loguru import logger
+
+import main as service
+
+
+def create_socket(host: str, port: int) -> socket.socket:
+    """
+    Create the listening socket shared by all workers
+
+    Args:
+        host: Host to bind
+        port: Port to bind
+
+    Returns:
+        Listening socket
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock: socket.socket, share_keys: bool):
+    """
+    Serve requests in a forked worker
+
+    Args:
+        sock: Listening socket shared by all workers
+        share_keys: Whether the circuit was loaded before forking
+    """
+    if not share_keys and service.fhe_circuit is not None:
+        service.fhe_circuit.initialize_in_background(force_recompile=False)
+
+    config = uvicorn.Config(service.app, log_level="info")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main():
+    """Run the service with several worker processes"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("FHE_SERVICE_PORT", "8001")), help="Port to bind"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Number of worker processes")
+    parser.add_argument(
+        "--no-share",
+        dest="share_keys",
+        action="store_false",
+        help="Load the circuit and keys in each worker instead of once before forking",
+    )
+    args = parser.parse_args()
+
+    # Keys are loaded before forking, so their memory is shared by all workers copy-on-write
+    # (homomorphic operations only read the evaluation keys, so their pages are never copied)
+    if args.share_keys and service.fhe_circuit is not None:
+        service.fhe_circuit.initialize(force_recompile=False)
+
+    sock = create_socket(args.host, args.port)
+    logger.info(
+        f"Serving on {args.host}:{args.port} with {args.workers} workers "
+        f"({'shared' if args.share_keys else 'per-worker'} keys)"
+    )
+
+    workers: List[int] = []
+    for _ in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(sock, args.share_keys)
+            finally:
+                os._exit(0)
+        workers.append(pid)
+
+    def stop(signum, frame):
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for pid in workers:
+        os.waitpid(pid, 0)
+    sock.close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -150,6 +150,51 @@ class TestFHEAPI:
             assert abs(decrypted_amount - amount) < 0.01, \
                 f"Roundtrip failed: {amount} != {decrypted_amount}"
 
+    
+    def test_aggregate_roundtrip(self):
+        """Test encrypt-aggregate-decrypt roundtrip"""
+        test_amounts = [1.0, 10.0, 100.50, 999.99, 0.01] * 5
+        
+        # Amounts to aggregate are encrypted for the total function
+        ciphertexts = []
+        for amount in test_amounts:
+            encrypt_response = requests.post(
+                f"{BASE_URL}/api/fhe/encrypt",
+                json={"amount": amount, "function": "total"},
+                headers={"Content-Type": "application/json"}
+            )
+            assert encrypt_response.status_code == 200
+            ciphertexts.append(encrypt_response.json()["ciphertext"])
+        
+        # Aggregate
+        aggregate_response = requests.post(
+            f"{BASE_URL}/api/fhe/aggregate",
+            json={"ciphertexts": ciphertexts},
+            headers={"Content-Type": "application/json"}
+        )
+        assert aggregate_response.status_code == 200
+        assert aggregate_response.json()["count"] == len(test_amounts)
+        
+        # Decrypt total
+        decrypt_response = requests.post(
+            f"{BASE_URL}/api/fhe/decrypt",
+            json={"ciphertext": aggregate_response.json()["ciphertext"], "function": "total"},
+            headers={"Content-Type": "application/json"}
+        )
+        assert decrypt_response.status_code == 200
+        total = decrypt_response.json()["amount"]
+        assert abs(total - sum(test_amounts)) < 0.01, \
+            f"Aggregation failed: {sum(test_amounts)} != {total}"
+    
+    def test_aggregate_empty(self):
+        """Test aggregation of no ciphertexts"""
+        response = requests.post(
+            f"{BASE_URL}/api/fhe/aggregate",
+            json={"ciphertexts": []},
+            headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 422  # Validation error
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Unit tests for request coalescer
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batching import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    """Test cases for RequestCoalescer"""
+
+    def test_requests_are_batched(self):
+        """Test concurrent requests are processed in batches"""
+        batches = []
+
+        def process_batch(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        async def run():
+            coalescer = RequestCoalescer(process_batch, max_batch_size=4, max_wait_ms=50, pool_size=2)
+            try:
+                return await asyncio.gather(*(coalescer.submit(i) for i in range(10)))
+            finally:
+                await coalescer.close()
+
+        results = asyncio.run(run())
+
+        assert results == [i * 2 for i in range(10)]
+        assert sorted(item for batch in batches for item in batch) == list(range(10))
+        assert all(len(batch) <= 4 for batch in batches)
+        assert len(batches) < 10
+
+    def test_invalid_item_only_fails_its_request(self):
+        """Test a failing item doesn't fail the other requests of its batch"""
+
+        def process_batch(items):
+            if any(item < 0 for item in items):
+                raise ValueError("Negative item")
+            return items
+
+        async def run():
+            coalescer = RequestCoalescer(process_batch, max_batch_size=8, max_wait_ms=50)
+            try:
+                return await asyncio.gather(
+                    *(coalescer.submit(i) for i in [1, -1, 2]),
+                    return_exceptions=True,
+                )
+            finally:
+                await coalescer.close()
+
+        first, second, third = asyncio.run(run())
+
+        assert first == 1
+        assert isinstance(second, ValueError)
+        assert third == 2
+
+    def test_concurrent_submissions_share_one_worker(self):
+        """Test concurrent submissions don't process batches concurrently by default"""
+        busy = threading.Lock()
+        overlaps = []
+        batches = []
+
+        def process_batch(items):
+            # batches share a client which is not thread-safe, so they must not overlap
+            if not busy.acquire(blocking=False):
+                overlaps.append(list(items))
+                return [item * 2 for item in items]
+            try:
+                batches.append(list(items))
+                time.sleep(0.01)
+                return [item * 2 for item in items]
+            finally:
+                busy.release()
+
+        async def submit_many(coalescer, start):
+            return await asyncio.gather(*(coalescer.submit(i) for i in range(start, start + 20)))
+
+        async def run():
+            coalescer = RequestCoalescer(process_batch, max_batch_size=4, max_wait_ms=1)
+            try:
+                return await asyncio.gather(*(submit_many(coalescer, 20 * i) for i in range(5)))
+            finally:
+                await coalescer.close()
+
+        results = asyncio.run(run())
+
+        assert results == [[item * 2 for item in range(20 * i, 20 * i + 20)] for i in range(5)]
+        assert overlaps == []
+        assert sorted(item for batch in batches for item in batch) == list(range(100))
+        assert len(batches) > 1
+
+    def test_invalid_configuration(self):
+        """Test invalid coalescer configuration"""
+        with pytest.raises(ValueError):
+            RequestCoalescer(lambda items: items, max_batch_size=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
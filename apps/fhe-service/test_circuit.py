@@ -9,7 +9,17 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from circuit import FHECircuit, initialize_circuit
+from circuit import (
+    AGGREGATE_CHUNK_SIZE,
+    CLIENT_FILE,
+    EVALUATION_KEYS_FILE,
+    MAX_AGGREGATE_AMOUNTS,
+    MAX_RATE,
+    SECRET_KEYS_FILE,
+    SERVER_FILE,
+    FHECircuit,
+    initialize_circuit,
+)
 import tempfile
 import shutil
 
@@ -37,20 +47,24 @@ class TestFHECircuit:
         """Test circuit initialization"""
         circuit = FHECircuit(keys_dir=temp_keys_dir)
         assert circuit.keys_dir == Path(temp_keys_dir)
-        assert circuit.circuit is None
+        assert circuit.module is None
+        assert circuit.client is None
+        assert not circuit.client_ready.is_set()
     
     def test_circuit_compilation(self, temp_keys_dir):
         """Test circuit compilation"""
         circuit = FHECircuit(keys_dir=temp_keys_dir)
         circuit.compile_circuit(inputset=list(range(0, 100)))
-        assert circuit.circuit is not None
-        assert circuit.add_circuit is not None
-        assert circuit.multiply_circuit is not None
+        assert circuit.module is not None
+        assert circuit.client is circuit.module.client
+        assert circuit.server is circuit.module.server
     
     def test_key_generation(self, circuit):
         """Test key generation"""
         # Keys are generated in fixture
-        assert circuit.circuit is not None
+        assert circuit.client.keys.are_generated
+        assert circuit.client_ready.is_set()
+        assert circuit.server_ready.is_set()
     
     def test_encrypt_decrypt(self, circuit):
         """Test encryption and decryption"""
@@ -72,19 +86,36 @@ class TestFHECircuit:
     def test_save_load_keys(self, circuit, temp_keys_dir):
         """Test saving and loading keys"""
         # Save keys
-        circuit.save_keys("test_keys.pkl")
-        keys_file = Path(temp_keys_dir) / "test_keys.pkl"
-        assert keys_file.exists()
+        circuit.save_keys()
+        for name in (SERVER_FILE, CLIENT_FILE, SECRET_KEYS_FILE, EVALUATION_KEYS_FILE):
+            assert (Path(temp_keys_dir) / name).exists()
         
-        # Create new circuit and load keys
+        # Create new circuit and load only what encryption/decryption needs
         new_circuit = FHECircuit(keys_dir=temp_keys_dir)
-        new_circuit.load_keys("test_keys.pkl")
+        assert new_circuit.has_saved_keys()
+        new_circuit.load_keys()
+        assert new_circuit.client_ready.is_set()
+        assert not new_circuit.server_ready.is_set()
+        assert new_circuit.evaluation_keys is None
         
         # Test encryption/decryption with loaded keys
         amount = 100.0
         ciphertext = new_circuit.encrypt(amount)
         decrypted = new_circuit.decrypt(ciphertext)
         assert abs(decrypted - amount) < 0.01
+        
+        # Ciphertexts of the original circuit can be decrypted with the loaded keys
+        assert abs(new_circuit.decrypt(circuit.encrypt(amount)) - amount) < 0.01
+        
+        # Load the server and test homomorphic operations with loaded keys
+        new_circuit.load_server()
+        assert new_circuit.server_ready.is_set()
+        result = new_circuit.add_homomorphic(ciphertext, new_circuit.encrypt(20.0))
+        assert abs(new_circuit.decrypt(result, function="add") - 120.0) < 0.01
+        
+        # Ciphertexts encrypted by the original circuit can be used with the loaded keys
+        total = new_circuit.aggregate(circuit.encrypt_batch([1.5] * 9, function="total"))
+        assert abs(new_circuit.decrypt(total, function="total") - 13.5) < 0.01
     
     def test_homomorphic_addition(self, circuit):
         """Test homomorphic addition"""
@@ -99,16 +130,78 @@ class TestFHECircuit:
         result_ciphertext = circuit.add_homomorphic(ciphertext1, ciphertext2)
         
         # Decrypt result
-        result = circuit.decrypt(result_ciphertext)
+        result = circuit.decrypt(result_ciphertext, function="add")
         
         # Check result
         expected = amount1 + amount2
         assert abs(result - expected) < 0.01, f"Addition mismatch: {expected} != {result}"
     
+    @pytest.mark.parametrize("count", [1, AGGREGATE_CHUNK_SIZE, 3 * AGGREGATE_CHUNK_SIZE + 5])
+    def test_aggregate(self, circuit, count):
+        """Test homomorphic aggregation of several chunks and rounds"""
+        amounts = [round(0.5 + (i % 9), 2) for i in range(count)]
+        
+        total_ciphertext = circuit.aggregate(circuit.encrypt_batch(amounts, function="total"))
+        
+        total = circuit.decrypt(total_ciphertext, function="total")
+        assert abs(total - sum(amounts)) < 0.01, f"Aggregation mismatch: {sum(amounts)} != {total}"
+    
+    def test_default_configuration(self, temp_keys_dir):
+        """Test multiplication, addition and aggregation with the default ranges"""
+        circuit = FHECircuit(keys_dir=temp_keys_dir)
+        circuit.compile_circuit()
+        circuit.generate_keys()
+        
+        # Amounts keep their own precision, independent of the precision of totals
+        amount_bit_width = circuit.module.amount.graph.maximum_integer_bit_width()
+        total_bit_width = circuit.module.total.graph.maximum_integer_bit_width()
+        assert amount_bit_width < total_bit_width
+        
+        product = circuit.multiply_homomorphic(circuit.encrypt(9_999.99), MAX_RATE)
+        assert abs(circuit.decrypt(product, function="multiply") - 9_999.99 * MAX_RATE) < 0.01
+        
+        product = circuit.multiply_homomorphic(circuit.encrypt(100.50), 1.2345)
+        assert abs(circuit.decrypt(product, function="multiply") - 100.50 * 1.2345) < 0.01
+        
+        with pytest.raises(ValueError, match="Rate must be between"):
+            circuit.multiply_homomorphic(circuit.encrypt(1.0), MAX_RATE + 1)
+        
+        total = circuit.add_homomorphic(circuit.encrypt(9_999.99), circuit.encrypt(0.01))
+        assert abs(circuit.decrypt(total, function="add") - 10_000.00) < 0.01
+        
+        amounts = [9_999.99] * MAX_AGGREGATE_AMOUNTS
+        total_ciphertext = circuit.aggregate(circuit.encrypt_batch(amounts, function="total"))
+        total = circuit.decrypt(total_ciphertext, function="total")
+        assert abs(total - sum(amounts)) < 0.01, f"Aggregation mismatch: {sum(amounts)} != {total}"
+    
+    def test_encrypt_for_unknown_function(self, circuit):
+        """Test encrypting amounts for a function which doesn't take amounts"""
+        with pytest.raises(ValueError, match="cannot be encrypted for add"):
+            circuit.encrypt(1.0, function="add")
+    
+    def test_aggregate_invalid_count(self, circuit):
+        """Test aggregation of no amounts or too many amounts"""
+        with pytest.raises(ValueError, match="At least one"):
+            circuit.aggregate([])
+        
+        ciphertext = circuit.encrypt(1.0)
+        with pytest.raises(ValueError, match="At most"):
+            circuit.aggregate([ciphertext] * (MAX_AGGREGATE_AMOUNTS + 1))
+    
+    def test_shared_keys(self, circuit):
+        """Test all functions of the module use the same keys"""
+        assert circuit.module.keys is not None
+        
+        # Keys are generated once, so no function generates its own keys on first use
+        keys = circuit.module.keys
+        circuit.add_homomorphic(circuit.encrypt(1.0), circuit.encrypt(2.0))
+        assert circuit.module.keys is keys
+    
     def test_initialize_circuit_new(self, temp_keys_dir):
         """Test initialize_circuit with new keys"""
         circuit = initialize_circuit(keys_dir=temp_keys_dir, force_recompile=True)
-        assert circuit.circuit is not None
+        assert circuit.client_ready.is_set()
+        assert circuit.has_saved_keys()
         
         # Test encryption/decryption
         amount = 100.0
@@ -116,6 +209,34 @@ class TestFHECircuit:
         decrypted = circuit.decrypt(ciphertext)
         assert abs(decrypted - amount) < 0.01
     
+    def test_initialize_in_background(self, temp_keys_dir):
+        """Test initializing the circuit in the background"""
+        initialize_circuit(keys_dir=temp_keys_dir, force_recompile=True)
+        
+        circuit = FHECircuit(keys_dir=temp_keys_dir)
+        thread = circuit.initialize_in_background()
+        
+        # Encryption waits for the keys to be loaded
+        amount = 100.0
+        assert abs(circuit.decrypt(circuit.encrypt(amount)) - amount) < 0.01
+        
+        thread.join()
+        assert circuit.error is None
+        assert circuit.server_ready.is_set()
+    
+    def test_initialize_in_background_failure(self, temp_keys_dir):
+        """Test waiting for a circuit which failed to initialize"""
+        # Keys directory has artifacts which cannot be loaded
+        for name in (SERVER_FILE, CLIENT_FILE, SECRET_KEYS_FILE, EVALUATION_KEYS_FILE):
+            (Path(temp_keys_dir) / name).write_bytes(b"invalid")
+        
+        circuit = FHECircuit(keys_dir=temp_keys_dir)
+        circuit.initialize_in_background().join()
+        
+        assert circuit.error is not None
+        with pytest.raises(RuntimeError, match="failed to initialize"):
+            circuit.encrypt(100.0)
+    
     def test_initialize_circuit_load_existing(self, temp_keys_dir):
         """Test initialize_circuit loading existing keys"""
         # Create circuit and save keys
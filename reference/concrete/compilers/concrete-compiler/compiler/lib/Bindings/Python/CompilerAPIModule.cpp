@@ -2137,8 +2137,10 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
             }
             auto info = circuit.getCircuitInfo().asReader().getInputs()[pos];
             auto typeTransformer = getPythonTypeTransformer((GateInfo)info);
-            GET_OR_THROW_RESULT(
-                auto ok, circuit.prepareInput(typeTransformer(arg), pos));
+            auto transformed = typeTransformer(arg);
+            pybind11::gil_scoped_release release;
+            GET_OR_THROW_RESULT(auto ok,
+                                circuit.prepareInput(transformed, pos));
             return ok;
           },
           "Prepare a `pos` positional arguments `arg` to be sent to server. ",
@@ -2146,6 +2148,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def(
           "process_output",
           [](ClientCircuit &circuit, TransportValue result, size_t pos) {
+            pybind11::gil_scoped_release release;
             GET_OR_THROW_RESULT(auto ok, circuit.processOutput(result, pos));
             return ok;
           },
@@ -0,0 +1,95 @@
+"""
+Benchmark the throughput of `Client.encrypt` and `Client.decrypt` on scalars.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+targets = [
+    {
+        "id": f"client-scalar-throughput :: uint{bit_width}",
+        "name": f"{bit_width}-bit scalar encryption/decryption throughput",
+        "parameters": {
+            "bit_width": bit_width,
+        },
+    }
+    for bit_width in [4, 8, 16]
+]
+
+
+def throughput(client: fhe.Client, operation, fresh: bool, repetitions: int) -> float:
+    """
+    Measure the number of operations per second.
+
+    Args:
+        client (fhe.Client):
+            client to use
+
+        operation:
+            operation to measure, called with a client
+
+        fresh (bool):
+            whether to replace the keys of the client before each operation,
+            to measure the cost of creating the client program on every call
+
+        repetitions (int):
+            number of operations to perform
+    """
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        if fresh:
+            assert client.keys is not None
+            client.keys = client.keys
+        operation(client)
+    end = time.perf_counter()
+
+    return repetitions / (end - start)
+
+
+@progress.track(targets)
+def main(bit_width):
+    """
+    Benchmark a target.
+
+    Args:
+        bit_width:
+            bit width of the encrypted scalar
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x
+
+    inputset = [0, 2**bit_width - 1]
+    circuit = f.compile(inputset, fhe.Configuration())
+
+    client = circuit.client
+    client.keygen()
+
+    sample = 2**bit_width - 1
+    encrypted = client.encrypt(sample)
+
+    print("Warming up...")
+    throughput(client, lambda client: client.decrypt(client.encrypt(sample)), False, 10)
+
+    print("Running...")
+    for name, operation in [
+        ("encryption", lambda client: client.encrypt(sample)),
+        ("decryption", lambda client: client.decrypt(encrypted)),
+    ]:
+        progress.measure(
+            id=f"{name}-throughput-before-per-second",
+            label=f"{name.capitalize()} Throughput Without Reusing Client Program (1/s)",
+            value=throughput(client, operation, fresh=True, repetitions=1000),
+        )
+        progress.measure(
+            id=f"{name}-throughput-after-per-second",
+            label=f"{name.capitalize()} Throughput Reusing Client Program (1/s)",
+            value=throughput(client, operation, fresh=False, repetitions=1000),
+        )
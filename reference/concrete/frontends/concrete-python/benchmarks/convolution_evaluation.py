@@ -0,0 +1,151 @@
+"""
+Benchmark the evaluation of convolutions and maxpools during bound measurement.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+import torch
+
+from concrete import fhe
+
+layers = {
+    "conv2d": [
+        # same as `tests/execution/test_convolution.py::test_conv2d`
+        {"input_shape": (4, 3, 4, 4), "weight_shape": (2, 3, 2, 2), "strides": (2, 2), "group": 1},
+        {"input_shape": (1, 6, 4, 4), "weight_shape": (6, 1, 2, 2), "strides": (2, 2), "group": 6},
+        # typical hidden layer of a small cnn
+        {
+            "input_shape": (1, 8, 14, 14),
+            "weight_shape": (8, 8, 3, 3),
+            "strides": (1, 1),
+            "group": 1,
+        },
+    ],
+    "maxpool2d": [
+        # same as `tests/execution/test_maxpool.py::test_maxpool2d`
+        {"input_shape": (1, 1, 6, 7), "kernel_shape": (3, 2), "strides": (1, 1)},
+        {"input_shape": (1, 1, 4, 4), "kernel_shape": (2, 2), "strides": (2, 2)},
+        # typical pooling layer of a small cnn
+        {"input_shape": (1, 8, 14, 14), "kernel_shape": (2, 2), "strides": (2, 2)},
+    ],
+}
+
+targets = [
+    {
+        "id": (
+            f"convolution-evaluation :: {operation}{list(layer['input_shape'])} :: "
+            f"{inputset_size} samples :: {implementation}"
+        ),
+        "name": (
+            f"Evaluation of {operation} on "
+            f"{'x'.join(str(size) for size in layer['input_shape'])} tensor "
+            f"over {inputset_size} samples ({implementation})"
+        ),
+        "parameters": {
+            "operation": operation,
+            "layer": layer,
+            "inputset_size": inputset_size,
+            "implementation": implementation,
+        },
+    }
+    for operation, operation_layers in layers.items()
+    for layer in operation_layers
+    for inputset_size in [100, 1_000]
+    for implementation in ["numpy", "torch"]
+]
+
+
+def torch_evaluation(operation, layer, weight, sample):
+    """
+    Evaluate a layer on a sample the way it used to be evaluated, using torch.
+
+    Args:
+        operation:
+            operation of the layer
+
+        layer:
+            parameters of the layer
+
+        weight:
+            weight of the layer, if it's a convolution
+
+        sample:
+            sample to evaluate the layer on
+    """
+
+    if operation == "conv2d":
+        return torch.conv2d(
+            torch.tensor(sample, dtype=torch.long),
+            torch.tensor(weight, dtype=torch.long),
+            torch.zeros(weight.shape[0], dtype=torch.long),
+            stride=layer["strides"],
+            groups=layer["group"],
+        ).numpy()
+
+    return (
+        torch.max_pool2d(
+            torch.from_numpy(sample.astype(np.float64)),
+            layer["kernel_shape"],
+            layer["strides"],
+        )
+        .numpy()
+        .astype(sample.dtype)
+    )
+
+
+@progress.track(targets)
+def main(operation, layer, inputset_size, implementation):
+    """
+    Benchmark a target.
+
+    Args:
+        operation:
+            operation to evaluate
+
+        layer:
+            parameters of the layer
+
+        inputset_size:
+            number of samples in the inputset
+
+        implementation:
+            implementation to evaluate the layer with
+    """
+
+    weight = None
+    if operation == "conv2d":
+        weight = np.random.randint(-4, 4, size=layer["weight_shape"])
+
+        def function(x):
+            return fhe.conv(x, weight, strides=layer["strides"], group=layer["group"])
+
+    else:
+
+        def function(x):
+            return fhe.maxpool(x, kernel_shape=layer["kernel_shape"], strides=layer["strides"])
+
+    inputset = [np.random.randint(0, 2**4, size=layer["input_shape"]) for _ in range(inputset_size)]
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    graph = compiler.trace(inputset[:1], fhe.Configuration())
+
+    print("Evaluating...")
+    if implementation == "numpy":
+        start = time.perf_counter()
+        graph.measure_bounds(inputset)
+        end = time.perf_counter()
+    else:
+        start = time.perf_counter()
+        results = [torch_evaluation(operation, layer, weight, sample) for sample in inputset]
+        _ = min(result.min() for result in results), max(result.max() for result in results)
+        end = time.perf_counter()
+
+    progress.measure(
+        id="evaluation-time-ms",
+        label="Evaluation Time (ms)",
+        value=(end - start) * 1000,
+    )
@@ -0,0 +1,110 @@
+"""
+Benchmark the compilation of modules with several functions.
+"""
+
+# pylint: disable=import-error,no-self-argument
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+@fhe.module()
+class Module:
+    """
+    Module with several functions of the same size, each with its own inputset.
+    """
+
+    @fhe.function({"x": "encrypted"})
+    def insert(x):
+        return (x // 4) + np.arange(100).reshape((10, 10)) % 8
+
+    @fhe.function({"x": "encrypted", "y": "encrypted"})
+    def replace(x, y):
+        return np.maximum(x, y) - np.minimum(x, y)
+
+    @fhe.function({"x": "encrypted"})
+    def query(x):
+        return np.sum(x // 8, axis=0, keepdims=True) + x
+
+
+targets = [
+    {
+        "id": f"module-compilation :: {inputset_size} samples :: {mode}",
+        "name": (
+            f"Compilation of a 3-function module with {inputset_size} samples per function "
+            f"({mode} function evaluation)"
+        ),
+        "parameters": {
+            "inputset_size": inputset_size,
+            "parallel": mode == "parallel",
+        },
+    }
+    for inputset_size in [1_000, 10_000]
+    for mode in ["sequential", "parallel"]
+]
+
+
+@progress.track(targets)
+def main(inputset_size, parallel):
+    """
+    Benchmark a target.
+
+    Args:
+        inputset_size:
+            number of samples in the inputset of each function
+
+        parallel:
+            whether to evaluate the functions in worker processes
+    """
+
+    def sample():
+        return np.random.randint(0, 2**6, size=(10, 10))
+
+    inputsets = {
+        "insert": [sample() for _ in range(inputset_size)],
+        "replace": [(sample(), sample()) for _ in range(inputset_size)],
+        "query": [sample() for _ in range(inputset_size)],
+    }
+
+    configuration = fhe.Configuration(
+        parallel_function_evaluation=parallel,
+        fhe_execution=False,
+        fhe_simulation=False,
+    )
+
+    # reset the functions, so bounds are measured on the inputsets of this target only
+    for function in Module.functions.values():
+        function.graph = None
+        function.inputset = []
+        function._bounds = None  # pylint: disable=protected-access
+
+    print("Compiling...")
+    start = time.perf_counter()
+    module = Module.compile(inputsets, configuration)
+    end = time.perf_counter()
+
+    profile = module.statistics["compilation_profile"]
+    if parallel:
+        evaluation_time = profile["phases"]["parallel_function_evaluation"]["duration"]
+    else:
+        evaluation_time = sum(
+            phase["duration"]
+            for phases in profile["functions"].values()
+            for name, phase in phases.items()
+            if name in {"tracing", "fusing", "bound_measurement"}
+        )
+
+    progress.measure(
+        id="function-evaluation-time-ms",
+        label="Function Evaluation Time (ms)",
+        value=evaluation_time * 1000,
+    )
+    progress.measure(
+        id="compilation-time-ms",
+        label="Compilation Time (ms)",
+        value=(end - start) * 1000,
+    )
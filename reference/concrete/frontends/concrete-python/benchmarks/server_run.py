@@ -0,0 +1,97 @@
+"""
+Benchmark the overhead of `Server.run` on a trivial circuit.
+"""
+
+# pylint: disable=import-error,protected-access
+
+import time
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+targets = [
+    {
+        "id": f"server-run-overhead :: {mode}",
+        "name": f"Server run overhead ({mode})",
+        "parameters": {
+            "simulate": mode == "simulation",
+        },
+    }
+    for mode in ["execution", "simulation"]
+]
+
+
+def run_time_us(server: fhe.Server, args, evaluation_keys, fresh: bool, repetitions: int) -> float:
+    """
+    Measure the average time of a `run` call in microseconds.
+
+    Args:
+        server (fhe.Server):
+            server to run
+
+        args:
+            arguments of the run
+
+        evaluation_keys:
+            evaluation keys of the run
+
+        fresh (bool):
+            whether to run on a fresh server each time,
+            to measure the cost of loading the circuit on every call
+
+        repetitions (int):
+            number of runs to average
+    """
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        if fresh:
+            server = fhe.Server(server._library, server.is_simulated, server._composition_rules)
+        server.run(*args, evaluation_keys=evaluation_keys)
+    end = time.perf_counter()
+
+    return ((end - start) / repetitions) * 1_000_000
+
+
+@progress.track(targets)
+def main(simulate):
+    """
+    Benchmark a target.
+
+    Args:
+        simulate:
+            whether to run in simulation or not
+    """
+
+    @fhe.compiler({"x": "encrypted", "y": "clear"})
+    def f(x, y):
+        return x + y
+
+    configuration = fhe.Configuration(fhe_simulation=simulate, fhe_execution=not simulate)
+    circuit = f.compile(fhe.inputset(fhe.uint4, fhe.uint4), configuration)
+
+    if simulate:
+        server = circuit.simulator
+        args = (3, 4)
+        evaluation_keys = None
+    else:
+        circuit.keygen()
+        server = circuit.server
+        args = circuit.encrypt(3, 4)
+        evaluation_keys = circuit.keys.evaluation
+
+    print("Warming up...")
+    run_time_us(server, args, evaluation_keys, fresh=False, repetitions=10)
+
+    print("Running...")
+    progress.measure(
+        id="run-overhead-before-us",
+        label="Run Overhead Without Reusing Circuits (us)",
+        value=run_time_us(server, args, evaluation_keys, fresh=True, repetitions=1000),
+    )
+    progress.measure(
+        id="run-overhead-after-us",
+        label="Run Overhead Reusing Circuits (us)",
+        value=run_time_us(server, args, evaluation_keys, fresh=False, repetitions=1000),
+    )
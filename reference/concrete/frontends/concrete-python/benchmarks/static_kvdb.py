@@ -3,6 +3,7 @@ Benchmarks of the static key value database example.
 """
 
 import random
+import tracemalloc
 from pathlib import Path
 
 import numpy as np
@@ -176,6 +177,46 @@ def benchmark_query(db: StaticKeyValueDatabase, client: fhe.Client, server: fhe.
             )
 
 
+def benchmark_graph_evaluation(db: StaticKeyValueDatabase, operation: str):
+    """
+    Benchmark evaluating the graph of an operation of the database in the clear.
+
+    Peak memory allocated during evaluation is reported,
+    which is dominated by the copies of the intermediate results of the graph.
+    """
+
+    graph = getattr(db.module, operation).graph
+
+    state = np.array(
+        [
+            [1] + db.encode_key(i).tolist() + db.encode_value(i).tolist()
+            for i in range(db.number_of_entries)
+        ]
+    )
+    key = db.encode_key(random.randint(0, 2**db.key_size - 1))
+    value = db.encode_value(random.randint(0, 2**db.value_size - 1))
+
+    args = (state, key) if operation == "query" else (state, key, value)
+
+    print("Warming up...")
+    graph.evaluate(*args)
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        tracemalloc.start()
+        with progress.measure(id="clear-evaluation-time-ms", label="Clear Evaluation Time (ms)"):
+            graph.evaluate(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        progress.measure(
+            id="clear-evaluation-peak-memory-kb",
+            label="Clear Evaluation Peak Memory (KB)",
+            value=peak / 1024,
+        )
+
+
 def targets():
     """
     Generates targets to benchmark.
@@ -327,6 +368,9 @@ def main(operation, number_of_entries, key_size, value_size, chunk_size):
     print("Generating keys...")
     client.keygen()
 
+    if hasattr(db, "module"):
+        benchmark_graph_evaluation(db, operation)
+
     if operation == "insert":
         benchmark_insert(db, client, server)
     elif operation == "replace":
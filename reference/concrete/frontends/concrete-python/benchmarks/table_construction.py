@@ -0,0 +1,112 @@
+"""
+Benchmark the construction of lookup tables during MLIR conversion.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+from concrete.fhe.mlir import utils
+
+targets = [
+    {
+        "id": f"table-construction :: tlu[eint{bit_width}]{'' if shape == () else list(shape)}",
+        "name": (
+            f"{bit_width}-bit table lookup construction"
+            f"{'' if shape == () else ' on ' + 'x'.join(str(size) for size in shape) + ' tensor'}"
+        ),
+        "parameters": {
+            "bit_width": bit_width,
+            "shape": shape,
+        },
+    }
+    for bit_width in range(2, 8 + 1)
+    for shape in [(), (10, 10)]
+]
+
+
+def construction_time_ms(circuit: fhe.Circuit, one_by_one: bool, repetitions: int) -> float:
+    """
+    Measure the average time to construct the tables of a circuit in milliseconds.
+
+    Args:
+        circuit (fhe.Circuit):
+            compiled circuit, whose graph is processed for MLIR conversion
+
+        one_by_one (bool):
+            whether to evaluate candidates one at a time,
+            to measure the cost of table construction without stacked evaluation
+
+        repetitions (int):
+            number of constructions to average
+    """
+
+    graph = circuit.graph
+    nodes = [node for node in graph.query_nodes() if node.converted_to_table_lookup]
+
+    original_maximum = utils.TABLE_CONSTRUCTION_MAXIMUM_BATCH_ELEMENTS
+    if one_by_one:
+        utils.TABLE_CONSTRUCTION_MAXIMUM_BATCH_ELEMENTS = 1
+
+    try:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            for node in nodes:
+                utils.construct_deduplicated_tables(
+                    node,
+                    graph.ordered_preds_of(node),
+                    circuit.configuration,
+                )
+        end = time.perf_counter()
+    finally:
+        utils.TABLE_CONSTRUCTION_MAXIMUM_BATCH_ELEMENTS = original_maximum
+
+    return ((end - start) / repetitions) * 1000
+
+
+@progress.track(targets)
+def main(bit_width, shape):
+    """
+    Benchmark a target.
+
+    Args:
+        bit_width:
+            bit width of the input of the table lookup
+
+        shape:
+            shape of the input of the table lookup
+    """
+
+    # same table lookup as the table lookup targets of `primitive.py`
+    # with a position dependent offset on tensors, to have a different table per cell
+    offsets = np.arange(np.prod(shape, dtype=np.int64)).reshape(shape) % 4
+
+    def function(x):
+        return (x // 2) + offsets
+
+    inputset = fhe.inputset(lambda _: np.random.randint(0, 2**bit_width, size=shape))
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+
+    print("Compiling...")
+    with progress.measure(id="compilation-time-ms", label="Compilation Time (ms)"):
+        circuit = compiler.compile(inputset, fhe.Configuration())
+
+    print("Warming up...")
+    construction_time_ms(circuit, one_by_one=False, repetitions=1)
+
+    print("Running...")
+    progress.measure(
+        id="table-construction-before-ms",
+        label="Table Construction Evaluating One Candidate At A Time (ms)",
+        value=construction_time_ms(circuit, one_by_one=True, repetitions=10),
+    )
+    progress.measure(
+        id="table-construction-after-ms",
+        label="Table Construction Evaluating Stacked Candidates (ms)",
+        value=construction_time_ms(circuit, one_by_one=False, repetitions=10),
+    )
@@ -0,0 +1,106 @@
+"""
+Benchmark the tracing of functions operating on large tensors.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete.fhe.dtypes import UnsignedInteger
+from concrete.fhe.tracing import Tracer, tracer
+from concrete.fhe.values import EncryptedTensor
+
+
+def matmul(x):
+    """
+    Matrix multiplication of a large tensor.
+    """
+
+    return np.sum(x @ np.ones((1000, 1000), dtype=np.int64), axis=0)
+
+
+def unrolled(x):
+    """
+    Long unrolled loop of elementwise operations and reshapes.
+    """
+
+    for i in range(500):
+        x = ((x + i) * 3 // 2) - np.transpose(x)
+        x = np.reshape(np.reshape(x, (-1,)), (200, 200))
+    return x
+
+
+def convolutional(x):
+    """
+    Stack of concatenations and reductions, similar to a convolutional network.
+    """
+
+    for _ in range(50):
+        x = np.concatenate((x, x), axis=1)
+        x = np.sum(x.reshape((64, 2, 64, 64)), axis=1)
+    return x
+
+
+functions = {
+    "matmul": (matmul, (1000, 1000)),
+    "unrolled": (unrolled, (200, 200)),
+    "convolutional": (convolutional, (64, 64, 64)),
+}
+
+targets = [
+    {
+        "id": f"tracing :: {name} :: {mode}",
+        "name": f"Tracing of {name} function on {'x'.join(str(size) for size in shape)} tensor "
+        f"({mode} outputs)",
+        "parameters": {
+            "name": name,
+            "inferred": mode == "inferred",
+        },
+    }
+    for name, (_, shape) in functions.items()
+    for mode in ["inferred", "evaluated"]
+]
+
+
+@progress.track(targets)
+def main(name, inferred):
+    """
+    Benchmark a target.
+
+    Args:
+        name:
+            name of the function to trace
+
+        inferred:
+            whether to infer outputs of numpy operations,
+            or to evaluate numpy operations on full-size samples
+    """
+
+    function, shape = functions[name]
+    parameters = {"x": EncryptedTensor(UnsignedInteger(4), shape=shape)}
+
+    original_infer = tracer.infer
+    if not inferred:
+        tracer.infer = lambda *_args, **_kwargs: None
+
+    try:
+        print("Tracing...")
+        start = time.perf_counter()
+        graph = Tracer.trace(function, parameters)
+        end = time.perf_counter()
+    finally:
+        tracer.infer = original_infer
+
+    progress.measure(
+        id="tracing-time-ms",
+        label="Tracing Time (ms)",
+        value=(end - start) * 1000,
+    )
+    progress.measure(
+        id="node-count",
+        label="Node Count",
+        value=len(graph.graph.nodes()),
+    )
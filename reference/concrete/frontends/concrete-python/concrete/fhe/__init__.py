@@ -16,9 +16,12 @@ from .compilation import (
     Client,
     ClientSpecs,
     ComparisonStrategy,
+    CompilationPhase,
+    CompilationProfile,
     Compiler,
     CompositionPolicy,
     Configuration,
+    Corners,
     DebugArtifacts,
     EncryptionStatus,
     EvaluationKeys,
@@ -26,9 +29,11 @@ from .compilation import (
 )
 from .compilation import FheFunction as Function
 from .compilation import FheModule as Module
+from .compilation import FheScheduler as Scheduler
 from .compilation import (
     FunctionDebugArtifacts,
     Input,
+    Interval,
     Keys,
     MinMaxStrategy,
     ModuleDebugArtifacts,
@@ -56,6 +61,7 @@ from .extensions import (
     hint,
     identity,
     if_then_else,
+    loop,
     maxpool,
     multivariate,
     one,
@@ -24,6 +24,9 @@ from .evaluation_keys import EvaluationKeys
 from .keys import Keys
 from .module import FheFunction, FheModule
 from .module_compiler import FunctionDef, ModuleCompiler
+from .profiling import CompilationPhase, CompilationProfile
+from .ranges import Corners, Interval
+from .scheduler import FheScheduler
 from .server import Server
 from .specs import ClientSpecs
 from .status import EncryptionStatus
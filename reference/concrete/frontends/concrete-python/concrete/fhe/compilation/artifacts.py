@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from ..representation import Graph
 from .configuration import Configuration
+from .profiling import CompilationProfile
 from .utils import get_terminal_size
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -288,6 +289,24 @@ class FunctionDebugArtifacts:
         self.textual_representations_of_graphs[name].append(textual_representation)
         self.final_graph = graph
 
+    def merge(self, other: "FunctionDebugArtifacts"):
+        """
+        Add the artifacts of another object to this object.
+
+        Args:
+            other (FunctionDebugArtifacts):
+                artifacts to merge (e.g., collected in a worker process)
+        """
+        if other.source_code is not None:
+            self.source_code = other.source_code
+        self.parameter_encryption_statuses.update(other.parameter_encryption_statuses)
+        for name, textual_representations in other.textual_representations_of_graphs.items():
+            self.textual_representations_of_graphs.setdefault(name, []).extend(
+                textual_representations
+            )
+        if other.final_graph is not None:
+            self.final_graph = other.final_graph
+
 
 class ModuleDebugArtifacts:
     """
@@ -296,6 +315,7 @@ class ModuleDebugArtifacts:
 
     output_directory: Path
     mlir_to_compile: Optional[str]
+    compilation_profile: Optional[CompilationProfile]
     _execution_runtime: Optional["Lazy[ExecutionRt]"]
     functions: dict[str, FunctionDebugArtifacts]
 
@@ -306,6 +326,7 @@ class ModuleDebugArtifacts:
     ):
         self.output_directory = Path(output_directory)
         self.mlir_to_compile = None
+        self.compilation_profile = None
         self._execution_runtime = None
         self.functions = (
             {name: FunctionDebugArtifacts() for name in function_names} if function_names else {}
@@ -321,6 +342,16 @@ class ModuleDebugArtifacts:
         """
         self.mlir_to_compile = mlir
 
+    def add_compilation_profile(self, compilation_profile: CompilationProfile):
+        """
+        Add the profile of the compilation phases.
+
+        Args:
+            compilation_profile (CompilationProfile):
+                profile recording the phases of the compilation
+        """
+        self.compilation_profile = compilation_profile
+
     def add_execution_runtime(self, execution_runtime: "Lazy[ExecutionRt]"):
         """
         Add the (lazy) execution runtime to get the client parameters if needed.
@@ -436,6 +467,12 @@ class ModuleDebugArtifacts:
             with open(output_directory.joinpath("client_parameters.json"), "wb") as f:
                 f.write(self.client_parameters)
 
+        if self.compilation_profile is not None:
+            self.compilation_profile.export_json(output_directory.joinpath("profile.json"))
+            self.compilation_profile.export_chrome_trace(
+                output_directory.joinpath("profile.trace.json")
+            )
+
         # pylint: enable=too-many-branches
 
 
@@ -468,3 +505,10 @@ class DebugArtifacts:
         Return the mlir string.
         """
         return self.module_artifacts.mlir_to_compile
+
+    @property
+    def compilation_profile(self) -> Optional[CompilationProfile]:
+        """
+        Return the profile of the compilation phases.
+        """
+        return self.module_artifacts.compilation_profile
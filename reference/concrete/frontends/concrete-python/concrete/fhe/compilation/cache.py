@@ -0,0 +1,203 @@
+"""
+Declaration of `CompilationCache` class.
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+from mlir._mlir_libs import _concretelang
+
+from ..version import __version__
+from .composition import CompositionRule
+from .configuration import Configuration
+
+# pylint: enable=import-error,no-name-in-module
+
+
+COMPILATION_CACHE_ENTRY_PREFIX = "entry-"
+COMPILATION_CACHE_TEMPORARY_PREFIX = "tmp-"
+
+# configuration options that have an effect on the compilation artifacts
+COMPILATION_CACHE_CONFIGURATION_KEYS = [
+    "use_gpu",
+    "loop_parallelize",
+    "dataflow_parallelize",
+    "auto_parallelize",
+    "compress_evaluation_keys",
+    "compress_input_ciphertexts",
+    "detect_overflow_in_simulation",
+    "composable",
+    "p_error",
+    "global_p_error",
+    "parameter_selection_strategy",
+    "multi_parameter_strategy",
+    "enable_tlu_fusing",
+    "security_level",
+]
+
+
+class CompilationCache:
+    """
+    CompilationCache class, to reuse compilation artifacts of identical programs across processes.
+
+    Each entry is a directory containing the artifacts of a `Library` (shared library, program info,
+    compilation feedback), named after the hash of everything that affects compilation.
+
+    Entries are published atomically by renaming a fully written temporary directory, so several
+    processes can share the same cache location. When the total size of the entries exceeds the
+    maximum size of the cache, least recently used entries are evicted.
+    """
+
+    location: Path
+    size: int
+
+    def __init__(self, location: Union[str, Path], size: int):
+        self.location = Path(location)
+        self.size = size
+
+        self.location.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+        mlir: str,
+        configuration: Configuration,
+        is_simulated: bool,
+        composition_rules: Optional[list[CompositionRule]],
+    ) -> str:
+        """
+        Compute the key of a compilation.
+
+        Args:
+            mlir (str):
+                mlir to compile
+
+            configuration (Configuration):
+                configuration to use
+
+            is_simulated (bool):
+                whether to compile in simulation mode or not
+
+            composition_rules (Optional[List[CompositionRule]]):
+                composition rules to be applied when compiling
+
+        Returns:
+            str:
+                stable hash of the compilation
+        """
+
+        options = {
+            name: str(getattr(configuration, name)) for name in COMPILATION_CACHE_CONFIGURATION_KEYS
+        }
+        for name in ["keyset_restriction", "range_restriction"]:
+            restriction = getattr(configuration, name)
+            options[name] = restriction.to_json() if restriction is not None else None
+
+        # the compiler is a submodule of the extension, which is the file that changes with it
+        compiler = Path(_concretelang.__file__).stat()
+
+        description = {
+            "mlir": mlir.strip(),
+            "configuration": options,
+            "is_simulated": is_simulated,
+            "composition_rules": [
+                [rule.from_.func, rule.from_.pos, rule.to.func, rule.to.pos]
+                for rule in (composition_rules or [])
+            ],
+            "version": __version__,
+            "compiler": [compiler.st_size, compiler.st_mtime_ns],
+        }
+
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def load(self, key: str) -> Optional[Path]:
+        """
+        Load the artifacts of a compilation from the cache.
+
+        Args:
+            key (str):
+                key of the compilation
+
+        Returns:
+            Optional[Path]:
+                private copy of the artifacts if the compilation is cached, None otherwise
+        """
+
+        entry = self.location / f"{COMPILATION_CACHE_ENTRY_PREFIX}{key}"
+        if not entry.exists():
+            return None
+
+        # entries are copied so that the server can write to its output directory (e.g., on save)
+        output_dir = Path(tempfile.mkdtemp())
+        try:
+            shutil.copytree(entry, output_dir, dirs_exist_ok=True)
+            os.utime(entry)
+        except OSError:
+            shutil.rmtree(output_dir, ignore_errors=True)
+            return None
+
+        return output_dir
+
+    def store(self, key: str, output_dir: Union[str, Path]):
+        """
+        Store the artifacts of a compilation to the cache.
+
+        Args:
+            key (str):
+                key of the compilation
+
+            output_dir (Union[str, Path]):
+                directory containing the artifacts of the compilation
+        """
+
+        entry = self.location / f"{COMPILATION_CACHE_ENTRY_PREFIX}{key}"
+        if entry.exists():
+            os.utime(entry)
+            return
+
+        temporary = self.location / f"{COMPILATION_CACHE_TEMPORARY_PREFIX}{uuid.uuid4().hex}"
+        try:
+            shutil.copytree(output_dir, temporary)
+            os.rename(temporary, entry)
+        except OSError:
+            # another process published the same entry first, or the cache is not writable
+            shutil.rmtree(temporary, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Evict least recently used entries until the cache fits in its maximum size.
+        """
+
+        entries = []
+        for entry in self.location.glob(f"{COMPILATION_CACHE_ENTRY_PREFIX}*"):
+            try:
+                last_use = entry.stat().st_mtime
+                size = sum(path.stat().st_size for path in entry.rglob("*") if path.is_file())
+            except OSError:  # pragma: no cover
+                continue
+            entries.append((last_use, size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total_size <= self.size:
+                break
+
+            # entries are renamed before being removed so they are never seen partially removed
+            trash = self.location / f"{COMPILATION_CACHE_TEMPORARY_PREFIX}{uuid.uuid4().hex}"
+            try:
+                os.rename(entry, trash)
+            except OSError:  # pragma: no cover
+                continue
+
+            shutil.rmtree(trash, ignore_errors=True)
+            total_size -= size
@@ -4,6 +4,7 @@ Declaration of `Circuit` class.
 
 # pylint: disable=import-error,no-member,no-name-in-module
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -172,6 +173,27 @@ class Circuit:
         """
         return self._function.encrypt(*args)
 
+    def encrypt_batch(
+        self,
+        samples: Sequence[Sequence[Optional[Union[int, np.ndarray, list]]]],
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[Value, tuple[Optional[Value], ...]]]]:
+        """
+        Encrypt argument(s) of many independent samples for evaluation.
+
+        Args:
+            samples (Sequence[Sequence[Optional[Union[int, numpy.ndarray, List]]]]):
+                argument(s) for evaluation of each sample
+
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[Value, Tuple[Optional[Value], ...]]]]:
+                encrypted argument(s) for evaluation of each sample
+        """
+        return self._function.encrypt_batch(samples, max_workers=max_workers)
+
     def run(
         self,
         *args: Optional[Union[Value, tuple[Optional[Value], ...]]],
@@ -208,6 +230,28 @@ class Circuit:
 
         return self._function.decrypt(*results)
 
+    def decrypt_batch(
+        self,
+        results: Sequence[Union[Value, tuple[Value, ...]]],
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[int, np.ndarray, tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+        """
+        Decrypt result(s) of many independent evaluations.
+
+        Args:
+            results (Sequence[Union[Value, Tuple[Value, ...]]]):
+                result(s) of each evaluation
+
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[int, np.ndarray, Tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+                decrypted result(s) of each evaluation
+        """
+
+        return self._function.decrypt_batch(results, max_workers=max_workers)
+
     def encrypt_run_decrypt(self, *args: Any) -> Any:
         """
         Encrypt inputs, run the circuit, and decrypt the outputs in one go.
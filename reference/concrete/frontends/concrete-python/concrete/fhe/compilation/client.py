@@ -4,19 +4,23 @@ Declaration of `Client` class.
 
 # pylint: disable=import-error,no-member,no-name-in-module
 
+import os
 import shutil
 import tempfile
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
-from concrete.compiler import ClientProgram, LweSecretKey
+from concrete.compiler import ClientCircuit, ClientProgram, Keyset, LweSecretKey
 from concrete.compiler import Value as Value_
 
 from .evaluation_keys import EvaluationKeys
 from .keys import Keys
 from .specs import ClientSpecs
-from .utils import validate_input_args
+from .utils import InputSpec, get_input_specs, validate_input_args, validate_input_batch
 from .value import Value
 
 # pylint: enable=import-error,no-member,no-name-in-module
@@ -30,6 +34,12 @@ class Client:
     _client_specs: ClientSpecs
     _keys: Optional[Keys]
 
+    _client_program: Optional[ClientProgram]
+    _client_program_keyset: Optional[Keyset]
+    _client_circuits: dict[str, ClientCircuit]
+    _client_circuit_lock: threading.Lock
+    _input_specs: dict[str, list[InputSpec]]
+
     def __init__(
         self,
         client_specs: ClientSpecs,
@@ -41,6 +51,12 @@ class Client:
         if not is_simulated:
             self._keys = Keys(client_specs, keyset_cache_directory)
 
+        self._client_program = None
+        self._client_program_keyset = None
+        self._client_circuits = {}
+        self._client_circuit_lock = threading.Lock()
+        self._input_specs = {}
+
     def save(self, path: Union[str, Path]):
         """
         Save the client into the given path in zip format.
@@ -104,6 +120,7 @@ class Client:
         Get the spec for the client.
         """
         self._client_specs = new_spec
+        self._invalidate()
 
     @property
     def keys(self) -> Optional[Keys]:
@@ -120,6 +137,117 @@ class Client:
         assert self._keys is not None, "Tried to set keys on simulated client."
         assert new_keys.are_generated, "Keyset is not generated."
         self._keys = new_keys
+        self._invalidate()
+
+    def _invalidate(self):
+        """
+        Forget client program, client circuits and input specs created for previous specs or keys.
+        """
+
+        self._client_program = None
+        self._client_program_keyset = None
+        self._client_circuits = {}
+        self._input_specs = {}
+
+    def _resolve_function_name(self, function_name: Optional[str]) -> str:
+        """
+        Get the name of the function, defaulting to the only function of the program.
+        """
+
+        if function_name is not None:
+            return function_name
+
+        functions = self.specs.program_info.function_list()
+        if len(functions) != 1:  # pragma: no cover
+            msg = "The client contains more than one functions. \
+Provide a `function_name` keyword argument to disambiguate."
+            raise TypeError(msg)
+
+        return functions[0]
+
+    def _get_client_circuit(self, function_name: str) -> ClientCircuit:
+        """
+        Get the client circuit of a function, creating it on first use.
+
+        Client program is created for the current keyset (or for simulation on simulated clients),
+        and recreated when the keyset changes (e.g., after forced key generation).
+
+        Client circuits cannot be shared between threads, so the returned client circuit should
+        only be used while holding `_client_circuit_lock`.
+        """
+
+        # pylint: disable=protected-access
+        keyset = None if self._keys is None else self._keys._keyset
+        # pylint: enable=protected-access
+
+        if self._client_program is None or self._client_program_keyset is not keyset:
+            self._client_program = self._create_client_program()
+            self._client_program_keyset = keyset
+            self._client_circuits = {}
+
+        client_circuit = self._client_circuits.get(function_name)
+        if client_circuit is None:
+            client_circuit = self._client_program.get_client_circuit(function_name)
+            self._client_circuits[function_name] = client_circuit
+        return client_circuit
+
+    def _create_client_program(self) -> ClientProgram:
+        """
+        Create a client program for the current keyset, with its own encryption randomness.
+        """
+
+        # pylint: disable=protected-access
+        keyset = None if self._keys is None else self._keys._keyset
+        # pylint: enable=protected-access
+
+        if keyset is None:
+            return ClientProgram.create_simulated(self._client_specs.program_info)
+        return ClientProgram.create_encrypted(self._client_specs.program_info, keyset)
+
+    def _map_with_client_circuits(
+        self,
+        function: Callable[[ClientCircuit, Any], Any],
+        items: Sequence[Any],
+        function_name: str,
+        max_workers: Optional[int],
+    ) -> list[Any]:
+        """
+        Apply a function to each item using client circuits of a function, on a thread pool.
+
+        Items are split into contiguous chunks, one per worker, and each chunk is processed
+        using a client circuit of its own client program, as client circuits cannot be shared
+        between threads (including the cached client circuit, which other calls might be using).
+        """
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        chunk_count = max(1, min(max_workers, len(items)))
+        chunk_size = -(-len(items) // chunk_count)
+        chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+        def process(chunk_index: int) -> list[Any]:
+            client_circuit = self._create_client_program().get_client_circuit(function_name)
+            return [function(client_circuit, item) for item in chunks[chunk_index]]
+
+        if len(chunks) <= 1:
+            return process(0) if len(chunks) == 1 else []
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            processed = list(pool.map(process, range(len(chunks))))
+
+        return [result for chunk in processed for result in chunk]
+
+    def _get_input_specs(self, function_name: str) -> list[InputSpec]:
+        """
+        Get the specs of the inputs of a function, parsing client specs on first use.
+        """
+
+        input_specs = self._input_specs.get(function_name)
+        if input_specs is None:
+            input_specs = get_input_specs(self._client_specs, function_name)
+            self._input_specs[function_name] = input_specs
+        return input_specs
 
     def keygen(
         self,
@@ -176,39 +304,96 @@ class Client:
         if not self._keys.are_generated:
             self._keys.generate()
 
-        if function_name is None:
-            functions = self.specs.program_info.function_list()
-            if len(functions) == 1:
-                function_name = functions[0]
-            else:  # pragma: no cover
-                msg = "The client contains more than one functions. \
-Provide a `function_name` keyword argument to disambiguate."
-                raise TypeError(msg)
+        function_name = self._resolve_function_name(function_name)
 
         ordered_sanitized_args = validate_input_args(
-            self._client_specs, *args, function_name=function_name
-        )
-        client_program = ClientProgram.create_encrypted(
-            self._client_specs.program_info, self._keys._keyset  # pylint: disable=protected-access
+            self._client_specs,
+            *args,
+            function_name=function_name,
+            input_specs=self._get_input_specs(function_name),
         )
-        client_circuit = client_program.get_client_circuit(function_name)
-
-        exported = [
-            (
-                None
-                if arg is None
-                else Value(
-                    client_circuit.prepare_input(
-                        Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
-                        position,
+        with self._client_circuit_lock:
+            client_circuit = self._get_client_circuit(function_name)
+
+            exported = [
+                (
+                    None
+                    if arg is None
+                    else Value(
+                        client_circuit.prepare_input(
+                            Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
+                            position,
+                        )
                     )
                 )
-            )
-            for position, arg in enumerate(ordered_sanitized_args)
-        ]
+                for position, arg in enumerate(ordered_sanitized_args)
+            ]
 
         return tuple(exported) if len(exported) != 1 else exported[0]
 
+    def encrypt_batch(
+        self,
+        samples: Sequence[Sequence[Optional[Union[int, np.ndarray, list]]]],
+        function_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[Value, tuple[Optional[Value], ...]]]]:
+        """
+        Encrypt argument(s) of many independent samples for evaluation.
+
+        Arguments are validated together, and encrypted on a thread pool.
+
+        Args:
+            samples (Sequence[Sequence[Optional[Union[int, np.ndarray, List]]]]):
+                argument(s) for evaluation of each sample
+            function_name (str):
+                name of the function to encrypt
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[Value, Tuple[Optional[Value], ...]]]]:
+                encrypted argument(s) for evaluation of each sample
+        """
+
+        assert self._keys is not None, "Tried to encrypt on a simulated client."
+        if not self._keys.are_generated:
+            self._keys.generate()
+
+        function_name = self._resolve_function_name(function_name)
+
+        sanitized_samples = validate_input_batch(
+            self._client_specs,
+            samples,
+            function_name=function_name,
+            input_specs=self._get_input_specs(function_name),
+        )
+
+        def encrypt_sample(
+            client_circuit: ClientCircuit,
+            sample: list[Optional[Union[int, np.ndarray]]],
+        ) -> Optional[Union[Value, tuple[Optional[Value], ...]]]:
+            exported = [
+                (
+                    None
+                    if arg is None
+                    else Value(
+                        client_circuit.prepare_input(
+                            Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
+                            position,
+                        )
+                    )
+                )
+                for position, arg in enumerate(sample)
+            ]
+            return tuple(exported) if len(exported) != 1 else exported[0]
+
+        return self._map_with_client_circuits(
+            encrypt_sample,
+            sanitized_samples,
+            function_name,
+            max_workers,
+        )
+
     def simulate_encrypt(
         self,
         *args: Optional[Union[int, np.ndarray, list]],
@@ -230,34 +415,30 @@ Provide a `function_name` keyword argument to disambiguate."
 
         assert self._keys is None, "Tried to simulate encryption on an encrypted client."
 
-        if function_name is None:  # pragma: no cover
-            functions = self.specs.program_info.function_list()
-            if len(functions) == 1:
-                function_name = functions[0]
-            else:
-                msg = "The client contains more than one functions. \
-Provide a `function_name` keyword argument to disambiguate."
-                raise TypeError(msg)
+        function_name = self._resolve_function_name(function_name)
 
         ordered_sanitized_args = validate_input_args(
-            self._client_specs, *args, function_name=function_name
+            self._client_specs,
+            *args,
+            function_name=function_name,
+            input_specs=self._get_input_specs(function_name),
         )
-        client_program = ClientProgram.create_simulated(self._client_specs.program_info)
-        client_circuit = client_program.get_client_circuit(function_name)
-
-        exported = [
-            (
-                None
-                if arg is None
-                else Value(
-                    client_circuit.simulate_prepare_input(
-                        Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
-                        position,
+        with self._client_circuit_lock:
+            client_circuit = self._get_client_circuit(function_name)
+
+            exported = [
+                (
+                    None
+                    if arg is None
+                    else Value(
+                        client_circuit.simulate_prepare_input(
+                            Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
+                            position,
+                        )
                     )
                 )
-            )
-            for position, arg in enumerate(ordered_sanitized_args)
-        ]
+                for position, arg in enumerate(ordered_sanitized_args)
+            ]
 
         return tuple(exported) if len(exported) != 1 else exported[0]
 
@@ -280,14 +461,7 @@ Provide a `function_name` keyword argument to disambiguate."
                 decrypted result(s) of evaluation
         """
 
-        if function_name is None:  # pragma: no cover
-            functions = self.specs.program_info.function_list()
-            if len(functions) == 1:
-                function_name = functions[0]
-            else:  # pragma: no cover
-                msg = "The client contains more than one functions. \
-Provide a `function_name` keyword argument to disambiguate."
-                raise TypeError(msg)
+        function_name = self._resolve_function_name(function_name)
 
         flattened_results: list[Value] = []
         for result in results:
@@ -300,21 +474,71 @@ Provide a `function_name` keyword argument to disambiguate."
         assert self._keys is not None, "Tried to decrypt on a simulated client."
         assert self._keys.are_generated
 
-        client_program = ClientProgram.create_encrypted(
-            self._client_specs.program_info, self._keys._keyset  # pylint: disable=protected-access
-        )
-        client_circuit = client_program.get_client_circuit(function_name)
+        with self._client_circuit_lock:
+            client_circuit = self._get_client_circuit(function_name)
 
-        decrypted = tuple(
-            client_circuit.process_output(
-                result._inner, position  # pylint: disable=protected-access
-            ).to_py_val()
-            for position, result in enumerate(flattened_results)
-        )
+            decrypted = tuple(
+                client_circuit.process_output(
+                    result._inner, position  # pylint: disable=protected-access
+                ).to_py_val()
+                for position, result in enumerate(flattened_results)
+            )
         decrypted = tuple(d.astype("int64") if isinstance(d, np.ndarray) else d for d in decrypted)
 
         return decrypted if len(decrypted) != 1 else decrypted[0]
 
+    def decrypt_batch(
+        self,
+        results: Sequence[Union[Value, tuple[Value, ...]]],
+        function_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[int, np.ndarray, tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+        """
+        Decrypt result(s) of many independent evaluations.
+
+        Results are decrypted on a thread pool.
+
+        Args:
+            results (Sequence[Union[Value, Tuple[Value, ...]]]):
+                result(s) of each evaluation
+            function_name (str):
+                name of the function to decrypt for
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[int, np.ndarray, Tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+                decrypted result(s) of each evaluation
+        """
+
+        function_name = self._resolve_function_name(function_name)
+
+        assert self._keys is not None, "Tried to decrypt on a simulated client."
+        assert self._keys.are_generated
+
+        def decrypt_result(
+            client_circuit: ClientCircuit,
+            result: Union[Value, tuple[Value, ...]],
+        ) -> Optional[Union[int, np.ndarray, tuple[Optional[Union[int, np.ndarray]], ...]]]:
+            flattened_results = list(result) if isinstance(result, tuple) else [result]
+            decrypted = tuple(
+                client_circuit.process_output(
+                    output._inner, position  # pylint: disable=protected-access
+                ).to_py_val()
+                for position, output in enumerate(flattened_results)
+            )
+            decrypted = tuple(
+                d.astype("int64") if isinstance(d, np.ndarray) else d for d in decrypted
+            )
+            return decrypted if len(decrypted) != 1 else decrypted[0]
+
+        return self._map_with_client_circuits(
+            decrypt_result,
+            results,
+            function_name,
+            max_workers,
+        )
+
     def simulate_decrypt(
         self,
         *results: Union[Value, tuple[Value, ...]],
@@ -334,14 +558,7 @@ Provide a `function_name` keyword argument to disambiguate."
                 decrypted result(s) of evaluation
         """
 
-        if function_name is None:  # pragma: no cover
-            functions = self.specs.program_info.function_list()
-            if len(functions) == 1:
-                function_name = functions[0]
-            else:  # pragma: no cover
-                msg = "The client contains more than one functions. \
-Provide a `function_name` keyword argument to disambiguate."
-                raise TypeError(msg)
+        function_name = self._resolve_function_name(function_name)
 
         flattened_results: list[Value] = []
         for result in results:
@@ -353,15 +570,15 @@ Provide a `function_name` keyword argument to disambiguate."
 
         assert self._keys is None, "Tried to simulate decryption on an encrypted client."
 
-        client_program = ClientProgram.create_simulated(self._client_specs.program_info)
-        client_circuit = client_program.get_client_circuit(function_name)
+        with self._client_circuit_lock:
+            client_circuit = self._get_client_circuit(function_name)
 
-        decrypted = tuple(
-            client_circuit.simulate_process_output(
-                result._inner, position  # pylint: disable=protected-access
-            ).to_py_val()
-            for position, result in enumerate(flattened_results)
-        )
+            decrypted = tuple(
+                client_circuit.simulate_process_output(
+                    result._inner, position  # pylint: disable=protected-access
+                ).to_py_val()
+                for position, result in enumerate(flattened_results)
+            )
         decrypted = tuple(d.astype("int64") if isinstance(d, np.ndarray) else d for d in decrypted)
 
         return decrypted if len(decrypted) != 1 else decrypted[0]
@@ -5,7 +5,7 @@ Declaration of `Compiler` class.
 # pylint: disable=import-error,no-name-in-module
 
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any, Callable, Optional, Union
 
 import numpy as np
@@ -17,6 +17,7 @@ from .circuit import Circuit
 from .composition import CompositionPolicy
 from .configuration import Configuration
 from .module_compiler import FunctionDef, ModuleCompiler
+from .ranges import Range
 from .status import EncryptionStatus
 from .wiring import AllComposable, NotComposable, TracedOutput
 
@@ -118,7 +119,9 @@ class Compiler:
 
     def trace(
         self,
-        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]] = None,
+        inputset: Optional[
+            Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]
+        ] = None,
         configuration: Optional[Configuration] = None,
         artifacts: Optional[DebugArtifacts] = None,
         **kwargs,
@@ -127,8 +130,9 @@ class Compiler:
         Trace the function using an inputset.
 
         Args:
-            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple], Mapping[str, Range]]]):
                 optional inputset to extend accumulated inputset before bounds measurement
+                or ranges of each parameter to propagate through the graph without sampling
 
             configuration(Optional[Configuration], default = None):
                 configuration to use
@@ -164,7 +168,9 @@ class Compiler:
 
     def compile(
         self,
-        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]] = None,
+        inputset: Optional[
+            Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]
+        ] = None,
         configuration: Optional[Configuration] = None,
         artifacts: Optional[DebugArtifacts] = None,
         **kwargs,
@@ -173,8 +179,9 @@ class Compiler:
         Compile the function using an inputset.
 
         Args:
-            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple], Mapping[str, Range]]]):
                 optional inputset to extend accumulated inputset before bounds measurement
+                or ranges of each parameter to propagate through the graph without sampling
 
             configuration(Optional[Configuration], default = None):
                 configuration to use
@@ -1012,8 +1012,17 @@ class Configuration:
     range_restriction: Optional[RangeRestriction]
     keyset_restriction: Optional[KeysetRestriction]
     auto_schedule_run: bool
+    auto_schedule_max_in_flight: Optional[int]
+    auto_schedule_max_queue_size: Optional[int]
+    auto_schedule_reject_when_full: bool
     security_level: SecurityLevel
     optim_lsbs_with_lut: bool
+    stream_inputset: bool
+    inputset_reservoir_size: int
+    compilation_cache_location: Optional[str]
+    compilation_cache_size: int
+    parallel_function_evaluation: bool
+    function_evaluation_workers: Optional[int]
 
     def __init__(
         self,
@@ -1086,8 +1095,17 @@ class Configuration:
         range_restriction: Optional[RangeRestriction] = None,
         keyset_restriction: Optional[KeysetRestriction] = None,
         auto_schedule_run: bool = False,
+        auto_schedule_max_in_flight: Optional[int] = None,
+        auto_schedule_max_queue_size: Optional[int] = None,
+        auto_schedule_reject_when_full: bool = False,
         security_level: SecurityLevel = SecurityLevel.SECURITY_128_BITS,
         optim_lsbs_with_lut: bool = True,
+        stream_inputset: bool = False,
+        inputset_reservoir_size: int = 10_000,
+        compilation_cache_location: Optional[Union[Path, str]] = None,
+        compilation_cache_size: int = 4 * 1024**3,
+        parallel_function_evaluation: bool = False,
+        function_evaluation_workers: Optional[int] = None,
     ):
         self.verbose = verbose
         self.compiler_debug_mode = compiler_debug_mode
@@ -1198,11 +1216,25 @@ class Configuration:
         self.keyset_restriction = keyset_restriction
 
         self.auto_schedule_run = auto_schedule_run
+        self.auto_schedule_max_in_flight = auto_schedule_max_in_flight
+        self.auto_schedule_max_queue_size = auto_schedule_max_queue_size
+        self.auto_schedule_reject_when_full = auto_schedule_reject_when_full
 
         self.security_level = security_level
 
         self.optim_lsbs_with_lut = optim_lsbs_with_lut
 
+        self.stream_inputset = stream_inputset
+        self.inputset_reservoir_size = inputset_reservoir_size
+        self.compilation_cache_location = (
+            str(compilation_cache_location)
+            if isinstance(compilation_cache_location, Path)
+            else compilation_cache_location
+        )
+        self.compilation_cache_size = compilation_cache_size
+        self.parallel_function_evaluation = parallel_function_evaluation
+        self.function_evaluation_workers = function_evaluation_workers
+
         self._validate()
 
     class Keep:
@@ -1281,8 +1313,17 @@ class Configuration:
         range_restriction: Union[Keep, Optional[RangeRestriction]] = KEEP,
         keyset_restriction: Union[Keep, Optional[KeysetRestriction]] = KEEP,
         auto_schedule_run: Union[Keep, bool] = KEEP,
+        auto_schedule_max_in_flight: Union[Keep, Optional[int]] = KEEP,
+        auto_schedule_max_queue_size: Union[Keep, Optional[int]] = KEEP,
+        auto_schedule_reject_when_full: Union[Keep, bool] = KEEP,
         security_level: Union[Keep, SecurityLevel] = KEEP,
         optim_lsbs_with_lut: Union[Keep, bool] = KEEP,
+        stream_inputset: Union[Keep, bool] = KEEP,
+        inputset_reservoir_size: Union[Keep, int] = KEEP,
+        compilation_cache_location: Union[Keep, Optional[Union[Path, str]]] = KEEP,
+        compilation_cache_size: Union[Keep, int] = KEEP,
+        parallel_function_evaluation: Union[Keep, bool] = KEEP,
+        function_evaluation_workers: Union[Keep, Optional[int]] = KEEP,
     ) -> "Configuration":
         """
         Get a new configuration from another one specified changes.
@@ -1363,6 +1404,39 @@ class Configuration:
             message = "Insecure key cache cannot be enabled without specifying its location"
             raise RuntimeError(message)
 
+        if self.inputset_reservoir_size < 1:
+            message = (
+                f"Inputset reservoir size must be positive (got {self.inputset_reservoir_size})"
+            )
+            raise ValueError(message)
+
+        if self.function_evaluation_workers is not None and self.function_evaluation_workers < 1:
+            message = (
+                f"Function evaluation workers must be positive "
+                f"(got {self.function_evaluation_workers})"
+            )
+            raise ValueError(message)
+
+        if self.auto_schedule_max_in_flight is not None and self.auto_schedule_max_in_flight < 1:
+            message = (
+                f"Maximum number of evaluations in flight must be positive "
+                f"(got {self.auto_schedule_max_in_flight})"
+            )
+            raise ValueError(message)
+
+        if self.auto_schedule_max_queue_size is not None and self.auto_schedule_max_queue_size < 1:
+            message = (
+                f"Maximum queue size of evaluations must be positive "
+                f"(got {self.auto_schedule_max_queue_size})"
+            )
+            raise ValueError(message)
+
+        if self.compilation_cache_size < 0:
+            message = (
+                f"Compilation cache size cannot be negative (got {self.compilation_cache_size})"
+            )
+            raise ValueError(message)
+
         if platform.system() == "Darwin" and self.dataflow_parallelize:  # pragma: no cover
             message = "Dataflow parallelism is not available in macOS"
             raise RuntimeError(message)
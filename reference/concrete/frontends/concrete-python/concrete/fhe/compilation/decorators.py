@@ -16,6 +16,7 @@ from .circuit import Circuit
 from .compiler import Compiler
 from .configuration import Configuration
 from .module_compiler import CompositionPolicy, FunctionDef, ModuleCompiler
+from .ranges import Range
 from .status import EncryptionStatus
 from .wiring import AllComposable
 
@@ -98,7 +99,9 @@ class Compilable:
 
     def trace(
         self,
-        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]] = None,
+        inputset: Optional[
+            Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]
+        ] = None,
         configuration: Optional[Configuration] = None,
         artifacts: Optional[DebugArtifacts] = None,
         **kwargs,
@@ -107,8 +110,9 @@ class Compilable:
         Trace the function into computation graph.
 
         Args:
-            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple], Mapping[str, Range]]]):
                 optional inputset to extend accumulated inputset before bounds measurement
+                or ranges of each parameter to propagate through the graph without sampling
 
             configuration(Optional[Configuration], default = None):
                 configuration to use
@@ -128,7 +132,9 @@ class Compilable:
 
     def compile(
         self,
-        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]] = None,
+        inputset: Optional[
+            Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]
+        ] = None,
         configuration: Optional[Configuration] = None,
         artifacts: Optional[DebugArtifacts] = None,
         **kwargs,
@@ -137,8 +143,9 @@ class Compilable:
         Compile the function into a circuit.
 
         Args:
-            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple], Mapping[str, Range]]]):
                 optional inputset to extend accumulated inputset before bounds measurement
+                or ranges of each parameter to propagate through the graph without sampling
 
             configuration(Optional[Configuration], default = None):
                 configuration to use
@@ -5,11 +5,11 @@ Declaration of `FheModule` classes.
 # pylint: disable=import-error,no-member,no-name-in-module
 
 import asyncio
-from collections.abc import Awaitable, Iterable
-from concurrent.futures import Future, ThreadPoolExecutor
+import inspect
+from collections.abc import Awaitable, Iterable, Sequence
+from concurrent.futures import Future
 from pathlib import Path
-from threading import Thread
-from typing import Any, NamedTuple, Optional, Union
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 import numpy as np
 from concrete.compiler import CompilationContext, LweSecretKey, Parameter
@@ -22,6 +22,8 @@ from .client import Client
 from .composition import CompositionRule
 from .configuration import Configuration
 from .keys import Keys
+from .profiling import CompilationProfile
+from .scheduler import FheScheduler
 from .server import Server
 from .utils import Lazy
 from .value import Value
@@ -37,32 +39,13 @@ class ExecutionRt:
     client: Client
     server: Server
     auto_schedule_run: bool
-    fhe_executor_pool: ThreadPoolExecutor
-    fhe_waiter_loop: asyncio.BaseEventLoop
-    fhe_waiter_thread: Thread  # daemon thread
+    fhe_scheduler: Optional[FheScheduler]  # shared by the modules of the process
 
-    def __init__(self, client, server, auto_schedule_run):
+    def __init__(self, client, server, auto_schedule_run, fhe_scheduler=None):
         self.client = client
         self.server = server
         self.auto_schedule_run = auto_schedule_run
-        if auto_schedule_run:
-            self.fhe_executor_pool = ThreadPoolExecutor()
-            self.fhe_waiter_loop = asyncio.new_event_loop()
-
-            def loop_thread():
-                asyncio.set_event_loop(self.fhe_waiter_loop)
-                self.fhe_waiter_loop.run_forever()
-
-            self.fhe_waiter_thread = Thread(target=loop_thread, args=(), daemon=True)
-            self.fhe_waiter_thread.start()
-        else:
-            self.fhe_executor_pool = None
-            self.fhe_waiter_loop = None
-            self.fhe_waiter_thread = None
-
-    def __del__(self):
-        if self.fhe_waiter_loop:
-            self.fhe_waiter_loop.stop()  # pragma: no cover
+        self.fhe_scheduler = fhe_scheduler
 
 
 class SimulationRt(NamedTuple):
@@ -209,6 +192,37 @@ class FheFunction:
             return tuple(args) if len(args) > 1 else args[0]  # type: ignore
         return self.execution_runtime.val.client.encrypt(*args, function_name=self.name)
 
+    def encrypt_batch(
+        self,
+        samples: Sequence[Sequence[Optional[Union[int, np.ndarray, list]]]],
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[Value, tuple[Optional[Value], ...]]]]:
+        """
+        Encrypt argument(s) of many independent samples for evaluation.
+
+        Args:
+            samples (Sequence[Sequence[Optional[Union[int, numpy.ndarray, List]]]]):
+                argument(s) for evaluation of each sample
+
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[Value, Tuple[Optional[Value], ...]]]]:
+                encrypted argument(s) for evaluation of each sample
+        """
+
+        if self.configuration.simulate_encrypt_run_decrypt:
+            return [
+                tuple(sample) if len(sample) > 1 else sample[0]  # type: ignore
+                for sample in samples
+            ]
+        return self.execution_runtime.val.client.encrypt_batch(
+            samples,
+            function_name=self.name,
+            max_workers=max_workers,
+        )
+
     def run_sync(
         self,
         *args: Optional[Union[Value, tuple[Optional[Value], ...]]],
@@ -228,7 +242,9 @@ class FheFunction:
         return self._run(True, *args)
 
     def run_async(
-        self, *args: Optional[Union[Value, tuple[Optional[Value], ...]]]
+        self,
+        *args: Optional[Union[Value, tuple[Optional[Value], ...]]],
+        priority: int = 0,
     ) -> Union[Value, tuple[Value, ...], Awaitable[Union[Value, tuple[Value, ...]]]]:
         """
         Evaluate the function asynchronuously.
@@ -237,20 +253,65 @@ class FheFunction:
             *args (Value):
                 argument(s) for evaluation
 
+            priority (int, default = 0):
+                priority of the evaluation in the scheduler, higher priorities run first
+
         Returns:
             Union[Awaitable[Value], Awaitable[Tuple[Value, ...]]]:
                 result(s) a future of the evaluation
         """
-        if (
-            isinstance(self.execution_runtime.val, ExecutionRt)
-            and not self.execution_runtime.val.fhe_executor_pool
-        ):
-            client = self.execution_runtime.val.client
-            server = self.execution_runtime.val.server
-            self.execution_runtime = Lazy(lambda: ExecutionRt(client, server, True))
-            self.execution_runtime.val.auto_schedule_run = False
+        return self._run(False, *args, priority=priority)
 
-        return self._run(False, *args)
+    async def run_coroutine(
+        self,
+        *args: Optional[Union[Value, tuple[Optional[Value], ...], Awaitable, Future]],
+        priority: int = 0,
+    ) -> Union[Value, tuple[Value, ...]]:
+        """
+        Evaluate the function in the running event loop.
+
+        Arguments can be results of other evaluations which are not done yet (e.g., coroutines of
+        `run_coroutine`, tasks or futures), they are awaited concurrently in the running event loop.
+        Only the evaluation itself is submitted to the scheduler, so chaining evaluations doesn't
+        involve any other thread. Cancelling the coroutine cancels the evaluation if it didn't
+        start yet.
+
+        Args:
+            *args (Union[Value, Awaitable[Value], Future[Value]]):
+                argument(s) for evaluation
+
+            priority (int, default = 0):
+                priority of the evaluation in the scheduler, higher priorities run first
+
+        Returns:
+            Union[Value, Tuple[Value, ...]]:
+                result(s) of evaluation
+        """
+
+        async def arg_ready(arg):
+            if isinstance(arg, Future):
+                return await asyncio.wrap_future(arg)
+            if inspect.isawaitable(arg):
+                return await arg
+            return arg
+
+        ready_args = await asyncio.gather(*(arg_ready(arg) for arg in args))
+
+        if self.configuration.simulate_encrypt_run_decrypt:
+            return self._simulate_decrypt(self._simulate_run(*ready_args))  # type: ignore
+
+        scheduler = self.scheduler
+        try:
+            # don't block the event loop if the queue is full, wait for room in another thread
+            future = scheduler.submit(self._fhe_work, *ready_args, priority=priority, timeout=0)
+        except TimeoutError:
+            future = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: scheduler.submit(self._fhe_work, *ready_args, priority=priority),
+            )
+
+        # cancelling the wrapper cancels the future, which doesn't run if it didn't start yet
+        return await asyncio.wrap_future(future)
 
     def run(
         self,
@@ -274,10 +335,30 @@ class FheFunction:
             auto_schedule_run = False  # pragma: no cover
         return self._run(not auto_schedule_run, *args)
 
+    @property
+    def scheduler(self) -> FheScheduler:
+        """
+        Get the scheduler of the background evaluations of the function.
+
+        Returns:
+            FheScheduler:
+                scheduler shared by the modules of the process with the same scheduling options
+        """
+
+        assert isinstance(self.execution_runtime.val, ExecutionRt)
+        if self.execution_runtime.val.fhe_scheduler is None:
+            self.execution_runtime.val.fhe_scheduler = FheScheduler.shared(
+                max_in_flight=self.configuration.auto_schedule_max_in_flight,
+                max_queue_size=self.configuration.auto_schedule_max_queue_size,
+                reject_when_full=self.configuration.auto_schedule_reject_when_full,
+            )
+        return self.execution_runtime.val.fhe_scheduler
+
     def _run(
         self,
         sync: bool,
         *args: Optional[Union[Value, tuple[Optional[Value], ...]]],
+        priority: int = 0,
     ) -> Union[Value, tuple[Value, ...], Awaitable[Union[Value, tuple[Value, ...]]]]:
         """
         Evaluate the function.
@@ -286,6 +367,9 @@ class FheFunction:
             *args (Value):
                 argument(s) for evaluation
 
+            priority (int, default = 0):
+                priority of the evaluation in the scheduler if sync=False
+
         Returns:
             Union[Value, Tuple[Value, ...], Awaitable[Union[Value, Tuple[Value, ...]]]]:
                 result(s) of evaluation if sync=True else future of result(s) of evaluation
@@ -295,11 +379,7 @@ class FheFunction:
 
         assert isinstance(self.execution_runtime.val, ExecutionRt)
 
-        fhe_work = lambda *args: self.execution_runtime.val.server.run(
-            *args,
-            evaluation_keys=self.execution_runtime.val.client.evaluation_keys,
-            function_name=self.name,
-        )
+        fhe_work = self._fhe_work
 
         def args_ready(args):
             return [arg.result() if isinstance(arg, Future) else arg for arg in args]
@@ -309,9 +389,8 @@ class FheFunction:
 
         all_args_done = all(not isinstance(arg, Future) or arg.done() for arg in args)
 
-        fhe_work_future = lambda *args: self.execution_runtime.val.fhe_executor_pool.submit(
-            fhe_work, *args
-        )
+        scheduler = self.scheduler
+        fhe_work_future = lambda *args: scheduler.submit(fhe_work, *args, priority=priority)
         if all_args_done:
             return fhe_work_future(*args_ready(args))  # type: ignore
 
@@ -322,16 +401,25 @@ class FheFunction:
                 return arg  # pragma: no cover
             if arg.done():
                 return arg.result()  # pragma: no cover
-            return await asyncio.wrap_future(arg, loop=self.execution_runtime.val.fhe_waiter_loop)
+            return await asyncio.wrap_future(arg, loop=scheduler.waiter_loop)
 
         async def args_ready_and_submit(*args):
             args = [await wait_async(arg) for arg in args]
             return await wait_async(fhe_work_future(*args))
 
         run_async = args_ready_and_submit(*args)
-        return asyncio.run_coroutine_threadsafe(
-            run_async, self.execution_runtime.val.fhe_waiter_loop
-        )  # type: ignore
+        return asyncio.run_coroutine_threadsafe(run_async, scheduler.waiter_loop)  # type: ignore
+
+    def _fhe_work(
+        self,
+        *args: Optional[Union[Value, tuple[Optional[Value], ...]]],
+    ) -> Union[Value, tuple[Value, ...]]:
+        assert isinstance(self.execution_runtime.val, ExecutionRt)
+        return self.execution_runtime.val.server.run(
+            *args,
+            evaluation_keys=self.execution_runtime.val.client.evaluation_keys,
+            function_name=self.name,
+        )
 
     def decrypt(
         self, *results: Union[Value, tuple[Value, ...], Awaitable[Union[Value, tuple[Value, ...]]]]
@@ -355,6 +443,39 @@ class FheFunction:
         results = [res.result() if isinstance(res, Future) else res for res in results]
         return self.execution_runtime.val.client.decrypt(*results, function_name=self.name)
 
+    def decrypt_batch(
+        self,
+        results: Sequence[
+            Union[Value, tuple[Value, ...], Awaitable[Union[Value, tuple[Value, ...]]]]
+        ],
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[Union[int, np.ndarray, tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+        """
+        Decrypt result(s) of many independent evaluations.
+
+        Args:
+            results (Sequence[Union[Value, Tuple[Value, ...], Awaitable[...]]]):
+                result(s) of each evaluation
+
+            max_workers (Optional[int], default = None):
+                maximum number of threads to use, number of cpus if not provided
+
+        Returns:
+            List[Optional[Union[int, np.ndarray, Tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+                decrypted result(s) of each evaluation
+        """
+
+        if self.configuration.simulate_encrypt_run_decrypt:
+            return list(results)  # type: ignore
+
+        assert isinstance(self.execution_runtime.val, ExecutionRt)
+        results = [res.result() if isinstance(res, Future) else res for res in results]
+        return self.execution_runtime.val.client.decrypt_batch(
+            results,
+            function_name=self.name,
+            max_workers=max_workers,
+        )
+
     def encrypt_run_decrypt(self, *args: Any) -> Any:
         """
         Encrypt inputs, run the function, and decrypt the outputs in one go.
@@ -708,6 +829,7 @@ class FheModule:
     compilation_context: CompilationContext
     execution_runtime: Lazy[ExecutionRt]
     simulation_runtime: Lazy[SimulationRt]
+    compilation_profile: Optional[CompilationProfile]
 
     def __init__(
         self,
@@ -716,12 +838,26 @@ class FheModule:
         compilation_context: CompilationContext,
         configuration: Optional[Configuration] = None,
         composition_rules: Optional[Iterable[CompositionRule]] = None,
+        compilation_profile: Optional[CompilationProfile] = None,
     ):
         assert configuration
         self.configuration = configuration if configuration is not None else Configuration()
         self.graphs = graphs
         self.mlir_module = mlir
         self.compilation_context = compilation_context
+        self.compilation_profile = compilation_profile
+
+        def profiled(init: Callable[[], Any]) -> Callable[[], Any]:
+            # runtimes can be initialized lazily, after the compilation
+            # so their initialization is recorded to the compilation profile explicitly
+            if compilation_profile is None:
+                return init
+
+            def wrapper():
+                with compilation_profile.activate():
+                    return init()
+
+            return wrapper
 
         tfhers_specs = TFHERSClientSpecs.from_graphs(graphs)
 
@@ -736,7 +872,7 @@ class FheModule:
             simulation_client = Client(simulation_server.client_specs, is_simulated=True)
             return SimulationRt(simulation_client, simulation_server)
 
-        self.simulation_runtime = Lazy(init_simulation)
+        self.simulation_runtime = Lazy(profiled(init_simulation))
         if configuration.fhe_simulation:
             self.simulation_runtime.init()
 
@@ -761,7 +897,7 @@ class FheModule:
                 execution_client, execution_server, self.configuration.auto_schedule_run
             )
 
-        self.execution_runtime = Lazy(init_execution)
+        self.execution_runtime = Lazy(profiled(init_execution))
         if configuration.fhe_execution:
             self.execution_runtime.init()
 
@@ -879,6 +1015,8 @@ class FheModule:
             "complexity",
         ]
         statistics = {attribute: getattr(self, attribute) for attribute in attributes}
+        if self.compilation_profile is not None:
+            statistics["compilation_profile"] = self.compilation_profile.summary()
         statistics["functions"] = {
             name: function.statistics for (name, function) in self.functions().items()
         }
@@ -5,29 +5,39 @@ Declaration of `MultiCompiler` class.
 # pylint: disable=import-error,no-name-in-module
 
 import inspect
+import multiprocessing
+import os
+import random
 import traceback
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, product
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
 import numpy as np
 from concrete.compiler import CompilationContext
 
-from ..extensions import AutoRounder, AutoTruncator
+from ..extensions.adjustment import adjust
 from ..mlir import GraphConverter
-from ..representation import Graph
+from ..representation import Graph, Node
 from ..tracing import Tracer
 from ..values import ValueDescription
 from .artifacts import DebugManager, FunctionDebugArtifacts, ModuleDebugArtifacts
 from .composition import CompositionPolicy
 from .configuration import Configuration
 from .module import FheModule
+from .profiling import CompilationProfile, profile_phase
+from .ranges import Corners, Interval, Range
 from .status import EncryptionStatus
 from .utils import fuse
 from .wiring import Input, Output, TracedOutput, Wire, Wired, WireTracingContextManager
 
 DEFAULT_OUTPUT_DIRECTORY: Path = Path(".artifacts")
 
+# functions of the module being evaluated, set in each worker process when it starts
+EVALUATED_FUNCTIONS: dict[str, "FunctionDef"] = {}
+
 # pylint: enable=import-error,no-name-in-module
 
 
@@ -42,6 +52,13 @@ class FunctionDef:
     graph: Optional[Graph]
     location: str
 
+    _bounds: Optional[dict[Node, dict[str, Union[np.integer, np.floating]]]]
+    _input_ranges: Optional[list[tuple[Any, Any]]]
+    _range_corners: list[tuple[Any, ...]]
+    _inputset_size: int
+    _reservoir_random: random.Random
+    _unmeasured_samples: list[Any]
+
     _is_direct: bool
     _parameter_values: dict[str, ValueDescription]
     _trace_wires: Optional[set["Wire"]]
@@ -100,6 +117,12 @@ class FunctionDef:
         }
         self.inputset = []
         self.graph = None
+        self._bounds = None
+        self._input_ranges = None
+        self._range_corners = []
+        self._inputset_size = 0
+        self._reservoir_random = random.Random(0)  # noqa: S311
+        self._unmeasured_samples = []
         self._is_direct = False
         self._parameter_values = {}
         self.location = (
@@ -144,16 +167,18 @@ class FunctionDef:
             )
         }
 
-        self.graph = Tracer.trace(self.function, parameters, location=self.location)
+        with profile_phase("tracing", self.name, self._node_count):
+            self.graph = Tracer.trace(self.function, parameters, location=self.location)
         if artifacts is not None:
             artifacts.add_graph("initial", self.graph)
 
-        fuse(self.graph, artifacts)
+        with profile_phase("fusing", self.name, self._node_count):
+            fuse(self.graph, artifacts)
 
     def evaluate(
         self,
         action: str,
-        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]],
+        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]],
         configuration: Configuration,
         artifacts: FunctionDebugArtifacts,
     ):
@@ -164,8 +189,9 @@ class FunctionDef:
             action (str):
                 action being performed (e.g., "trace", "compile")
 
-            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple], Mapping[str, Range]]]):
                 optional inputset to extend accumulated inputset before bounds measurement
+                or ranges of each parameter to propagate through the graph without sampling
 
             configuration (Configuration):
                 configuration to be used
@@ -175,51 +201,63 @@ class FunctionDef:
         """
 
         if self._is_direct:
-            self.graph = Tracer.trace(
-                self.function,
-                self._parameter_values,
-                is_direct=True,
-                location=self.location,
-            )
+            with profile_phase("tracing", self.name, self._node_count):
+                self.graph = Tracer.trace(
+                    self.function,
+                    self._parameter_values,
+                    is_direct=True,
+                    location=self.location,
+                )
             artifacts.add_graph("initial", self.graph)  # pragma: no cover
-            fuse(
-                self.graph,
-                artifacts,
-            )
+            with profile_phase("fusing", self.name, self._node_count):
+                fuse(
+                    self.graph,
+                    artifacts,
+                )
             artifacts.add_graph("final", self.graph)  # pragma: no cover
             return
 
+        if isinstance(inputset, Mapping):
+            inputset = self._declare_ranges(inputset)
+
+        if configuration.stream_inputset:
+            self._evaluate_streaming(action, inputset, configuration, artifacts)
+            artifacts.add_graph("final", self.graph)
+            return
+
+        self._extend_inputset(inputset, configuration)
+        self._measure(action, artifacts)
+
+    def _extend_inputset(
+        self,
+        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]],
+        configuration: Configuration,
+    ):
+        """
+        Extend the accumulated inputset, and adjust rounders and truncators with it if enabled.
+        """
+
+        # samples of direct calls are only added to the inputset once it's measured
+        self.inputset.extend(self._unmeasured_samples)
+        self._unmeasured_samples = []
+
         if inputset is not None:
             previous_inputset_length = len(self.inputset)
             for index, sample in enumerate(iter(inputset)):
                 self.inputset.append(sample)
 
-                if not isinstance(sample, tuple):
-                    sample = (sample,)
-
-                if len(sample) != len(self.parameter_encryption_statuses):
+                try:
+                    self._check_sample(index, sample)
+                except ValueError:
                     self.inputset = self.inputset[:previous_inputset_length]
+                    raise
 
-                    expected = (
-                        "a single value"
-                        if len(self.parameter_encryption_statuses) == 1
-                        else f"a tuple of {len(self.parameter_encryption_statuses)} values"
-                    )
-                    actual = (
-                        "a single value" if len(sample) == 1 else f"a tuple of {len(sample)} values"
-                    )
-
-                    message = (
-                        f"Input #{index} of your inputset is not well formed "
-                        f"(expected {expected} got {actual})"
-                    )
-                    raise ValueError(message)
+        self._auto_adjust(configuration)
 
-        if configuration.auto_adjust_rounders:
-            AutoRounder.adjust(self.function, self.inputset)
-
-        if configuration.auto_adjust_truncators:
-            AutoTruncator.adjust(self.function, self.inputset)
+    def _measure(self, action: str, artifacts: FunctionDebugArtifacts):
+        """
+        Trace the function if it's not traced yet, and measure bounds over the accumulated inputset.
+        """
 
         if self.graph is None:
             try:
@@ -234,11 +272,241 @@ class FunctionDef:
             self.trace(first_sample, artifacts)
             assert self.graph is not None
 
-        bounds = self.graph.measure_bounds(self.inputset)
-        self.graph.update_with_bounds(bounds)
+        with profile_phase("bound_measurement", self.name, self._node_count):
+            bounds = self._with_range_bounds(self.graph.measure_bounds(self.inputset))
+            self.graph.update_with_bounds(bounds)
+        self._bounds = bounds
 
         artifacts.add_graph("final", self.graph)
 
+    def _evaluate_streaming(
+        self,
+        action: str,
+        inputset: Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]],
+        configuration: Configuration,
+        artifacts: FunctionDebugArtifacts,
+    ):
+        """
+        Measure bounds in a single pass over the inputset, without accumulating it.
+
+        Bounds of the new samples are merged with the bounds measured previously,
+        and only a reservoir sampled subset of the samples is kept (in `self.inputset`)
+        when automatic adjustment of rounders or truncators needs to go over the inputset again.
+        """
+
+        auto_adjust = configuration.auto_adjust_rounders or configuration.auto_adjust_truncators
+
+        previous_reservoir = list(self.inputset)
+        previous_inputset_size = self._inputset_size
+
+        try:
+            if auto_adjust:
+                for sample in self._unmeasured_samples:
+                    self._sample_into_reservoir(sample, configuration.inputset_reservoir_size)
+
+            samples: Iterator[Any] = iter(())
+            if inputset is not None:
+                if auto_adjust:
+                    if iter(inputset) is inputset:
+                        message = (
+                            "Automatic adjustment of rounders and truncators with streamed "
+                            "inputsets requires an inputset that can be iterated multiple times "
+                            "(e.g., a list or a range) but an iterator is provided"
+                        )
+                        raise ValueError(message)
+
+                    for _ in self._stream(inputset, configuration.inputset_reservoir_size):
+                        pass
+                    samples = iter(inputset)
+                else:
+                    samples = self._stream(inputset, reservoir_size=None)
+
+            self._auto_adjust(configuration)
+
+            samples = chain(self._unmeasured_samples, samples)
+
+            if self.graph is None:
+                try:
+                    first_sample = next(samples)
+                except StopIteration as error:
+                    message = (
+                        f"{action} function '{self.function.__name__}' "
+                        f"without an inputset is not supported"
+                    )
+                    raise RuntimeError(message) from error
+
+                self.trace(first_sample, artifacts)
+                assert self.graph is not None
+
+                samples = chain([first_sample], samples)
+
+            if self._bounds is not None and any(
+                node not in self._bounds for node in self.graph.graph.nodes()
+            ):
+                message = (
+                    f"Bounds of function '{self.function.__name__}' cannot be extended "
+                    f"with a streamed inputset after it's compiled, "
+                    f"please reset the compiler and provide the whole inputset"
+                )
+                raise RuntimeError(message)
+
+            with profile_phase("bound_measurement", self.name, self._node_count):
+                bounds = self._with_range_bounds(self.graph.measure_bounds(samples))
+
+        except Exception:
+            self.inputset = previous_reservoir
+            self._inputset_size = previous_inputset_size
+            raise
+
+        if self._bounds is not None:
+            bounds = self._merge_bounds(bounds, self._bounds)
+
+        self.graph.update_with_bounds(bounds)
+        self._bounds = bounds
+        self._unmeasured_samples = []
+
+    def _auto_adjust(self, configuration: Configuration):
+        """
+        Adjust rounders and truncators of the function, if enabled in the configuration.
+        """
+
+        rounders = configuration.auto_adjust_rounders
+        truncators = configuration.auto_adjust_truncators
+
+        if rounders or truncators:
+            # rounders and truncators are adjusted together, in a single evaluation when possible
+            with profile_phase("auto_adjustment", self.name):
+                adjust(self.function, self.inputset, rounders=rounders, truncators=truncators)
+
+    def _node_count(self) -> Optional[int]:
+        """
+        Get the number of nodes in the graph of the function, if it's traced.
+        """
+
+        return len(self.graph.query_nodes()) if self.graph is not None else None
+
+    def _declare_ranges(self, ranges: Mapping[str, Range]) -> list[tuple]:
+        """
+        Declare ranges of the parameters, and get the samples at their corners.
+        """
+
+        parameters = list(self.parameter_encryption_statuses)
+        if set(ranges) != set(parameters) or any(
+            not isinstance(spec, (Interval, Corners)) for spec in ranges.values()
+        ):
+            message = (
+                f"Ranges of function '{self.function.__name__}' should be "
+                f"an Interval or Corners for each of its parameters {parameters} "
+                f"but got {dict(ranges)}"
+            )
+            raise ValueError(message)
+
+        input_ranges = [ranges[parameter].bounds() for parameter in parameters]
+        if self._input_ranges is not None:
+            input_ranges = [
+                (min(minimum, previous_minimum), max(maximum, previous_maximum))
+                for (minimum, maximum), (previous_minimum, previous_maximum) in zip(
+                    input_ranges, self._input_ranges
+                )
+            ]
+
+        corners = list(product(*(ranges[parameter].corners() for parameter in parameters)))
+
+        self._input_ranges = input_ranges
+        self._range_corners.extend(corners)
+
+        return corners
+
+    def _with_range_bounds(
+        self,
+        bounds: dict[Node, dict[str, Union[np.integer, np.floating]]],
+    ) -> dict[Node, dict[str, Union[np.integer, np.floating]]]:
+        """
+        Extend measured bounds with the bounds propagated from the declared ranges.
+        """
+
+        if self._input_ranges is None:
+            return bounds
+
+        assert self.graph is not None
+        range_bounds = self.graph.measure_bounds_from_ranges(
+            self._input_ranges,
+            self._range_corners,
+        )
+        return self._merge_bounds(bounds, range_bounds)
+
+    @staticmethod
+    def _merge_bounds(
+        bounds: dict[Node, dict[str, Union[np.integer, np.floating]]],
+        other: dict[Node, dict[str, Union[np.integer, np.floating]]],
+    ) -> dict[Node, dict[str, Union[np.integer, np.floating]]]:
+        """
+        Merge two sets of bounds.
+        """
+
+        result = dict(bounds)
+        for node, node_bounds in other.items():
+            if node not in result:
+                result[node] = node_bounds
+            else:
+                result[node] = {
+                    "min": np.minimum(result[node]["min"], node_bounds["min"]),
+                    "max": np.maximum(result[node]["max"], node_bounds["max"]),
+                }
+        return result
+
+    def _stream(
+        self,
+        inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]],
+        reservoir_size: Optional[int],
+    ) -> Iterator[Any]:
+        """
+        Iterate over an inputset, checking its samples and sampling them into the reservoir.
+        """
+
+        for index, sample in enumerate(inputset):
+            self._check_sample(index, sample)
+
+            if reservoir_size is not None:
+                self._sample_into_reservoir(sample, reservoir_size)
+
+            yield sample
+
+    def _sample_into_reservoir(self, sample: Any, reservoir_size: int):
+        """
+        Add a sample of a streamed inputset to the reservoir, replacing a random one once full.
+        """
+
+        self._inputset_size += 1
+        if len(self.inputset) < reservoir_size:
+            self.inputset.append(sample)
+        else:
+            position = self._reservoir_random.randrange(self._inputset_size)
+            if position < reservoir_size:
+                self.inputset[position] = sample
+
+    def _check_sample(self, index: int, sample: Any):
+        """
+        Check that a sample of an inputset has the expected number of values.
+        """
+
+        if not isinstance(sample, tuple):
+            sample = (sample,)
+
+        if len(sample) != len(self.parameter_encryption_statuses):
+            expected = (
+                "a single value"
+                if len(self.parameter_encryption_statuses) == 1
+                else f"a tuple of {len(self.parameter_encryption_statuses)} values"
+            )
+            actual = "a single value" if len(sample) == 1 else f"a tuple of {len(sample)} values"
+
+            message = (
+                f"Input #{index} of your inputset is not well formed "
+                f"(expected {expected} got {actual})"
+            )
+            raise ValueError(message)
+
     def __call__(
         self,
         *args: Any,
@@ -271,7 +539,7 @@ class FunctionDef:
             self.trace(traced_inputs)
             assert self.graph is not None
 
-        self.inputset.append(traced_inputs)
+        self._unmeasured_samples.append(traced_inputs)
 
         if isinstance(traced_inputs, tuple):
             raw_outputs = self.graph(*traced_inputs)
@@ -357,7 +625,10 @@ class ModuleCompiler:
     def compile(
         self,
         inputsets: Optional[
-            dict[str, Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]]]]]
+            dict[
+                str,
+                Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]],
+            ]
         ] = None,
         configuration: Optional[Configuration] = None,
         module_artifacts: Optional[ModuleDebugArtifacts] = None,
@@ -369,6 +640,7 @@ class ModuleCompiler:
         Args:
             inputsets (Optional[Dict[str, Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]]):
                 optional inputsets to extend accumulated inputsets before bounds measurement
+                (or ranges of the parameters of the functions, see `Compiler.compile`)
 
             configuration(Optional[Configuration], default = None):
                 configuration to use
@@ -398,55 +670,58 @@ class ModuleCompiler:
 
         dbg = DebugManager(configuration)
 
+        profile = CompilationProfile()
+        module_artifacts.add_compilation_profile(profile)
+
         try:
-            # Trace and fuse the functions
-            for name, function in self.functions.items():
-                inputset = inputsets[name] if inputsets is not None else None
-                function_artifacts = module_artifacts.functions[name]
-                function.evaluate("Compiling", inputset, configuration, function_artifacts)
-                assert function.graph is not None
-                dbg.debug_computation_graph(name, function.graph)
+            with profile.activate():
+                # Trace and fuse the functions
+                self._evaluate(inputsets, configuration, module_artifacts, profile)
+                for name, function in self.functions.items():
+                    assert function.graph is not None
+                    dbg.debug_computation_graph(name, function.graph)
 
-            # Convert the graphs to an mlir module
-            mlir_context = self.compilation_context.mlir_context()
-            graphs = {}
+                # Convert the graphs to an mlir module
+                mlir_context = self.compilation_context.mlir_context()
+                graphs = {}
 
-            for name, function in self.functions.items():
-                assert function.graph is not None
-                graphs[name] = function.graph
+                for name, function in self.functions.items():
+                    assert function.graph is not None
+                    graphs[name] = function.graph
 
-            # pylint: disable=protected-access
-            mlir_module = GraphConverter(
-                configuration,
-                self.composition.get_rules_iter(
-                    list(filter(None, [f.graph for f in self.functions.values()]))
-                ),
-            ).convert_many(graphs, mlir_context)
-            mlir_str = str(mlir_module).strip()
-            dbg.debug_mlir(mlir_str)
-            module_artifacts.add_mlir_to_compile(mlir_str)
-
-            # Debug some function informations
-            for name, function in self.functions.items():
-                dbg.debug_bit_width_constaints(name, function.graph)
-                dbg.debug_bit_width_assignments(name, function.graph)
-                dbg.debug_assigned_graph(name, function.graph)
-
-            # Compile to a module!
-            with dbg.debug_table("Optimizer", activate=dbg.show_optimizer()):
                 # pylint: disable=protected-access
-                output = FheModule(
-                    graphs,
-                    mlir_module,
-                    self.compilation_context,
+                mlir_module = GraphConverter(
                     configuration,
                     self.composition.get_rules_iter(
                         list(filter(None, [f.graph for f in self.functions.values()]))
                     ),
-                )
-                module_artifacts.add_execution_runtime(output.execution_runtime)
+                ).convert_many(graphs, mlir_context)
+                mlir_str = str(mlir_module).strip()
+                dbg.debug_mlir(mlir_str)
+                module_artifacts.add_mlir_to_compile(mlir_str)
+
+                # Debug some function informations
+                for name, function in self.functions.items():
+                    dbg.debug_bit_width_constaints(name, function.graph)
+                    dbg.debug_bit_width_assignments(name, function.graph)
+                    dbg.debug_assigned_graph(name, function.graph)
+
+                # Compile to a module!
+                with dbg.debug_table("Optimizer", activate=dbg.show_optimizer()):
+                    # pylint: disable=protected-access
+                    output = FheModule(
+                        graphs,
+                        mlir_module,
+                        self.compilation_context,
+                        configuration,
+                        self.composition.get_rules_iter(
+                            list(filter(None, [f.graph for f in self.functions.values()]))
+                        ),
+                        compilation_profile=profile,
+                    )
+                    module_artifacts.add_execution_runtime(output.execution_runtime)
 
-            dbg.debug_statistics(output)
+                dbg.debug_statistics(output)
 
         except Exception:  # pragma: no cover
             # this branch is reserved for unexpected issues and hence it shouldn't be tested
@@ -468,8 +743,124 @@ class ModuleCompiler:
 
     # pylint: enable=too-many-branches,too-many-statements
 
+    def _evaluate(
+        self,
+        inputsets: Optional[
+            dict[
+                str,
+                Optional[Union[Iterable[Any], Iterable[tuple[Any, ...]], Mapping[str, Range]]],
+            ]
+        ],
+        configuration: Configuration,
+        module_artifacts: ModuleDebugArtifacts,
+        profile: CompilationProfile,
+    ):
+        """
+        Evaluate the functions of the module, in worker processes if enabled in the configuration.
+
+        Inputsets are accumulated and rounders and truncators are adjusted in this process,
+        as they are stored in the functions, and only tracing, fusing and bound measurement
+        happen in the workers, which send the resulting graphs and bounds back.
+        """
+
+        parallel = (
+            configuration.parallel_function_evaluation
+            and not configuration.stream_inputset
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+
+        pending = []
+        for name, function in self.functions.items():
+            inputset = inputsets[name] if inputsets is not None else None
+            function_artifacts = module_artifacts.functions[name]
+
+            # pylint: disable=protected-access
+            if not parallel or function._is_direct:
+                function.evaluate("Compiling", inputset, configuration, function_artifacts)
+                continue
+
+            if isinstance(inputset, Mapping):
+                inputset = function._declare_ranges(inputset)
+            function._extend_inputset(inputset, configuration)
+            # pylint: enable=protected-access
+
+            pending.append(name)
+
+        if len(pending) == 0:
+            return
+
+        if len(pending) == 1:
+            # pylint: disable-next=protected-access
+            self.functions[pending[0]]._measure("Compiling", module_artifacts.functions[pending[0]])
+            return
+
+        workers = configuration.function_evaluation_workers or min(
+            len(pending), os.cpu_count() or 1
+        )
+
+        # workers are forked, so initializer arguments are inherited instead of being pickled
+        # and workers can access the functions without pickling them
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_set_evaluated_functions,
+            initargs=(self.functions,),
+        )
+        with profile_phase("parallel_function_evaluation"), executor:
+            futures = {
+                name: executor.submit(_measure_in_worker, name, profile.origin) for name in pending
+            }
+
+            for name, future in futures.items():
+                function = self.functions[name]
+                function_artifacts = module_artifacts.functions[name]
+
+                try:
+                    graph, bounds, worker_artifacts, worker_profile = future.result()
+                except Exception:  # pylint: disable=broad-except
+                    # the function cannot be evaluated in a worker
+                    # (e.g., its graph cannot be pickled, or it has an invalid inputset)
+                    # so it's evaluated here, which raises the error if there is one
+                    # pylint: disable-next=protected-access
+                    function._measure("Compiling", function_artifacts)
+                    continue
+
+                function.graph = graph
+                function._bounds = bounds  # pylint: disable=protected-access
+                function_artifacts.merge(worker_artifacts)
+                profile.merge(worker_profile)
+
     def __getattr__(self, item) -> FunctionDef:
         if item not in list(self.functions.keys()):
             error = f"No attribute {item}"
             raise AttributeError(error)
         return self.functions[item]
+
+
+def _set_evaluated_functions(functions: dict[str, FunctionDef]):
+    """
+    Set the functions of the module being evaluated when a worker process starts.
+    """
+
+    EVALUATED_FUNCTIONS.clear()
+    EVALUATED_FUNCTIONS.update(functions)
+
+
+def _measure_in_worker(
+    name: str,
+    origin: float,
+) -> tuple[Graph, Any, FunctionDebugArtifacts, CompilationProfile]:
+    """
+    Trace and measure the bounds of a function of the module in a worker process.
+    """
+
+    function = EVALUATED_FUNCTIONS[name]
+
+    artifacts = FunctionDebugArtifacts()
+    profile = CompilationProfile(origin)
+
+    with profile.activate():
+        function._measure("Compiling", artifacts)  # pylint: disable=protected-access
+
+    assert function.graph is not None
+    return function.graph, function._bounds, artifacts, profile  # pylint: disable=protected-access
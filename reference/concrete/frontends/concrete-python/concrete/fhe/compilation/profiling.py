@@ -0,0 +1,342 @@
+"""
+Declaration of `CompilationProfile` class, to record where compilation time and memory go.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # `resource` is not available on Windows
+    resource = None  # type: ignore
+
+profiling_context = threading.local()
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Get the peak resident set size of the process so far.
+
+    Returns:
+        Optional[int]:
+            peak resident set size in bytes, or None if it cannot be measured on the platform
+    """
+
+    if resource is None:  # pragma: no cover
+        return None
+
+    maximum_resident_set_size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere
+    return maximum_resident_set_size * (1 if sys.platform == "darwin" else 1024)
+
+
+class CompilationPhase(NamedTuple):
+    """
+    Measurements of a phase of the compilation.
+    """
+
+    name: str
+    function: Optional[str]
+    process: int
+    thread: int
+
+    # seconds since the start of the profile
+    start: float
+    duration: float
+
+    # peak resident set size of the process at the end of the phase in bytes
+    peak_rss: Optional[int]
+
+    # number of nodes in the graphs processed by the phase
+    node_count: Optional[int]
+
+
+class CompilationProfile:
+    """
+    CompilationProfile class, to record the duration, the memory and the size of compilation phases.
+    """
+
+    phases: list[CompilationPhase]
+    counters: dict[str, int]
+
+    _origin: float
+    _lock: threading.Lock
+
+    def __init__(self, origin: Optional[float] = None):
+        self.phases = []
+        self.counters = {}
+
+        self._origin = origin if origin is not None else time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def origin(self) -> float:
+        """
+        Get the time the profile started at, in `time.perf_counter` seconds.
+        """
+
+        return self._origin
+
+    @contextmanager
+    def activate(self) -> Iterator["CompilationProfile"]:
+        """
+        Record the phases of the compilation happening within the context to this profile.
+        """
+
+        previous = getattr(profiling_context, "profile", None)
+        profiling_context.profile = self
+        try:
+            yield self
+        finally:
+            profiling_context.profile = previous
+
+    @contextmanager
+    def phase(
+        self,
+        name: str,
+        function: Optional[str] = None,
+        node_count: Optional[Callable[[], Optional[int]]] = None,
+    ) -> Iterator[None]:
+        """
+        Record a phase of the compilation happening within the context.
+
+        Args:
+            name (str):
+                name of the phase
+
+            function (Optional[str], default = None):
+                name of the function the phase is about, if the phase is about a single function
+
+            node_count (Optional[Callable[[], Optional[int]]], default = None):
+                callable to get the number of nodes processed by the phase, once it's done
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+
+            try:
+                count = node_count() if node_count is not None else None
+            except Exception:  # pylint: disable=broad-except  # pragma: no cover
+                count = None
+
+            measurement = CompilationPhase(
+                name=name,
+                function=function,
+                process=os.getpid(),
+                thread=threading.get_ident(),
+                start=start - self._origin,
+                duration=end - start,
+                peak_rss=peak_rss(),
+                node_count=count,
+            )
+            with self._lock:
+                self.phases.append(measurement)
+
+    def count(self, name: str, amount: int = 1):
+        """
+        Increase a counter of the compilation.
+
+        Args:
+            name (str):
+                name of the counter
+
+            amount (int, default = 1):
+                amount to add to the counter
+        """
+
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: "CompilationProfile"):
+        """
+        Add the phases and the counters of another profile to this profile.
+
+        Args:
+            other (CompilationProfile):
+                profile to merge, started at the same origin (e.g., in a worker process)
+        """
+
+        with self._lock:
+            self.phases.extend(other.phases)
+            for name, amount in other.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Get the total duration, the peak memory and the node count of each phase.
+
+        Returns:
+            Dict[str, Any]:
+                summary of the profile, with the phases of the module under "phases",
+                the phases of each function under "functions" and the counters under "counters"
+        """
+
+        def aggregate(phases: list[CompilationPhase]) -> dict[str, dict[str, Any]]:
+            result: dict[str, dict[str, Any]] = {}
+            for phase in phases:
+                if phase.name not in result:
+                    result[phase.name] = {"duration": 0.0, "peak_rss": None, "node_count": None}
+
+                entry = result[phase.name]
+                entry["duration"] += phase.duration
+                if phase.peak_rss is not None:
+                    entry["peak_rss"] = max(entry["peak_rss"] or 0, phase.peak_rss)
+                if phase.node_count is not None:
+                    entry["node_count"] = phase.node_count
+            return result
+
+        function_names = list(
+            dict.fromkeys(phase.function for phase in self.phases if phase.function is not None)
+        )
+        peak_rss_values = [phase.peak_rss for phase in self.phases if phase.peak_rss is not None]
+
+        return {
+            "duration": sum(phase.duration for phase in self.phases),
+            "peak_rss": max(peak_rss_values) if len(peak_rss_values) > 0 else None,
+            "phases": aggregate([phase for phase in self.phases if phase.function is None]),
+            "functions": {
+                name: aggregate([phase for phase in self.phases if phase.function == name])
+                for name in function_names
+            },
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self) -> str:
+        """
+        Get the recorded phases and counters in JSON format.
+
+        Returns:
+            str:
+                JSON object with the recorded phases under "phases", in the order they ended,
+                and the counters under "counters"
+        """
+
+        return json.dumps(
+            {
+                "phases": [phase._asdict() for phase in self.phases],
+                "counters": self.counters,
+            },
+            indent=2,
+        )
+
+    def to_chrome_trace(self) -> str:
+        """
+        Get the recorded phases in Chrome trace event format.
+
+        The result can be loaded in `chrome://tracing` or in Perfetto.
+
+        Returns:
+            str:
+                JSON trace of the recorded phases
+        """
+
+        processes = list(dict.fromkeys(phase.process for phase in self.phases))
+        threads = list(dict.fromkeys((phase.process, phase.thread) for phase in self.phases))
+
+        events = [
+            {
+                "name": phase.name if phase.function is None else f"{phase.function}.{phase.name}",
+                "cat": "compilation",
+                "ph": "X",
+                "ts": phase.start * 1_000_000,
+                "dur": phase.duration * 1_000_000,
+                "pid": processes.index(phase.process),
+                "tid": threads.index((phase.process, phase.thread)),
+                "args": {
+                    "function": phase.function,
+                    "peak_rss": phase.peak_rss,
+                    "node_count": phase.node_count,
+                },
+            }
+            for phase in self.phases
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def export_json(self, path: Union[str, Path]):
+        """
+        Export the recorded phases and counters to a JSON file (see `to_json`).
+
+        Args:
+            path (Union[str, Path]):
+                path of the file to write
+        """
+
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    def export_chrome_trace(self, path: Union[str, Path]):
+        """
+        Export the recorded phases to a Chrome trace file (see `to_chrome_trace`).
+
+        Args:
+            path (Union[str, Path]):
+                path of the file to write
+        """
+
+        Path(path).write_text(self.to_chrome_trace(), encoding="utf-8")
+
+
+@contextmanager
+def profile_phase(
+    name: str,
+    function: Optional[str] = None,
+    node_count: Optional[Callable[[], Optional[int]]] = None,
+) -> Iterator[None]:
+    """
+    Record a phase of the compilation to the active profile, if there is one.
+
+    Args:
+        name (str):
+            name of the phase
+
+        function (Optional[str], default = None):
+            name of the function the phase is about, if the phase is about a single function
+
+        node_count (Optional[Callable[[], Optional[int]]], default = None):
+            callable to get the number of nodes processed by the phase, once it's done
+    """
+
+    profile = getattr(profiling_context, "profile", None)
+    if profile is None:
+        yield
+        return
+
+    with profile.phase(name, function, node_count):
+        yield
+
+
+def profile_count(name: str, amount: int = 1):
+    """
+    Increase a counter of the active profile, if there is one.
+
+    Args:
+        name (str):
+            name of the counter
+
+        amount (int, default = 1):
+            amount to add to the counter
+    """
+
+    profile = getattr(profiling_context, "profile", None)
+    if profile is not None:
+        profile.count(name, amount)
@@ -0,0 +1,109 @@
+"""
+Declaration of `Interval` and `Corners` classes, to declare ranges of parameters.
+"""
+
+from typing import Any, Union
+
+import numpy as np
+
+
+class Interval:
+    """
+    Interval class, to declare the range of a parameter using its minimum and maximum.
+
+    e.g., `Interval(0, 999_999)` means the parameter is a scalar between 0 and 999_999
+    """
+
+    minimum: Union[int, float]
+    maximum: Union[int, float]
+    shape: tuple[int, ...]
+
+    def __init__(
+        self,
+        minimum: Union[int, float],
+        maximum: Union[int, float],
+        shape: tuple[int, ...] = (),
+    ):
+        if minimum > maximum:
+            message = f"Interval cannot have its minimum {minimum} above its maximum {maximum}"
+            raise ValueError(message)
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.shape = tuple(shape)
+
+    def bounds(self) -> tuple[Any, Any]:
+        """
+        Get the minimum and the maximum of the range.
+
+        Returns:
+            Tuple[Any, Any]:
+                minimum and maximum of the range
+        """
+
+        return self.minimum, self.maximum
+
+    def corners(self) -> list[Any]:
+        """
+        Get the values at the corners of the range.
+
+        Returns:
+            List[Any]:
+                values at the corners of the range
+        """
+
+        values = [self.minimum] if self.minimum == self.maximum else [self.minimum, self.maximum]
+        return [value if self.shape == () else np.full(self.shape, value) for value in values]
+
+    def __repr__(self) -> str:
+        shape = "" if self.shape == () else f", shape={self.shape}"
+        return f"Interval({self.minimum}, {self.maximum}{shape})"
+
+
+class Corners:
+    """
+    Corners class, to declare the range of a parameter using the values at its corners.
+
+    e.g., `Corners(0, 50, 999_999)` means the parameter is a scalar between 0 and 999_999
+    and operations which are not monotonic are expected to reach their extremes on these values
+    """
+
+    values: list[Any]
+
+    def __init__(self, *values: Any):
+        if len(values) == 0:
+            message = "Corners cannot be declared without values"
+            raise ValueError(message)
+
+        self.values = list(values)
+
+    def bounds(self) -> tuple[Any, Any]:
+        """
+        Get the minimum and the maximum of the range.
+
+        Returns:
+            Tuple[Any, Any]:
+                minimum and maximum of the range
+        """
+
+        return (
+            min(np.min(value) for value in self.values),
+            max(np.max(value) for value in self.values),
+        )
+
+    def corners(self) -> list[Any]:
+        """
+        Get the values at the corners of the range.
+
+        Returns:
+            List[Any]:
+                values at the corners of the range
+        """
+
+        return list(self.values)
+
+    def __repr__(self) -> str:
+        return f"Corners({', '.join(repr(value) for value in self.values)})"
+
+
+Range = Union[Interval, Corners]
@@ -0,0 +1,328 @@
+"""
+Declaration of `FheScheduler` class, to bound and prioritize background evaluations.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+SHARED_SCHEDULERS: dict[tuple[Optional[int], Optional[int], bool], "FheScheduler"] = {}
+SHARED_SCHEDULERS_LOCK = threading.Lock()
+
+
+class FheScheduler:
+    """
+    FheScheduler class, to run background evaluations on a bounded number of threads by priority.
+
+    Evaluations are queued and run by at most `max_in_flight` threads, highest priority first,
+    and in submission order within a priority. When the queue is full, submissions either block
+    until an evaluation starts or are rejected.
+    """
+
+    max_in_flight: int
+    max_queue_size: Optional[int]
+    reject_when_full: bool
+
+    _queue: list[tuple[int, int, float, Future, Callable, tuple]]
+    _sequence: Iterator[int]
+    _lock: threading.Lock
+    _not_empty: threading.Condition
+    _not_full: threading.Condition
+    _workers: list[threading.Thread]
+    _idle_workers: int
+    _shutdown: bool
+
+    _in_flight: int
+    _max_queue_depth: int
+    _submitted: int
+    _completed: int
+    _cancelled: int
+    _rejected: int
+    _total_wait_time: float
+    _max_wait_time: float
+
+    _waiter_loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        reject_when_full: bool = False,
+    ):
+        if max_in_flight is None:
+            # same default as `concurrent.futures.ThreadPoolExecutor`
+            max_in_flight = min(32, (os.cpu_count() or 1) + 4)
+
+        if max_in_flight < 1:
+            message = (
+                f"Maximum number of evaluations in flight must be positive (got {max_in_flight})"
+            )
+            raise ValueError(message)
+
+        if max_queue_size is not None and max_queue_size < 1:
+            message = f"Maximum queue size must be positive (got {max_queue_size})"
+            raise ValueError(message)
+
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self.reject_when_full = reject_when_full
+
+        self._queue = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._workers = []
+        self._idle_workers = 0
+        self._shutdown = False
+
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+        self._waiter_loop = None
+
+    @staticmethod
+    def shared(
+        max_in_flight: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        reject_when_full: bool = False,
+    ) -> "FheScheduler":
+        """
+        Get the scheduler of the process with the given options, creating it on first use.
+
+        Modules configured with the same options share a scheduler, so the number of evaluations
+        in flight is bounded across all of them.
+
+        Args:
+            max_in_flight (Optional[int], default = None):
+                maximum number of evaluations running at the same time
+
+            max_queue_size (Optional[int], default = None):
+                maximum number of evaluations waiting to run, unbounded if not provided
+
+            reject_when_full (bool, default = False):
+                whether to reject submissions when the queue is full instead of blocking
+
+        Returns:
+            FheScheduler:
+                scheduler of the process with the given options
+        """
+
+        key = (max_in_flight, max_queue_size, reject_when_full)
+        with SHARED_SCHEDULERS_LOCK:
+            scheduler = SHARED_SCHEDULERS.get(key)
+            if scheduler is None or scheduler._shutdown:  # pylint: disable=protected-access
+                scheduler = FheScheduler(max_in_flight, max_queue_size, reject_when_full)
+                SHARED_SCHEDULERS[key] = scheduler
+            return scheduler
+
+    def submit(
+        self,
+        function: Callable,
+        *args: Any,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue an evaluation.
+
+        Args:
+            function (Callable):
+                function to run
+
+            *args (Any):
+                arguments of the function
+
+            priority (int, default = 0):
+                priority of the evaluation, evaluations with higher priorities run first
+
+            timeout (Optional[float], default = None):
+                maximum time to wait for the queue to have room in seconds, forever if not provided
+                (ignored when submissions are rejected when the queue is full)
+
+        Returns:
+            Future:
+                future of the result of the function
+
+        Raises:
+            RuntimeError:
+                if the scheduler is shut down, or if the queue is full and `reject_when_full` is set
+
+            TimeoutError:
+                if the queue did not have room before `timeout`
+        """
+
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                message = "Cannot submit evaluations to a scheduler which is shut down"
+                raise RuntimeError(message)
+
+            if self._is_full():
+                if self.reject_when_full:
+                    self._rejected += 1
+                    message = (
+                        f"Cannot submit evaluations to a scheduler with a full queue "
+                        f"({len(self._queue)} evaluations waiting)"
+                    )
+                    raise RuntimeError(message)
+
+                if not self._not_full.wait_for(
+                    lambda: not self._is_full() or self._shutdown, timeout
+                ):
+                    message = f"Scheduler queue did not have room in {timeout} seconds"
+                    raise TimeoutError(message)
+
+                if self._shutdown:
+                    message = "Cannot submit evaluations to a scheduler which is shut down"
+                    raise RuntimeError(message)
+
+            entry = (-priority, next(self._sequence), time.perf_counter(), future, function, args)
+            heapq.heappush(self._queue, entry)
+
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+
+            if self._idle_workers < len(self._queue) and len(self._workers) < self.max_in_flight:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"fhe-scheduler-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+            else:
+                self._not_empty.notify()
+
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stop accepting evaluations and stop the threads once the queue is empty.
+
+        Args:
+            wait (bool, default = True):
+                whether to wait for the threads to stop
+
+            cancel_pending (bool, default = False):
+                whether to cancel the evaluations which are still waiting to run
+        """
+
+        with self._lock:
+            self._shutdown = True
+            if cancel_pending:
+                for _, _, _, future, _, _ in self._queue:
+                    if future.cancel():
+                        self._cancelled += 1
+                self._queue.clear()
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            workers = list(self._workers)
+
+        if self._waiter_loop is not None:
+            self._waiter_loop.call_soon_threadsafe(self._waiter_loop.stop)
+
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    @property
+    def waiter_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop waiting for the arguments of evaluations, starting it on first use.
+
+        Returns:
+            asyncio.AbstractEventLoop:
+                event loop running on a daemon thread
+        """
+
+        with self._lock:
+            if self._waiter_loop is None:
+                loop = asyncio.new_event_loop()
+
+                def loop_thread():
+                    asyncio.set_event_loop(loop)
+                    loop.run_forever()
+
+                threading.Thread(target=loop_thread, name="fhe-waiter", daemon=True).start()
+                self._waiter_loop = loop
+
+            return self._waiter_loop
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """
+        Get the statistics of the scheduler.
+
+        Returns:
+            Dict[str, Any]:
+                current queue depth and number of evaluations in flight,
+                counts of evaluations since the creation of the scheduler,
+                and time evaluations waited in the queue in seconds
+        """
+
+        with self._lock:
+            started = self._in_flight + self._completed
+            return {
+                "max_in_flight": self.max_in_flight,
+                "max_queue_size": self.max_queue_size,
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+                "total_wait_time": self._total_wait_time,
+                "mean_wait_time": self._total_wait_time / started if started != 0 else 0.0,
+                "max_wait_time": self._max_wait_time,
+            }
+
+    def _is_full(self) -> bool:
+        return self.max_queue_size is not None and len(self._queue) >= self.max_queue_size
+
+    def _work(self):
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+                self._not_empty.wait_for(lambda: len(self._queue) != 0 or self._shutdown)
+                self._idle_workers -= 1
+
+                if len(self._queue) == 0:
+                    # shut down and nothing left to run
+                    return
+
+                _, _, submitted_at, future, function, args = heapq.heappop(self._queue)
+                self._not_full.notify()
+
+                if not future.set_running_or_notify_cancel():
+                    self._cancelled += 1
+                    continue
+
+                wait_time = time.perf_counter() - submitted_at
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+                self._in_flight += 1
+
+            try:
+                result = function(*args)
+            except BaseException as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._completed += 1
@@ -7,6 +7,7 @@ Declaration of `Server` class.
 import json
 import shutil
 import tempfile
+import threading
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional, Union
@@ -17,6 +18,7 @@ import jsonpickle
 import numpy as np
 from concrete.compiler import (
     Backend,
+    ClientCircuit,
     ClientProgram,
     CompilationContext,
     CompilationOptions,
@@ -29,6 +31,7 @@ from concrete.compiler import (
     Parameter,
     PrimitiveOperation,
     ProgramInfo,
+    ServerCircuit,
     ServerProgram,
 )
 from concrete.compiler import Value as Value_
@@ -36,6 +39,7 @@ from concrete.compiler import lookup_runtime_lib, set_compiler_logging, set_llvm
 from mlir.ir import Module as MlirModule
 
 from ..tfhers.specs import TFHERSClientSpecs
+from .cache import CompilationCache
 from .composition import CompositionClause, CompositionRule
 from .configuration import (
     DEFAULT_GLOBAL_P_ERROR,
@@ -45,8 +49,9 @@ from .configuration import (
     ParameterSelectionStrategy,
 )
 from .evaluation_keys import EvaluationKeys
+from .profiling import profile_phase
 from .specs import ClientSpecs
-from .utils import Lazy, friendly_type_format
+from .utils import friendly_type_format
 from .value import Value
 
 # pylint: enable=import-error,no-member,no-name-in-module
@@ -64,6 +69,12 @@ class Server:
     _composition_rules: Optional[list[CompositionRule]]
     _tfhers_specs: Optional[TFHERSClientSpecs]
 
+    _program_info: Optional[ProgramInfo]
+    _server_program: Optional[ServerProgram]
+    _server_program_lock: threading.Lock
+    _thread_circuits: threading.local
+    _plaintext_inputs: dict[str, list[bool]]
+
     def __init__(
         self,
         library: Library,
@@ -77,6 +88,12 @@ class Server:
         self._composition_rules = composition_rules
         self._tfhers_specs = tfhers_specs
 
+        self._program_info = None
+        self._server_program = None
+        self._server_program_lock = threading.Lock()
+        self._thread_circuits = threading.local()
+        self._plaintext_inputs = {}
+
     @property
     def client_specs(self) -> ClientSpecs:
         """
@@ -197,34 +214,63 @@ class Server:
 
         options.set_security_level(configuration.security_level)
 
-        try:
-            if configuration.compiler_debug_mode:  # pragma: no cover
-                set_llvm_debug_flag(True)
-            if configuration.compiler_verbose_mode:  # pragma: no cover
-                set_compiler_logging(True)
-
-            output_dir = tempfile.mkdtemp()
-            output_dir_path = Path(output_dir)
-
-            compiler = Compiler(
-                str(output_dir_path),
-                lookup_runtime_lib(),
-                generate_shared_lib=True,
-                generate_program_info=True,
-                generate_compilation_feedback=True,
+        cache = None
+        cache_key = None
+        cached_output_dir = None
+        if configuration.compilation_cache_location is not None:
+            cache = CompilationCache(
+                configuration.compilation_cache_location,
+                configuration.compilation_cache_size,
             )
-            if isinstance(mlir, str):
-                library = compiler.compile(mlir, options)
-            else:  # MlirModule
-                assert (
-                    compilation_context is not None
-                ), "must provide compilation context when compiling MlirModule"
-                library = compiler.compile(
-                    mlir._CAPIPtr, options, compilation_context  # pylint: disable=protected-access
-                )
-        finally:
-            set_llvm_debug_flag(False)
-            set_compiler_logging(False)
+            cache_key = CompilationCache.key(
+                str(mlir),
+                configuration,
+                is_simulated,
+                composition_rules,
+            )
+            with profile_phase("compilation_cache_lookup"):
+                cached_output_dir = cache.load(cache_key)
+
+        if cached_output_dir is not None:
+            library = Library(str(cached_output_dir))
+        else:
+            phase = "native_simulation_compilation" if is_simulated else "native_compilation"
+            with profile_phase(phase):
+                try:
+                    if configuration.compiler_debug_mode:  # pragma: no cover
+                        set_llvm_debug_flag(True)
+                    if configuration.compiler_verbose_mode:  # pragma: no cover
+                        set_compiler_logging(True)
+
+                    output_dir = tempfile.mkdtemp()
+                    output_dir_path = Path(output_dir)
+
+                    compiler = Compiler(
+                        str(output_dir_path),
+                        lookup_runtime_lib(),
+                        generate_shared_lib=True,
+                        generate_program_info=True,
+                        generate_compilation_feedback=True,
+                    )
+                    if isinstance(mlir, str):
+                        library = compiler.compile(mlir, options)
+                    else:  # MlirModule
+                        assert (
+                            compilation_context is not None
+                        ), "must provide compilation context when compiling MlirModule"
+                        library = compiler.compile(
+                            mlir._CAPIPtr,  # pylint: disable=protected-access
+                            options,
+                            compilation_context,
+                        )
+                finally:
+                    set_llvm_debug_flag(False)
+                    set_compiler_logging(False)
+
+            if cache is not None:
+                assert cache_key is not None
+                with profile_phase("compilation_cache_store"):
+                    cache.store(cache_key, output_dir_path)
 
         composition_rules = composition_rules if composition_rules else None
 
@@ -400,14 +446,7 @@ class Server:
                 result(s) of evaluation
         """
 
-        if function_name is None:
-            circuits = self.program_info.get_circuits()
-            if len(circuits) == 1:
-                function_name = circuits[0].get_name()
-            else:  # pragma: no cover
-                msg = "The server contains more than one functions. \
-Provide a `function_name` keyword argument to disambiguate."
-                raise TypeError(msg)
+        function_name = self._resolve_function_name(function_name)
 
         if evaluation_keys is None and not self.is_simulated:
             message = "Expected evaluation keys to be provided when not in simulation mode"
@@ -421,44 +460,32 @@ Provide a `function_name` keyword argument to disambiguate."
                 flattened_args.append(arg)
 
         if not self.is_simulated:
+            plaintext_inputs = self._get_plaintext_inputs(function_name)
             for i, arg in enumerate(flattened_args):
                 if arg is None:
                     message = f"Expected argument {i} to be an fhe.Value but it's None"
                     raise ValueError(message)
 
-                if not isinstance(arg, Value):
-                    if (
-                        not self.client_specs.program_info.get_circuit(function_name)
-                        .get_inputs()[i]
-                        .get_type_info()
-                        .is_plaintext()
-                    ):
-                        message = (
-                            f"Expected argument {i} to be an fhe.Value "
-                            f"but it's {friendly_type_format(type(arg))}"
-                        )
-                        raise ValueError(message)
-
-        server_program = ServerProgram(self._library, self.is_simulated)
-        server_circuit = server_program.get_server_circuit(function_name)
-
-        def init_simulated_client_circuit():
-            client_program = ClientProgram.create_simulated(self.client_specs.program_info)
-            return client_program.get_client_circuit(function_name)
+                if not isinstance(arg, Value) and not plaintext_inputs[i]:
+                    message = (
+                        f"Expected argument {i} to be an fhe.Value "
+                        f"but it's {friendly_type_format(type(arg))}"
+                    )
+                    raise ValueError(message)
 
-        simulated_client_circuit = Lazy(init_simulated_client_circuit)
+        server_circuit = self._get_server_circuit(function_name)
 
         unwrapped_args = []
         for i, arg in enumerate(flattened_args):
             if isinstance(arg, Value):
                 unwrapped_args.append(arg._inner)  # pylint: disable=protected-access
-            elif isinstance(arg, list):
-                unwrapped_args.append(
-                    simulated_client_circuit.val.simulate_prepare_input(Value_(np.array(arg)), i)
-                )
             else:
+                simulated_client_circuit = self._get_simulated_client_circuit(function_name)
                 unwrapped_args.append(
-                    simulated_client_circuit.val.simulate_prepare_input(Value_(arg), i)
+                    simulated_client_circuit.simulate_prepare_input(
+                        Value_(np.array(arg) if isinstance(arg, list) else arg),
+                        i,
+                    )
                 )
 
         if self.is_simulated:
@@ -470,6 +497,80 @@ Provide a `function_name` keyword argument to disambiguate."
         result = [Value(r) for r in result]
         return tuple(result) if len(result) > 1 else result[0]
 
+    def _resolve_function_name(self, function_name: Optional[str]) -> str:
+        """
+        Get the name of the function to run, defaulting to the only function of the program.
+        """
+
+        if function_name is not None:
+            return function_name
+
+        circuits = self.program_info.get_circuits()
+        if len(circuits) != 1:  # pragma: no cover
+            msg = "The server contains more than one functions. \
+Provide a `function_name` keyword argument to disambiguate."
+            raise TypeError(msg)
+
+        return circuits[0].get_name()
+
+    def _get_circuits_of_thread(self, kind: str) -> dict:
+        """
+        Get the circuits of a kind used by the current thread.
+
+        Circuits reuse their argument and result buffers across calls, which release the GIL,
+        so each thread gets its own circuits to be able to run concurrently.
+        """
+
+        circuits = getattr(self._thread_circuits, kind, None)
+        if circuits is None:
+            circuits = {}
+            setattr(self._thread_circuits, kind, circuits)
+        return circuits
+
+    def _get_server_circuit(self, function_name: str) -> ServerCircuit:
+        """
+        Get the server circuit of a function for the current thread, loading it on first use.
+        """
+
+        server_circuits = self._get_circuits_of_thread("server")
+
+        server_circuit = server_circuits.get(function_name)
+        if server_circuit is None:
+            with self._server_program_lock:
+                if self._server_program is None:
+                    self._server_program = ServerProgram(self._library, self.is_simulated)
+                server_circuit = self._server_program.get_server_circuit(function_name)
+            server_circuits[function_name] = server_circuit
+        return server_circuit
+
+    def _get_simulated_client_circuit(self, function_name: str) -> ClientCircuit:
+        """
+        Get the simulated client circuit of a function for the current thread, created once.
+        """
+
+        simulated_client_circuits = self._get_circuits_of_thread("simulated_client")
+
+        client_circuit = simulated_client_circuits.get(function_name)
+        if client_circuit is None:
+            client_program = ClientProgram.create_simulated(self.program_info)
+            client_circuit = client_program.get_client_circuit(function_name)
+            simulated_client_circuits[function_name] = client_circuit
+        return client_circuit
+
+    def _get_plaintext_inputs(self, function_name: str) -> list[bool]:
+        """
+        Get whether each input of a function is plaintext, walking the program info on first use.
+        """
+
+        plaintext_inputs = self._plaintext_inputs.get(function_name)
+        if plaintext_inputs is None:
+            plaintext_inputs = [
+                gate.get_type_info().is_plaintext()
+                for gate in self.program_info.get_circuit(function_name).get_inputs()
+            ]
+            self._plaintext_inputs[function_name] = plaintext_inputs
+        return plaintext_inputs
+
     def cleanup(self):
         """
         Cleanup the temporary library output directory.
@@ -483,7 +584,9 @@ Provide a `function_name` keyword argument to disambiguate."
         """
         The program info associated with the server.
         """
-        return self._library.get_program_info()
+        if self._program_info is None:
+            self._program_info = self._library.get_program_info()
+        return self._program_info
 
     @property
     def size_of_secret_keys(self) -> int:
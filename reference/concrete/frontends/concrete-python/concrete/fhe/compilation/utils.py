@@ -5,21 +5,25 @@ Declaration of various functions and constants related to compilation.
 import json
 import os
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, NamedTuple, Optional, TypeVar, Union
 
-import networkx as nx
 import numpy as np
 
 from ..dtypes import Float, Integer, SignedInteger, UnsignedInteger
+from ..internal.utils import LazyModule
 from ..representation import Graph, Node, Operation
 from ..tracing import ScalarAnnotation
 from ..values import ValueDescription
 from .specs import ClientSpecs
 
 if TYPE_CHECKING:
+    import networkx as nx  # pragma: no cover
+
     from .artifacts import FunctionDebugArtifacts  # pragma: no cover
+else:
+    nx = LazyModule("networkx")
 
 # ruff: noqa: ERA001
 
@@ -106,22 +110,26 @@ def inputset(
     return result
 
 
-def validate_input_args(
-    client_specs: ClientSpecs,
-    *args: Optional[Union[int, np.ndarray, list]],
-    function_name: str,
-) -> list[Optional[Union[int, np.ndarray]]]:
-    """Validate input arguments.
+class InputSpec(NamedTuple):
+    """
+    Expected value and range of an input of a function.
+    """
+
+    value: ValueDescription
+    minimum: int
+    maximum: int
+
+
+def get_input_specs(client_specs: ClientSpecs, function_name: str) -> list[InputSpec]:
+    """Get the specs of the inputs of a function.
 
     Args:
         client_specs (ClientSpecs):
             client specification
-        *args (Optional[Union[int, np.ndarray, List]]):
-            argument(s) for evaluation
-        function_name (str): name of the function to verify
+        function_name (str): name of the function
 
     Returns:
-        List[Optional[Union[int, np.ndarray]]]: ordered validated args
+        List[InputSpec]: expected value and range of each input of the function
     """
 
     functions_parameters = json.loads(client_specs.program_info.serialize())["circuits"]
@@ -134,24 +142,9 @@ def validate_input_args(
         raise ValueError(message)
 
     assert "inputs" in client_parameters_json
-    input_specs = client_parameters_json["inputs"]
-    if len(args) != len(input_specs):
-        message = f"Expected {len(input_specs)} inputs but got {len(args)}"
-        raise ValueError(message)
-
-    sanitized_args: dict[int, Optional[Union[int, np.ndarray]]] = {}
-    for index, (arg, spec) in enumerate(zip(args, input_specs)):
-        if arg is None:
-            sanitized_args[index] = None
-            continue
-
-        if isinstance(arg, list):
-            arg = np.array(arg)
-
-        is_valid = isinstance(arg, (int, np.integer)) or (
-            isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.integer)
-        )
 
+    input_specs = []
+    for spec in client_parameters_json["inputs"]:
         if "lweCiphertext" in spec["typeInfo"].keys():
             type_info = spec["typeInfo"]["lweCiphertext"]
             is_encrypted = True
@@ -171,23 +164,70 @@ def validate_input_args(
 
         expected_dtype = SignedInteger(width) if is_signed else UnsignedInteger(width)
         expected_value = ValueDescription(expected_dtype, shape, is_encrypted)
-        if is_valid:
-            expected_min = expected_dtype.min()
-            expected_max = expected_dtype.max()
 
-            if not is_encrypted:
-                # clear integers are signless
-                # (e.g., 8-bit clear integer can be in range -128, 255)
-                expected_min = -(expected_max // 2) - 1
+        expected_min = expected_dtype.min()
+        expected_max = expected_dtype.max()
+
+        if not is_encrypted:
+            # clear integers are signless
+            # (e.g., 8-bit clear integer can be in range -128, 255)
+            expected_min = -(expected_max // 2) - 1
+
+        input_specs.append(InputSpec(expected_value, expected_min, expected_max))
+
+    return input_specs
+
 
+def validate_input_args(
+    client_specs: ClientSpecs,
+    *args: Optional[Union[int, np.ndarray, list]],
+    function_name: str,
+    input_specs: Optional[list[InputSpec]] = None,
+) -> list[Optional[Union[int, np.ndarray]]]:
+    """Validate input arguments.
+
+    Args:
+        client_specs (ClientSpecs):
+            client specification
+        *args (Optional[Union[int, np.ndarray, List]]):
+            argument(s) for evaluation
+        function_name (str): name of the function to verify
+        input_specs (Optional[List[InputSpec]], default = None):
+            specs of the inputs of the function, computed from client specs if not provided
+
+    Returns:
+        List[Optional[Union[int, np.ndarray]]]: ordered validated args
+    """
+
+    if input_specs is None:
+        input_specs = get_input_specs(client_specs, function_name)
+
+    if len(args) != len(input_specs):
+        message = f"Expected {len(input_specs)} inputs but got {len(args)}"
+        raise ValueError(message)
+
+    sanitized_args: dict[int, Optional[Union[int, np.ndarray]]] = {}
+    for index, (arg, spec) in enumerate(zip(args, input_specs)):
+        if arg is None:
+            sanitized_args[index] = None
+            continue
+
+        if isinstance(arg, list):
+            arg = np.array(arg)
+
+        is_valid = isinstance(arg, (int, np.integer)) or (
+            isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.integer)
+        )
+
+        if is_valid:
             actual_min = arg if isinstance(arg, int) else arg.min()
             actual_max = arg if isinstance(arg, int) else arg.max()
             actual_shape = () if isinstance(arg, int) else arg.shape
 
             is_valid = (
-                actual_min >= expected_min
-                and actual_max <= expected_max
-                and actual_shape == expected_value.shape
+                actual_min >= spec.minimum
+                and actual_max <= spec.maximum
+                and actual_shape == spec.value.shape
             )
 
             if is_valid:
@@ -195,16 +235,87 @@ def validate_input_args(
 
         if not is_valid:
             try:
-                actual_value = str(ValueDescription.of(arg, is_encrypted=is_encrypted))
+                actual_value = str(ValueDescription.of(arg, is_encrypted=spec.value.is_encrypted))
             except ValueError:
                 actual_value = type(arg).__name__
-            message = f"Expected argument {index} to be {expected_value} but it's {actual_value}"
+            message = f"Expected argument {index} to be {spec.value} but it's {actual_value}"
             raise ValueError(message)
 
     ordered_sanitized_args = [sanitized_args[i] for i in range(len(sanitized_args))]
     return ordered_sanitized_args
 
 
+def validate_input_batch(
+    client_specs: ClientSpecs,
+    samples: Sequence[Sequence[Optional[Union[int, np.ndarray, list]]]],
+    function_name: str,
+    input_specs: Optional[list[InputSpec]] = None,
+) -> list[list[Optional[Union[int, np.ndarray]]]]:
+    """Validate input arguments of many samples at once.
+
+    Arguments in the same position are stacked and checked together,
+    and samples are only checked one by one to report the first invalid argument.
+
+    Args:
+        client_specs (ClientSpecs):
+            client specification
+        samples (Sequence[Sequence[Optional[Union[int, np.ndarray, List]]]]):
+            argument(s) for evaluation of each sample
+        function_name (str): name of the function to verify
+        input_specs (Optional[List[InputSpec]], default = None):
+            specs of the inputs of the function, computed from client specs if not provided
+
+    Returns:
+        List[List[Optional[Union[int, np.ndarray]]]]: ordered validated args of each sample
+    """
+
+    if input_specs is None:
+        input_specs = get_input_specs(client_specs, function_name)
+
+    def validate_one_by_one():
+        for index, sample in enumerate(samples):
+            try:
+                validate_input_args(
+                    client_specs,
+                    *sample,
+                    function_name=function_name,
+                    input_specs=input_specs,
+                )
+            except ValueError as error:
+                message = f"Sample {index} is invalid: {error}"
+                raise ValueError(message) from error
+
+    if any(len(sample) != len(input_specs) for sample in samples):
+        validate_one_by_one()
+
+    sanitized_samples: list[list[Optional[Union[int, np.ndarray]]]] = [[] for _ in samples]
+    for position, spec in enumerate(input_specs):
+        column = [sample[position] for sample in samples]
+        present = [index for index, arg in enumerate(column) if arg is not None]
+
+        try:
+            stacked = np.array([column[index] for index in present])
+        except ValueError:
+            # arguments have different shapes
+            stacked = np.array([], dtype=object)
+
+        is_valid = (
+            np.issubdtype(stacked.dtype, np.integer)
+            and stacked.shape[1:] == spec.value.shape
+            and (len(present) == 0 or stacked.min() >= spec.minimum)
+            and (len(present) == 0 or stacked.max() <= spec.maximum)
+        )
+        if not is_valid:
+            validate_one_by_one()
+
+        for index, arg in enumerate(column):
+            if arg is not None:
+                arg = int(arg) if spec.value.shape == () else np.asarray(arg)
+            sanitized_samples[index].append(arg)
+
+    return sanitized_samples
+
+
 def fuse(graph: Graph, artifacts: Optional["FunctionDebugArtifacts"] = None):
     """
     Fuse appropriate subgraphs in a graph to a single Operation.Generic node.
@@ -221,6 +332,10 @@ def fuse(graph: Graph, artifacts: Optional["FunctionDebugArtifacts"] = None):
             if there is a subgraph which needs to be fused cannot be fused
     """
 
+    # bodies of loops are fused on their own, as they are separate graphs
+    for node in graph.query_nodes(operation_filter="loop"):
+        fuse(node.properties["kwargs"]["body"])
+
     nx_graph = graph.graph
     processed_terminal_nodes: set[Node] = set()
 
@@ -280,6 +395,7 @@ def fuse(graph: Graph, artifacts: Optional["FunctionDebugArtifacts"] = None):
 
         nx_graph.add_edge(node_before_subgraph, fused_node, input_idx=0)
 
+        graph.invalidate_execution_plan()
         graph.prune_useless_nodes()
         if artifacts is not None:
             artifacts.add_graph("after-fusing", graph)
@@ -10,6 +10,7 @@ from .constant import constant
 from .convolution import conv
 from .hint import hint
 from .identity import identity, refresh
+from .loop import loop
 from .maxpool import maxpool
 from .multivariate import multivariate
 from .ones import one, ones, ones_like
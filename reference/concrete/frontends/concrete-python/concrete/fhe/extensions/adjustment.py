@@ -0,0 +1,194 @@
+"""
+Declaration of `adjust` function, to adjust AutoRounders and AutoTruncators of a function at once.
+"""
+
+import inspect
+from collections.abc import Iterable
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from ..representation import Node, Operation
+from ..tracing import Tracer
+from ..values import ValueDescription
+from .round_bit_pattern import Adjusting as AdjustingRounder
+from .round_bit_pattern import AutoRounder
+from .round_bit_pattern import local as rounding
+from .truncate_bit_pattern import Adjusting as AdjustingTruncator
+from .truncate_bit_pattern import AutoTruncator
+from .truncate_bit_pattern import local as truncating
+
+
+def adjust(
+    function: Callable,
+    inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]],
+    rounders: bool = True,
+    truncators: bool = True,
+):
+    """
+    Adjust AutoRounders and AutoTruncators in a function using an inputset.
+
+    The function is traced, and the resulting graph is evaluated on the whole inputset at once
+    (see `Graph.evaluate_batch`). Each rounder or truncator is adjusted using the bounds of its
+    input over the inputset right before it's evaluated, so all of them are adjusted in a single
+    evaluation, even if they depend on each other.
+
+    If the function cannot be evaluated this way (e.g., if it cannot be traced, if samples
+    cannot be stacked, or if it has loops), it's evaluated sample by sample, going over the
+    inputset once per rounder and truncator.
+
+    Args:
+        function (Callable):
+            function to adjust
+
+        inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
+            inputset that will be used for compilation
+
+        rounders (bool, default = True):
+            whether to adjust AutoRounders
+
+        truncators (bool, default = True):
+            whether to adjust AutoTruncators
+    """
+
+    # pylint: disable=protected-access
+
+    try:  # extract underlying function for decorators
+        function = function.function  # type: ignore
+        assert callable(function)
+    except AttributeError:
+        pass
+
+    if rounders and rounding._is_adjusting:
+        message = "AutoRounders cannot be adjusted recursively"
+        raise RuntimeError(message)
+
+    if truncators and truncating._is_adjusting:
+        message = "AutoTruncators cannot be adjusted recursively"
+        raise RuntimeError(message)
+
+    try:
+        rounding._is_adjusting = rounders
+        truncating._is_adjusting = truncators
+
+        if not _adjust_at_once(function, inputset):
+            _adjust_sample_by_sample(function, inputset, rounders)
+    finally:
+        rounding._is_adjusting = False
+        truncating._is_adjusting = False
+
+    # pylint: enable=protected-access
+
+
+def _adjust_at_once(
+    function: Callable,
+    inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]],
+) -> bool:
+    """
+    Adjust rounders and truncators of a function by evaluating its graph on the whole inputset.
+
+    Returns:
+        bool:
+            True if the function is adjusted, False if it needs to be adjusted sample by sample
+    """
+
+    samples = [sample if isinstance(sample, tuple) else (sample,) for sample in inputset]
+    if len(samples) == 0:
+        return False
+
+    parameter_names = list(inspect.signature(function).parameters.keys())
+    if any(len(sample) != len(parameter_names) for sample in samples):
+        return False
+
+    try:
+        graph = Tracer.trace(
+            function,
+            {
+                name: ValueDescription.of(value, is_encrypted=True)
+                for name, value in zip(parameter_names, samples[0])
+            },
+        )
+    except (
+        Exception,  # pylint: disable=broad-except
+        AdjustingRounder,
+        AdjustingTruncator,
+    ):
+        # e.g., rounders used on values which are not traced, or control flow on traced values
+        return False
+
+    if len(graph.query_nodes(operation_filter="loop")) != 0:
+        # nodes within bodies of loops are not passed to `adjust_node` below
+        # so the function itself is evaluated instead, where loops are regular loops
+        return False
+
+    stacked_inputs = graph.stack_batch(samples)
+    if stacked_inputs is None:
+        return False
+
+    def adjust_node(node: Node, pred_results: list[np.ndarray]):
+        if node.operation != Operation.Generic:
+            return
+
+        adjusted = node.properties["attributes"].get("auto_adjusted")
+        if adjusted is None:
+            return
+
+        if not adjusted.is_adjusted:
+            adjusted.update_bounds(int(pred_results[0].min()), int(pred_results[0].max()))
+            adjusted.is_adjusted = True
+
+        node.properties["kwargs"]["lsbs_to_remove"] = adjusted.lsbs_to_remove
+
+    try:
+        graph.evaluate_batch(*stacked_inputs, before_node=adjust_node)
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+    return True
+
+
+def _adjust_sample_by_sample(
+    function: Callable,
+    inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]],
+    rounders: bool,
+):
+    """
+    Adjust rounders and truncators of a function by evaluating it on each sample of the inputset.
+
+    Evaluation stops at the first rounder or truncator which is not adjusted yet,
+    so each pass over the inputset adjusts a single one of them.
+    """
+
+    # this loop continues until the return is reached in the loop body
+    # which only happens when ALL rounders and truncators are adjusted
+    # this condition is met if the function can be executed fully
+    # without `Adjusting` exception is raised
+
+    while True:
+        adjusted: Optional[Union[AutoRounder, AutoTruncator]] = None
+
+        for sample in inputset:
+            if not isinstance(sample, tuple):
+                sample = (sample,)
+
+            try:
+                function(*sample)
+            except AdjustingRounder as adjuster:
+                adjusted = adjuster.rounder
+                adjusted.update_bounds(adjuster.input_min, adjuster.input_max)
+            except AdjustingTruncator as adjuster:
+                adjusted = adjuster.truncator
+                adjusted.update_bounds(adjuster.input_min, adjuster.input_max)
+            else:
+                # this branch will be executed if there were no exceptions in the try block
+                return
+
+        if adjusted is None:
+            message = (
+                "AutoRounders cannot be adjusted with an empty inputset"
+                if rounders
+                else "AutoTruncators cannot be adjusted with an empty inputset"
+            )
+            raise ValueError(message)
+
+        adjusted.is_adjusted = True
@@ -7,7 +7,6 @@ from copy import deepcopy
 from typing import Callable, Optional, Union, cast
 
 import numpy as np
-import torch
 
 from ..internal.utils import assert_that
 from ..representation import Node
@@ -530,6 +529,7 @@ def _trace_conv(
         eval_func,
         args=() if bias is not None else (np.zeros(n_filters, dtype=np.int64),),
         kwargs={"pads": pads, "strides": strides, "dilations": dilations, "group": group},
+        attributes={"is_batchable": True},
     )
     return Tracer(computation, inputs)
 
@@ -625,17 +625,20 @@ def _evaluate_conv(
     x: np.ndarray,
     weight: np.ndarray,
     bias: np.ndarray,
-    pads: Union[tuple[int, ...], list[int]],  # pylint: disable=unused-argument
+    pads: Union[tuple[int, ...], list[int]],
     strides: Union[tuple[int, ...], list[int]],
     dilations: Union[tuple[int, ...], list[int]],
     group: int,
     conv_func: str,
 ) -> np.ndarray:
     """
-    Evaluate 2D convolution.
+    Evaluate convolution.
+
+    Input can have extra leading axes (e.g., to evaluate many samples at once),
+    in which case the result has the same extra leading axes.
 
     Args:
-        x (np.ndarray): input of shape (N, C, D1, ..., DN)
+        x (np.ndarray): input of shape (..., N, C, D1, ..., DN)
         weight (np.ndarray): kernel of shape (F, C / group, K1, ..., KN)
         bias (np.ndarray): bias of shape (F,)
         pads (Union[Tuple[int, ...], List[int]]):
@@ -651,22 +654,19 @@ def _evaluate_conv(
         np.ndarray: result of the convolution
     """
 
-    # pylint: disable=no-member
-    conv_funcs = {
-        "conv1d": torch.conv1d,
-        "conv2d": torch.conv2d,
-        "conv3d": torch.conv3d,
+    spatial_dims = {
+        "conv1d": 1,
+        "conv2d": 2,
+        "conv3d": 3,
     }
 
-    torch_conv_func = conv_funcs.get(conv_func)
+    n_dim = spatial_dims.get(conv_func)
     assert_that(
-        torch_conv_func is not None,
-        f"expected conv_func to be one of {list(conv_funcs.keys())}, but got {conv_func}",
+        n_dim is not None,
+        f"expected conv_func to be one of {list(spatial_dims.keys())}, but got {conv_func}",
     )
-    torch_conv_func = cast(Callable, torch_conv_func)
+    n_dim = cast(int, n_dim)
 
-    n_dim = x.ndim - 2  # remove batch_size and channel dims
-    torch_padding = []
     for dim in range(n_dim):
         if pads[dim] != pads[n_dim + dim]:
             message = (
@@ -675,23 +675,54 @@ def _evaluate_conv(
                 f"dimension {dim}"
             )
             raise ValueError(message)
-        torch_padding.append(pads[dim])
 
     dtype = (
-        torch.float64
+        np.float64
         if np.issubdtype(x.dtype, np.floating)
         or np.issubdtype(weight.dtype, np.floating)
         or np.issubdtype(bias.dtype, np.floating)
-        else torch.long
+        else np.int64
     )
-    return torch_conv_func(
-        torch.tensor(x, dtype=dtype),
-        torch.tensor(weight, dtype=dtype),
-        torch.tensor(bias, dtype=dtype),
-        stride=strides,
-        padding=torch_padding,
-        dilation=dilations,
-        groups=group,
-    ).numpy()
-
-    # pylint: enable=no-member
+
+    # axes before (N, C) are extra batch axes (e.g., samples of an inputset evaluated at once)
+    leading_shape = x.shape[: -(n_dim + 1)]
+
+    x = x.reshape((-1,) + x.shape[-(n_dim + 1) :]).astype(dtype, copy=False)
+    weight = weight.astype(dtype, copy=False)
+    bias = bias.astype(dtype, copy=False)
+
+    x = np.pad(x, [(0, 0), (0, 0)] + [(pads[dim], pads[dim]) for dim in range(n_dim)])
+
+    # windows are views of shape (N, C, O1, ..., ON, K1, ..., KN), nothing is copied until the dot
+    kernel_shape = weight.shape[2:]
+    windows = np.lib.stride_tricks.sliding_window_view(
+        x,
+        tuple(dilations[dim] * (kernel_shape[dim] - 1) + 1 for dim in range(n_dim)),
+        axis=tuple(range(2, 2 + n_dim)),
+    )
+    windows = windows[
+        (slice(None), slice(None))
+        + tuple(slice(None, None, stride) for stride in strides)
+        + tuple(slice(None, None, dilation) for dilation in dilations)
+    ]
+
+    channels_per_group = x.shape[1] // group
+    filters_per_group = weight.shape[0] // group
+
+    results = []
+    for g in range(group):
+        results.append(
+            np.tensordot(
+                windows[:, g * channels_per_group : (g + 1) * channels_per_group],
+                weight[g * filters_per_group : (g + 1) * filters_per_group],
+                axes=(
+                    [1, *range(2 + n_dim, 2 + 2 * n_dim)],
+                    [1, *range(2, 2 + n_dim)],
+                ),
+            )
+        )
+
+    result = np.moveaxis(np.concatenate(results, axis=-1), -1, 1)
+    result = result + bias.reshape((-1,) + (1,) * n_dim)
+
+    return result.reshape(leading_shape + result.shape[1:])
@@ -0,0 +1,176 @@
+"""
+Declaration of `loop` extension.
+"""
+
+import inspect
+from copy import deepcopy
+from typing import Any, Callable, Union
+
+import numpy as np
+
+from ..representation import Graph, Node, Operation
+from ..tracing import Tracer
+
+
+def loop(
+    iterations: int,
+    body: Callable,
+    state: Union[Tracer, Any],
+    *arguments: Union[Tracer, Any],
+) -> Union[Tracer, Any]:
+    """
+    Apply a function to a state repeatedly, tracing the function only once.
+
+    This is equivalent to
+
+    .. code-block:: python
+
+        for _ in range(iterations):
+            state = body(state, *arguments)
+
+    but the body is traced once into a separate graph, and the loop is represented by a single
+    node, so the size of the graph doesn't depend on the number of iterations. Bounds of the body
+    are measured over all iterations, and the body is converted once per iteration
+    (the compiler doesn't support encrypted values carried by loops).
+
+    The state is carried from one iteration to the next, so it needs to be encrypted, and it keeps
+    the same shape and the same bit-width throughout the loop. Arguments are the same for all
+    iterations. Values traced outside of the body cannot be used within the body directly,
+    they need to be passed as arguments.
+
+    Args:
+        iterations (int):
+            number of times to apply the body
+
+        body (Callable):
+            function taking the state and the arguments, and returning the new state
+
+        state (Union[Tracer, Any]):
+            initial state
+
+        *arguments (Union[Tracer, Any]):
+            additional arguments of the body
+
+    Returns:
+        Union[Tracer, Any]:
+            loop tracer if called with tracers
+            final state otherwise
+
+    Raises:
+        ValueError:
+            if the number of iterations is not a non-negative integer
+            or if the loop cannot be traced (e.g., if the body changes the shape of the state)
+    """
+
+    if (
+        isinstance(iterations, bool)
+        or not isinstance(iterations, (int, np.integer))
+        or iterations < 0
+    ):
+        message = f"Loop iterations should be a non-negative integer but it's {repr(iterations)}"
+        raise ValueError(message)
+
+    iterations = int(iterations)
+
+    if not any(isinstance(value, Tracer) for value in (state, *arguments)):
+        for _ in range(iterations):
+            state = body(state, *arguments)
+        return state
+
+    if iterations == 0:
+        return state
+
+    values = [Tracer.sanitize(value) for value in (state, *arguments)]
+    if any(not isinstance(value, Tracer) for value in values):
+        message = "Loop state and arguments cannot be tuples"
+        raise ValueError(message)
+
+    state = values[0]
+    if not state.output.is_encrypted:
+        message = (
+            "Loop state should be encrypted "
+            "(e.g., it can be initialized with `fhe.zeros` or `fhe.ones`)"
+        )
+        raise ValueError(message)
+
+    graph = _trace_body(body, values)
+
+    if graph.outputs_count != 1:
+        message = "Loop body should return a single value"
+        raise ValueError(message)
+
+    output = graph.ordered_outputs()[0].output
+    if not output.is_encrypted or output.shape != state.output.shape:
+        message = (
+            f"Loop body should return an encrypted value of shape {state.output.shape} "
+            f"to be used as the state of the next iteration but it returned {output}"
+        )
+        raise ValueError(message)
+
+    computation = Node.generic(
+        "loop",
+        [deepcopy(value.output) for value in values],
+        deepcopy(output),
+        _evaluate,
+        kwargs={"iterations": iterations, "body": graph},
+    )
+    return Tracer(computation, values)
+
+
+def _trace_body(body: Callable, values: list[Tracer]) -> Graph:
+    """
+    Trace the body of a loop into a separate graph.
+    """
+
+    # body parameters are named after the parameters of the body if possible
+    # to have readable graphs, but the body is called positionally
+    try:
+        names = [
+            parameter.name
+            for parameter in inspect.signature(body).parameters.values()
+            if parameter.kind
+            in {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
+        ]
+    except (TypeError, ValueError):  # pragma: no cover
+        names = []
+
+    if len(names) != len(values):
+        names = ["state"] + [f"argument{index}" for index in range(1, len(values))]
+
+    def traced(**kwargs: Tracer) -> Any:
+        return body(*kwargs.values())
+
+    traced.__name__ = getattr(body, "__name__", "body")
+    traced.__signature__ = inspect.Signature(  # type: ignore
+        [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in names]
+    )
+
+    graph = Tracer.trace(
+        traced,
+        {name: deepcopy(value.output) for name, value in zip(names, values)},
+        is_direct=Tracer._is_direct,  # pylint: disable=protected-access
+    )
+
+    # values traced outside of the body bring the inputs of the outer function they depend on
+    # into the graph of the body, values only computed from constants are fine to recompute
+    inputs = set(graph.input_nodes.values())
+    if any(
+        node.operation == Operation.Input and node not in inputs for node in graph.graph.nodes()
+    ):
+        message = (
+            "Loop body cannot use values traced outside of it, "
+            "they need to be passed to the loop as arguments"
+        )
+        raise ValueError(message)
+
+    return graph
+
+
+def _evaluate(state: Any, *arguments: Any, iterations: int, body: Graph) -> Any:
+    """
+    Evaluate a loop.
+    """
+
+    for _ in range(iterations):
+        state = body(state, *arguments)
+    return state
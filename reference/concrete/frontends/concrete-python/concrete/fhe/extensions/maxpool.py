@@ -6,7 +6,6 @@ from copy import deepcopy
 from typing import Optional, Union
 
 import numpy as np
-import torch
 
 from ..internal.utils import assert_that
 from ..representation import Node
@@ -47,17 +46,6 @@ SUPPORTED_STORAGE_ORDER = {
 }
 
 
-# pylint: disable=no-member
-
-_EVALUATORS = {
-    1: torch.max_pool1d,
-    2: torch.max_pool2d,
-    3: torch.max_pool3d,
-}
-
-# pylint: enable=no-member
-
-
 def maxpool(
     x: Union[np.ndarray, Tracer],
     kernel_shape: Union[tuple[int, ...], list[int]],
@@ -304,6 +292,7 @@ def _trace_or_evaluate(
             "dilations": dilations,
             "ceil_mode": ceil_mode,
         },
+        attributes={"is_batchable": True},
     )
     return Tracer(computation, [x])
 
@@ -316,25 +305,44 @@ def _evaluate(
     dilations: tuple[int, ...],
     ceil_mode: bool,
 ) -> np.ndarray:
-    # pylint: disable=no-member
-
-    dims = x.ndim - 2
+    # spatial axes are the last ones, so x can have extra leading axes
+    # (e.g., to evaluate many samples at once)
+    dims = len(kernel_shape)
     assert_that(dims in {1, 2, 3})
 
-    evaluator = _EVALUATORS[dims]
-    result = (
-        evaluator(
-            torch.from_numpy(x.astype(np.float64)),  # torch only supports float maxpools
-            kernel_shape,
-            strides,
-            pads[: len(pads) // 2],
-            dilations,
-            ceil_mode,
-        )
-        .numpy()
-        .astype(x.dtype)
+    if x.dtype.kind == "f":
+        padding_value = -np.inf
+    elif x.dtype.kind == "b":
+        padding_value = False
+    else:
+        padding_value = np.iinfo(x.dtype).min
+
+    extents = [dilations[dim] * (kernel_shape[dim] - 1) + 1 for dim in range(dims)]
+
+    padding = []
+    for dim in range(dims):
+        begin, end = pads[dim], pads[dims + dim]
+        if ceil_mode:
+            # the last window can go past the end of the input
+            # as long as it starts within the input or the beginning padding
+            size = x.shape[-dims + dim]
+            n_windows = -(-(size + begin + end - extents[dim]) // strides[dim]) + 1
+            if (n_windows - 1) * strides[dim] >= size + begin:
+                n_windows -= 1
+            end = max(end, (n_windows - 1) * strides[dim] + extents[dim] - size - begin)
+        padding.append((begin, end))
+
+    x = np.pad(x, [(0, 0)] * (x.ndim - dims) + padding, constant_values=padding_value)
+
+    windows = np.lib.stride_tricks.sliding_window_view(
+        x,
+        extents,
+        axis=tuple(range(x.ndim - dims, x.ndim)),
     )
+    windows = windows[
+        (Ellipsis,)
+        + tuple(slice(None, None, stride) for stride in strides)
+        + tuple(slice(None, None, dilation) for dilation in dilations)
+    ]
 
-    # pylint: enable=no-member
-
-    return result
+    return windows.max(axis=tuple(range(-dims, 0)))
@@ -74,56 +74,30 @@ class AutoRounder:
     def adjust(function: Callable, inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]]):
         """
         Adjust AutoRounders in a function using an inputset.
-        """
-
-        # pylint: disable=protected-access,too-many-branches
-
-        try:  # extract underlying function for decorators
-            function = function.function  # type: ignore
-            assert callable(function)
-        except AttributeError:
-            pass
 
-        if local._is_adjusting:
-            message = "AutoRounders cannot be adjusted recursively"
-            raise RuntimeError(message)
-
-        try:
-            local._is_adjusting = True
-            while True:
-                rounder = None
-
-                for sample in inputset:
-                    if not isinstance(sample, tuple):
-                        sample = (sample,)
-
-                    try:
-                        function(*sample)
-                    except Adjusting as adjuster:
-                        rounder = adjuster.rounder
-
-                        rounder.input_min = min(rounder.input_min, adjuster.input_min)
-                        rounder.input_max = max(rounder.input_max, adjuster.input_max)
+        All AutoRounders are adjusted in a single evaluation of the inputset when possible
+        (see `concrete.fhe.extensions.adjustment.adjust`).
+        """
 
-                        input_value = ValueDescription.of([rounder.input_min, rounder.input_max])
-                        assert isinstance(input_value.dtype, Integer)
-                        rounder.input_bit_width = input_value.dtype.bit_width
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .adjustment import adjust
 
-                        if rounder.input_bit_width - rounder.lsbs_to_remove > rounder.target_msbs:
-                            rounder.lsbs_to_remove = rounder.input_bit_width - rounder.target_msbs
-                    else:
-                        return
+        adjust(function, inputset, rounders=True, truncators=False)
 
-                if rounder is None:
-                    message = "AutoRounders cannot be adjusted with an empty inputset"
-                    raise ValueError(message)
+    def update_bounds(self, input_min: int, input_max: int):
+        """
+        Extend the input bounds of the rounder, and update the number of lsbs to remove.
+        """
 
-                rounder.is_adjusted = True
+        self.input_min = min(self.input_min, input_min)
+        self.input_max = max(self.input_max, input_max)
 
-        finally:
-            local._is_adjusting = False
+        input_value = ValueDescription.of([self.input_min, self.input_max])
+        assert isinstance(input_value.dtype, Integer)
+        self.input_bit_width = input_value.dtype.bit_width
 
-        # pylint: enable=protected-access,too-many-branches
+        if self.input_bit_width - self.lsbs_to_remove > self.target_msbs:
+            self.lsbs_to_remove = self.input_bit_width - self.target_msbs
 
     def dump_dict(self) -> dict:
         """
@@ -228,10 +202,15 @@ def round_bit_pattern(
 
     # pylint: disable=protected-access,too-many-branches
 
+    rounder = None
     if isinstance(lsbs_to_remove, AutoRounder):
         if local._is_adjusting:
             if not lsbs_to_remove.is_adjusted:
-                raise Adjusting(lsbs_to_remove, int(np.min(x)), int(np.max(x)))  # type: ignore
+                if not isinstance(x, Tracer):
+                    raise Adjusting(lsbs_to_remove, int(np.min(x)), int(np.max(x)))  # type: ignore
+
+                # rounder is adjusted when the traced graph is evaluated on the inputset
+                rounder = lsbs_to_remove
 
         elif not lsbs_to_remove.is_adjusted:
             message = (
@@ -274,6 +253,7 @@ def round_bit_pattern(
                 "overflow_protection": overflow_protection,
                 "exactness": exactness,
             },
+            attributes={"auto_adjusted": rounder} if rounder is not None else None,
         )
         return Tracer(computation, [x])
 
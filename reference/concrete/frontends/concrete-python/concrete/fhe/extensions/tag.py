@@ -5,8 +5,20 @@ Declaration of `tag` context manager, to allow tagging certain nodes.
 import threading
 from contextlib import contextmanager
 
-tag_context = threading.local()
-tag_context.stack = []
+
+class TagContext(threading.local):
+    """
+    Tag stack of the current thread, starting empty in each thread.
+    """
+
+    stack: list[str]
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+
+
+tag_context = TagContext()
 
 
 @contextmanager
@@ -73,71 +73,30 @@ class AutoTruncator:
     def adjust(function: Callable, inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]]):
         """
         Adjust AutoTruncators in a function using an inputset.
-        """
-
-        # pylint: disable=protected-access,too-many-branches
-
-        try:  # extract underlying function for decorators
-            function = function.function  # type: ignore
-            assert callable(function)
-        except AttributeError:
-            pass
-
-        if local._is_adjusting:
-            message = "AutoTruncators cannot be adjusted recursively"
-            raise RuntimeError(message)
-
-        try:
-            local._is_adjusting = True
 
-            # adjust the truncator using the inputset
-            # this loop continues until the return is reached in the loop body
-            # which only happens when ALL truncators are adjusted
-            # this condition is met if the function can be executed fully
-            # without `Adjusting` exception is raised
-
-            while True:
-                truncator = None
-
-                for sample in inputset:
-                    if not isinstance(sample, tuple):
-                        sample = (sample,)
-
-                    try:
-                        function(*sample)
-                    except Adjusting as adjuster:
-                        truncator = adjuster.truncator
-
-                        truncator.input_min = min(truncator.input_min, adjuster.input_min)
-                        truncator.input_max = max(truncator.input_max, adjuster.input_max)
+        All AutoTruncators are adjusted in a single evaluation of the inputset when possible
+        (see `concrete.fhe.extensions.adjustment.adjust`).
+        """
 
-                        input_value = ValueDescription.of(
-                            [truncator.input_min, truncator.input_max]
-                        )
-                        assert isinstance(input_value.dtype, Integer)
-                        truncator.input_bit_width = input_value.dtype.bit_width
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .adjustment import adjust
 
-                        if (
-                            truncator.input_bit_width - truncator.lsbs_to_remove
-                            > truncator.target_msbs
-                        ):
-                            truncator.lsbs_to_remove = (
-                                truncator.input_bit_width - truncator.target_msbs
-                            )
-                    else:
-                        # this branch will be executed if there were no exceptions in the try block
-                        return
+        adjust(function, inputset, rounders=False, truncators=True)
 
-                if truncator is None:
-                    message = "AutoTruncators cannot be adjusted with an empty inputset"
-                    raise ValueError(message)
+    def update_bounds(self, input_min: int, input_max: int):
+        """
+        Extend the input bounds of the truncator, and update the number of lsbs to remove.
+        """
 
-                truncator.is_adjusted = True
+        self.input_min = min(self.input_min, input_min)
+        self.input_max = max(self.input_max, input_max)
 
-        finally:
-            local._is_adjusting = False
+        input_value = ValueDescription.of([self.input_min, self.input_max])
+        assert isinstance(input_value.dtype, Integer)
+        self.input_bit_width = input_value.dtype.bit_width
 
-        # pylint: enable=protected-access,too-many-branches
+        if self.input_bit_width - self.lsbs_to_remove > self.target_msbs:
+            self.lsbs_to_remove = self.input_bit_width - self.target_msbs
 
     def dump_dict(self) -> dict:
         """
@@ -204,10 +163,15 @@ def truncate_bit_pattern(
 
     # pylint: disable=protected-access,too-many-branches
 
+    truncator = None
     if isinstance(lsbs_to_remove, AutoTruncator):
         if local._is_adjusting:
             if not lsbs_to_remove.is_adjusted:
-                raise Adjusting(lsbs_to_remove, int(np.min(x)), int(np.max(x)))  # type: ignore
+                if not isinstance(x, Tracer):
+                    raise Adjusting(lsbs_to_remove, int(np.min(x)), int(np.max(x)))  # type: ignore
+
+                # truncator is adjusted when the traced graph is evaluated on the inputset
+                truncator = lsbs_to_remove
 
         elif not lsbs_to_remove.is_adjusted:
             message = (
@@ -234,6 +198,7 @@ def truncate_bit_pattern(
             deepcopy(x.output),
             evaluator,
             kwargs={"lsbs_to_remove": lsbs_to_remove},
+            attributes={"auto_adjusted": truncator} if truncator is not None else None,
         )
         return Tracer(computation, [x])
 
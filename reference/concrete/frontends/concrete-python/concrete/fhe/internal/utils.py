@@ -2,6 +2,10 @@
 Declaration of various functions and constants related to the entire project.
 """
 
+import importlib
+from types import ModuleType
+from typing import Any
+
 
 def assert_that(condition: bool, message: str = ""):
     """
@@ -30,3 +34,26 @@ def unreachable():
 
     message = "Entered unreachable code"
     raise RuntimeError(message)
+
+
+class LazyModule(ModuleType):
+    """
+    LazyModule class, to import a module on first use instead of on import.
+
+    Heavy dependencies which are only needed to trace and compile (e.g., `networkx`, `z3`)
+    are declared as lazy modules, so processes which only encrypt, run and decrypt don't load them.
+
+    Annotations using a lazy module are only evaluated by type checkers,
+    so modules using them should import them from `__future__`.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+
+    def __getattr__(self, name: str) -> Any:
+        module = importlib.import_module(self.__name__)
+
+        # later accesses to loaded attributes don't go through `__getattr__`
+        self.__dict__.update(module.__dict__)
+
+        return getattr(module, name)
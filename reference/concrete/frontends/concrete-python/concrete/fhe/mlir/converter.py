@@ -11,7 +11,6 @@ from typing import Optional, Union
 
 import concrete.lang
 import concrete.lang.dialects.tracing
-import networkx as nx
 import numpy as np
 from mlir.dialects import func
 from mlir.ir import Context as MlirContext
@@ -21,6 +20,7 @@ from mlir.ir import Module as MlirModule
 
 from ..compilation.composition import CompositionRule
 from ..compilation.configuration import Configuration, Exactness, ParameterSelectionStrategy
+from ..compilation.profiling import profile_phase
 from ..representation import Graph, GraphProcessor, MultiGraphProcessor, Node, Operation
 from ..tfhers.dtypes import TFHERSIntegerType
 from .context import Context
@@ -100,7 +100,9 @@ class Converter:
                     input_types = [ctx.typeof(node).mlir for node in graph.ordered_inputs()]
 
                     location = graph.location.split(":")
-                    with MlirLocation.file(
+                    with profile_phase(
+                        "mlir_conversion", name, lambda: len(graph.query_nodes())
+                    ), MlirLocation.file(
                         location[0], line=int(location[1]), col=0, context=context
                     ):
 
@@ -114,10 +116,11 @@ class Converter:
                                     )
                                 ctx.conversions[node] = conversion
 
+                            plan = graph.execution_plan()
+                            pred_indices_of = dict(zip(plan.nodes, plan.preds))
+
                             ordered_nodes = [
-                                node
-                                for node in nx.lexicographical_topological_sort(graph.graph)
-                                if node.operation != Operation.Input
+                                node for node in plan.nodes if node.operation != Operation.Input
                             ]
 
                             for progress_index, node in enumerate(ordered_nodes):
@@ -125,7 +128,8 @@ class Converter:
                                     self.configuration, progress_index, ordered_nodes
                                 )
                                 preds = [
-                                    ctx.conversions[pred] for pred in graph.ordered_preds_of(node)
+                                    ctx.conversions[plan.nodes[pred_index]]
+                                    for pred_index in pred_indices_of[node]
                                 ]
                                 self.node(ctx, node, preds)
                             self.trace_progress(
@@ -251,6 +255,9 @@ class Converter:
         configuration = self.configuration
         composition_rules = self.composition_rules
 
+        # bodies of loops are processed along with the graphs they are in
+        graphs = self.with_loop_bodies(graphs)
+
         pipeline = (
             configuration.additional_pre_processors
             + [
@@ -276,11 +283,42 @@ class Converter:
 
         for processor in pipeline:
             assert isinstance(processor, GraphProcessor)
+            phase = type(processor).__name__
             if isinstance(processor, MultiGraphProcessor):
-                processor.apply_many(graphs)
+                with profile_phase(
+                    phase,
+                    node_count=lambda: sum(len(graph.query_nodes()) for graph in graphs.values()),
+                ):
+                    processor.apply_many(graphs)
             else:
-                for graph in graphs.values():
-                    processor.apply(graph)
+                for name, graph in graphs.items():
+                    # pylint: disable=cell-var-from-loop
+                    with profile_phase(phase, name, lambda: len(graph.query_nodes())):
+                        processor.apply(graph)
+
+    @staticmethod
+    def with_loop_bodies(graphs: dict[str, Graph]) -> dict[str, Graph]:
+        """
+        Extend computation graphs with the bodies of their loops.
+
+        Args:
+            graphs (Dict[str, Graph]):
+                graphs to extend
+
+        Returns:
+            Dict[str, Graph]:
+                bodies of the loops of the graphs (e.g., `f[loop0]` for the first loop of `f`),
+                followed by the graphs themselves
+        """
+
+        result: dict[str, Graph] = {}
+        for name, graph in graphs.items():
+            loops = graph.query_nodes(operation_filter="loop", ordered=True)
+            for index, node in enumerate(loops):
+                body = node.properties["kwargs"]["body"]
+                result.update(Converter.with_loop_bodies({f"{name}[loop{index}]": body}))
+            result[name] = graph
+        return result
 
     def node(self, ctx: Context, node: Node, preds: list[Conversion]) -> Conversion:
         """
@@ -533,6 +571,44 @@ class Converter:
 
         return self.tlu(ctx, node, preds)
 
+    def loop(self, ctx: Context, node: Node, preds: list[Conversion]) -> Conversion:
+        assert len(preds) >= 1
+
+        body = node.properties["kwargs"]["body"]
+        iterations = node.properties["kwargs"]["iterations"]
+
+        resulting_type = ctx.typeof(node)
+        state = ctx.to_signedness(preds[0], of=resulting_type)
+
+        # noise analysis of the compiler doesn't support encrypted values carried by `scf.for`
+        # so the body, which is traced once, is converted once per iteration
+        body_inputs = body.ordered_inputs()
+        plan = body.execution_plan()
+        for _ in range(iterations):
+            for body_input, value in zip(body_inputs, [state, *preds[1:]]):
+                conversion = Conversion(body_input, value.result)
+                if "original_bit_width" in body_input.properties:
+                    conversion.set_original_bit_width(body_input.properties["original_bit_width"])
+                ctx.conversions[body_input] = conversion
+
+            graph = ctx.graph
+            ctx.graph = body
+            try:
+                for body_node, pred_indices in zip(plan.nodes, plan.preds):
+                    if body_node.operation == Operation.Input:
+                        continue
+
+                    body_preds = [ctx.conversions[plan.nodes[index]] for index in pred_indices]
+                    self.node(ctx, body_node, body_preds)
+            finally:
+                ctx.graph = graph
+                ctx.converting = node
+
+            output = ctx.conversions[body.ordered_outputs()[0]]
+            state = ctx.to_signedness(output, of=resulting_type)
+
+        return state
+
     def matmul(self, ctx: Context, node: Node, preds: list[Conversion]) -> Conversion:
         assert len(preds) == 2
         return ctx.matmul(ctx.typeof(node), preds[0], preds[1])
@@ -2,7 +2,12 @@
 Declaration of `AssignBitWidths` graph processor.
 """
 
-import z3
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 from ...compilation.composition import CompositionRule
 from ...compilation.configuration import (
@@ -11,9 +16,21 @@ from ...compilation.configuration import (
     MinMaxStrategy,
     MultivariateStrategy,
 )
+from ...compilation.profiling import profile_count
 from ...dtypes import Integer
+from ...internal.utils import LazyModule
 from ...representation import Graph, MultiGraphProcessor, Node, Operation
 
+if TYPE_CHECKING:  # pragma: no cover
+    import z3
+else:
+    z3 = LazyModule("z3")
+
+# solutions of the components solved with z3, by the hash of their canonical constraints
+SOLUTION_CACHE: OrderedDict[str, tuple[int, ...]] = OrderedDict()
+SOLUTION_CACHE_SIZE = 1024
+SOLUTION_CACHE_LOCK = threading.Lock()
+
 
 class AssignBitWidths(MultiGraphProcessor):
     """
@@ -55,15 +72,13 @@ class AssignBitWidths(MultiGraphProcessor):
         self.min_max_strategy_preference = min_max_strategy_preference
 
     def apply_many(self, graphs: dict[str, Graph]):
-        optimizer = z3.Optimize()
+        constraints = BitWidthConstraints()
 
         bit_widths: dict[Node, z3.Int] = {}
 
         for graph_name, graph in graphs.items():
-            max_bit_width: z3.Int = z3.Int(f"{graph_name}.max")
-
             additional_constraints = AdditionalConstraints(
-                optimizer,
+                constraints,
                 graph,
                 bit_widths,
                 self.comparison_strategy_preference,
@@ -88,29 +103,35 @@ class AssignBitWidths(MultiGraphProcessor):
                 base_constraint = bit_width >= required_bit_width
                 node.bit_width_constraints.append(base_constraint)
 
-                optimizer.add(base_constraint)
-                optimizer.add(max_bit_width >= bit_width)
+                constraints.add(base_constraint)
 
                 additional_constraints.generate_for(node, bit_width)
 
-            if self.single_precision:
-                for bit_width in bit_widths.values():
-                    optimizer.add(bit_width == max_bit_width)
+        if self.single_precision:
+            all_bit_widths = list(bit_widths.values())
+            for bit_width in all_bit_widths[1:]:
+                constraints.add(bit_width == all_bit_widths[0])
 
         if self.composition_rules:
             for compo in self.composition_rules:
                 from_node = graphs[compo.from_.func].ordered_outputs()[compo.from_.pos]
                 to_node = graphs[compo.to.func].ordered_inputs()[compo.to.pos]
-                optimizer.add(bit_widths[from_node] == bit_widths[to_node])
+                constraints.add(bit_widths[from_node] == bit_widths[to_node])
 
-        optimizer.minimize(sum(bit_width for bit_width in bit_widths.values()))
+        solution = BitWidthSolver(constraints.constraints).minimize(list(bit_widths.values()))
 
-        assert optimizer.check() == z3.sat
-        model = optimizer.model()
+        assignments: dict[str, int] = {}
+        for graph_name, graph in graphs.items():
+            for node in graph.query_nodes(ordered=True):
+                assignments[str(bit_widths[node])] = solution[bit_widths[node].get_id()]
+            assignments[f"{graph_name}.max"] = max(
+                (solution[bit_widths[node].get_id()] for node in graph.query_nodes()),
+                default=0,
+            )
 
         for node, bit_width in bit_widths.items():
             assert isinstance(node.output.dtype, Integer)
-            new_bit_width = model[bit_width].as_long()
+            new_bit_width = solution[bit_width.get_id()]
             original_bit_width = node.properties.get(
                 "bit_width_hint",
                 node.output.dtype.bit_width,
@@ -122,8 +143,258 @@ class AssignBitWidths(MultiGraphProcessor):
             node.properties["original_bit_width"] = original_bit_width
             node.output.dtype.bit_width = new_bit_width
         for graph in graphs.values():
-            graph.bit_width_constraints = optimizer
-            graph.bit_width_assignments = model
+            graph.bit_width_constraints = constraints.constraints
+            graph.bit_width_assignments = assignments
+
+
+class BitWidthConstraints:
+    """
+    BitWidthConstraints class, to collect bit-width constraints before solving them.
+    """
+
+    constraints: list[z3.BoolRef]
+
+    def __init__(self):
+        self.constraints = []
+
+    def add(self, constraint: z3.BoolRef):
+        """
+        Add a constraint.
+
+        Args:
+            constraint (z3.BoolRef):
+                constraint to add
+        """
+
+        self.constraints.append(constraint)
+
+
+class BitWidthSolver:
+    """
+    BitWidthSolver class, to find the smallest bit-widths satisfying bit-width constraints.
+
+    Bit-widths are grouped into components connected by constraints,
+    and each component is solved independently:
+    - Components only constrained by lower bounds and equalities are solved without z3,
+      as the smallest solution of such a component is its largest lower bound.
+    - Other components are solved with z3, and their solutions are cached
+      by the hash of their canonical constraints, to be reused by identical components.
+    """
+
+    variables: dict[int, z3.ArithRef]
+    lower_bounds: dict[int, int]
+    complex_constraints: list[z3.BoolRef]
+
+    _equal: dict[int, int]
+    _connected: dict[int, int]
+
+    def __init__(self, constraints: list[z3.BoolRef]):
+        self.variables = {}
+        self.lower_bounds = {}
+        self.complex_constraints = []
+
+        self._equal = {}
+        self._connected = {}
+
+        for constraint in constraints:
+            self._add(constraint)
+
+    def minimize(self, objective: list[z3.ArithRef]) -> dict[int, int]:
+        """
+        Find the solution minimizing the sum of bit-widths.
+
+        Args:
+            objective (List[z3.ArithRef]):
+                bit-widths to minimize the sum of
+
+        Returns:
+            Dict[int, int]:
+                smallest value of each bit-width, by its z3 identifier
+        """
+
+        for variable in objective:
+            self._declare(variable)
+
+        weights: dict[int, int] = {}
+        for variable in objective:
+            representative = self._find(self._equal, variable.get_id())
+            weights[representative] = weights.get(representative, 0) + 1
+
+        members: dict[int, list[z3.ArithRef]] = {}
+        components: dict[int, list[int]] = {}
+        for identifier, variable in self.variables.items():
+            representative = self._find(self._equal, identifier)
+            members.setdefault(representative, []).append(variable)
+            if representative == identifier:
+                component = self._find(self._connected, identifier)
+                components.setdefault(component, []).append(representative)
+
+        component_constraints: dict[int, list[z3.BoolRef]] = {}
+        for constraint in self.complex_constraints:
+            component = self._find(self._connected, self._variables_of(constraint)[0].get_id())
+            component_constraints.setdefault(component, []).append(constraint)
+
+        profile_count("bit_width_assignment.components", len(components))
+
+        values: dict[int, int] = {}
+        for component, representatives in components.items():
+            if component not in component_constraints:
+                # the component is made of a single set of equal bit-widths
+                assert len(representatives) == 1
+                values[representatives[0]] = self.lower_bounds.get(representatives[0], 0)
+                profile_count("bit_width_assignment.components_solved_without_z3")
+                continue
+
+            values.update(
+                self._solve_with_z3(
+                    representatives,
+                    component_constraints[component],
+                    members,
+                    weights,
+                )
+            )
+
+        return {
+            variable.get_id(): values[self._find(self._equal, variable.get_id())]
+            for variable in objective
+        }
+
+    def _solve_with_z3(
+        self,
+        representatives: list[int],
+        constraints: list[z3.BoolRef],
+        members: dict[int, list[z3.ArithRef]],
+        weights: dict[int, int],
+    ) -> dict[int, int]:
+        canonical_variables = [z3.Int(f"v{i}") for i in range(len(representatives))]
+        canonical_variable_of = dict(zip(representatives, canonical_variables))
+
+        substitutions = [
+            (variable, canonical_variable)
+            for representative, canonical_variable in canonical_variable_of.items()
+            for variable in members[representative]
+        ]
+
+        canonical_constraints = [
+            canonical_variable >= self.lower_bounds[representative]
+            for representative, canonical_variable in canonical_variable_of.items()
+            if representative in self.lower_bounds
+        ]
+        canonical_constraints += [
+            z3.substitute(constraint, *substitutions) for constraint in constraints
+        ]
+        canonical_objective = z3.Sum(
+            [
+                weights.get(representative, 0) * canonical_variable
+                for representative, canonical_variable in canonical_variable_of.items()
+            ]
+        )
+
+        key = hashlib.sha256(
+            "\n".join(
+                expression.sexpr() for expression in [*canonical_constraints, canonical_objective]
+            ).encode("utf-8")
+        ).hexdigest()
+
+        with SOLUTION_CACHE_LOCK:
+            solution = SOLUTION_CACHE.get(key)
+            if solution is not None:
+                SOLUTION_CACHE.move_to_end(key)
+
+        if solution is not None:
+            profile_count("bit_width_assignment.component_cache_hits")
+        else:
+            optimizer = z3.Optimize()
+            optimizer.add(*canonical_constraints)
+            optimizer.minimize(canonical_objective)
+
+            assert optimizer.check() == z3.sat
+            model = optimizer.model()
+
+            solution = tuple(
+                model.eval(canonical_variable, model_completion=True).as_long()
+                for canonical_variable in canonical_variables
+            )
+            profile_count("bit_width_assignment.components_solved_with_z3")
+
+            with SOLUTION_CACHE_LOCK:
+                SOLUTION_CACHE[key] = solution
+                while len(SOLUTION_CACHE) > SOLUTION_CACHE_SIZE:
+                    SOLUTION_CACHE.popitem(last=False)
+
+        return dict(zip(representatives, solution))
+
+    def _add(self, constraint: z3.BoolRef):
+        if constraint.num_args() == 2:
+            lhs, rhs = constraint.arg(0), constraint.arg(1)
+
+            if z3.is_ge(constraint) and self._is_variable(lhs) and z3.is_int_value(rhs):
+                # lower bounds are kept on the representatives of the sets of equal bit-widths
+                representative = self._find(self._equal, self._declare(lhs))
+                self.lower_bounds[representative] = max(
+                    self.lower_bounds.get(representative, rhs.as_long()),
+                    rhs.as_long(),
+                )
+                return
+
+            if z3.is_eq(constraint) and self._is_variable(lhs) and self._is_variable(rhs):
+                first = self._find(self._equal, self._declare(lhs))
+                second = self._find(self._equal, self._declare(rhs))
+                if first != second:
+                    self._equal[second] = first
+                    if second in self.lower_bounds:
+                        bound = self.lower_bounds.pop(second)
+                        self.lower_bounds[first] = max(self.lower_bounds.get(first, bound), bound)
+                self._union(self._connected, first, second)
+                return
+
+        variables = self._variables_of(constraint)
+        assert len(variables) > 0
+
+        identifiers = [self._declare(variable) for variable in variables]
+        for identifier in identifiers[1:]:
+            self._union(self._connected, identifiers[0], identifier)
+
+        self.complex_constraints.append(constraint)
+
+    def _declare(self, variable: z3.ArithRef) -> int:
+        identifier = variable.get_id()
+        if identifier not in self.variables:
+            self.variables[identifier] = variable
+            self._equal[identifier] = identifier
+            self._connected[identifier] = identifier
+        return identifier
+
+    @staticmethod
+    def _find(parents: dict[int, int], identifier: int) -> int:
+        root = identifier
+        while parents[root] != root:
+            root = parents[root]
+        while parents[identifier] != root:
+            parents[identifier], identifier = root, parents[identifier]
+        return root
+
+    @staticmethod
+    def _union(parents: dict[int, int], first: int, second: int):
+        first, second = BitWidthSolver._find(parents, first), BitWidthSolver._find(parents, second)
+        if first != second:
+            parents[second] = first
+
+    @staticmethod
+    def _is_variable(expression: z3.ExprRef) -> bool:
+        return z3.is_const(expression) and expression.decl().kind() == z3.Z3_OP_UNINTERPRETED
+
+    @staticmethod
+    def _variables_of(expression: z3.ExprRef) -> list[z3.ExprRef]:
+        variables: dict[int, z3.ExprRef] = {}
+        stack = [expression]
+        while len(stack) > 0:
+            current = stack.pop()
+            if BitWidthSolver._is_variable(current):
+                variables.setdefault(current.get_id(), current)
+            else:
+                stack.extend(current.children())
+        return list(variables.values())
 
 
 class AdditionalConstraints:
@@ -131,7 +402,7 @@ class AdditionalConstraints:
     AdditionalConstraints class to customize bit-width assignment step easily.
     """
 
-    optimizer: z3.Optimize
+    constraints: BitWidthConstraints
     graph: Graph
     bit_widths: dict[Node, z3.Int]
 
@@ -148,7 +419,7 @@ class AdditionalConstraints:
 
     def __init__(
         self,
-        optimizer: z3.Optimize,
+        constraints: BitWidthConstraints,
         graph: Graph,
         bit_widths: dict[Node, z3.Int],
         comparison_strategy_preference: list[ComparisonStrategy],
@@ -157,7 +428,7 @@ class AdditionalConstraints:
         multivariate_strategy_preference: list[MultivariateStrategy],
         min_max_strategy_preference: list[MinMaxStrategy],
     ):
-        self.optimizer = optimizer
+        self.constraints = constraints
         self.graph = graph
         self.bit_widths = bit_widths
 
@@ -225,7 +496,7 @@ class AdditionalConstraints:
 
     def constraint(self, node: Node, constraint: z3.BoolRef):
         node.bit_width_constraints.append(constraint)
-        self.optimizer.add(constraint)
+        self.constraints.add(constraint)
 
     # ==========
     # Conditions
@@ -262,6 +533,20 @@ class AdditionalConstraints:
 
             self.constraint(node, self.bit_widths[pred] >= required_bit_width)
 
+    def body_shares_precision(self, node: Node, preds: list[Node]):
+        body = node.properties["kwargs"]["body"]
+
+        # inputs of the body are the predecessors of the loop
+        # (bodies are processed before the graphs they are in, see `Converter.with_loop_bodies`)
+        for pred, body_input in zip(preds, body.ordered_inputs()):
+            if body_input in self.bit_widths:
+                self.constraint(node, self.bit_widths[pred] == self.bit_widths[body_input])
+
+        # and the state keeps the same precision throughout the loop
+        body_output = body.ordered_outputs()[0]
+        self.constraint(node, self.bit_widths[preds[0]] == self.bit_widths[node])
+        self.constraint(node, self.bit_widths[body_output] == self.bit_widths[node])
+
     def comparison(self, node: Node, preds: list[Node]):
         assert len(preds) == 2
 
@@ -517,6 +802,10 @@ class AdditionalConstraints:
         },
     }
 
+    loop = {
+        body_shares_precision,
+    }
+
     matmul = {
         all_inputs_are_encrypted: {
             inputs_share_precision,
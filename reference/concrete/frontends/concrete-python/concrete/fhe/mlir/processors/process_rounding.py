@@ -153,6 +153,7 @@ class ProcessRounding(GraphProcessor):
                 graph.output_nodes[i] = replacement
 
         nx_graph.remove_node(node)
+        graph.invalidate_execution_plan()
 
     def process_successors(self, graph: Graph, node: Node):
         """
@@ -193,3 +194,5 @@ class ProcessRounding(GraphProcessor):
             if candidate is node:
                 identity = initialize(identity)
                 graph.output_nodes[i] = identity
+
+        graph.invalidate_execution_plan()
@@ -4,10 +4,9 @@ Declaration of various functions and constants related to MLIR conversion.
 
 # pylint: disable=import-error,no-name-in-module
 
-from collections import defaultdict, deque
+from collections import deque
 from copy import deepcopy
 from enum import IntEnum
-from itertools import chain, product
 from typing import Any, Optional, Union, cast
 
 import numpy as np
@@ -24,10 +23,12 @@ from ..compilation.configuration import (  # pylint: disable=unused-import  # no
 )
 from ..dtypes import Integer
 from ..internal.utils import assert_that
-from ..representation import Node, Operation
+from ..representation import Graph, Node, Operation
 
 # pylint: enable=import-error,no-name-in-module
 
+TABLE_CONSTRUCTION_MAXIMUM_BATCH_ELEMENTS = 2**22
+
 
 class HashableNdarray:
     """
@@ -77,6 +78,91 @@ def flood_replace_none_values(table: list):
     assert_that(all(value is not None for value in table))
 
 
+def evaluate_table_entries(
+    node: Node,
+    preds: list[Node],
+    variable_inputs: dict[int, np.ndarray],
+) -> list[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]]:
+    """
+    Evaluate a node on all candidate values of its variable inputs to get its table entries.
+
+    Candidate values are stacked along a new leading axis and evaluated at once,
+    and each candidate is evaluated separately only if the node cannot be evaluated that way.
+
+    Args:
+        node (Node):
+            node to evaluate
+
+        preds (List[Node]):
+            ordered predecessors to `node`
+
+        variable_inputs (Dict[int, np.ndarray]):
+            candidate values of each variable input, stacked along the leading axis,
+            all of them with the same number of candidates
+
+    Returns:
+        List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]]:
+            table entry for each candidate, or `None` if the evaluation failed
+    """
+
+    number_of_entries = len(next(iter(variable_inputs.values())))
+    elements_per_entry = max(
+        1,
+        sum(int(np.prod(pred.output.shape, dtype=np.int64)) for pred in preds),
+    )
+    chunk_size = max(1, TABLE_CONSTRUCTION_MAXIMUM_BATCH_ELEMENTS // elements_per_entry)
+
+    constants = {
+        index: pred() for index, pred in enumerate(preds) if pred.operation == Operation.Constant
+    }
+
+    table: list[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
+    for chunk_start in range(0, number_of_entries, chunk_size):
+        pred_results = [
+            (
+                np.expand_dims(constants[index], axis=0)
+                if index in constants
+                else variable_inputs[index][chunk_start : chunk_start + chunk_size]
+            )
+            for index in range(len(preds))
+        ]
+
+        try:
+            # pylint: disable=protected-access
+            evaluation = Graph._evaluate_node_batch(node, pred_results)
+            # pylint: enable=protected-access
+        except Exception:  # pylint: disable=broad-except
+            # some candidates cannot be evaluated
+            # so we evaluate them one by one below
+            pass
+        else:
+            flat_evaluation = evaluation.reshape(len(evaluation), -1)
+            is_constant = flat_evaluation.min(axis=1) == flat_evaluation.max(axis=1)
+            table.extend(
+                # if evaluation consist a single value, we can use
+                # the value instead of the full tensor to save memory
+                int(entry.min()) if entry_is_constant else entry
+                for entry, entry_is_constant in zip(evaluation, is_constant)
+            )
+            continue
+
+        inputs: list[Any] = [constants.get(index) for index in range(len(preds))]
+        for position in range(chunk_start, min(chunk_start + chunk_size, number_of_entries)):
+            try:
+                for index, candidates in variable_inputs.items():
+                    inputs[index] = np.array(candidates[position])
+                evaluation = node(*inputs)
+                table.append(
+                    evaluation if evaluation.min() != evaluation.max() else int(evaluation.min())
+                )
+            except Exception:  # pylint: disable=broad-except
+                # here we try our best to fill the table
+                # if it fails, we append None and let flooding algorithm replace None values
+                table.append(None)
+
+    return table
+
+
 def construct_table_multivariate(node: Node, preds: list[Node]) -> list[Any]:
     """
     Construct the lookup table for a multivariate node.
@@ -99,39 +185,28 @@ def construct_table_multivariate(node: Node, preds: list[Node]) -> list[Any]:
     )
 
     packing_bit_width = sum(pred.properties["original_bit_width"] for pred in preds)
-    packed_values = range(0, 2**packing_bit_width)
-
-    np.seterr(divide="ignore")
+    packed_values = np.arange(0, 2**packing_bit_width, dtype=np.int64)
 
-    table: list[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
-    for packed_value in packed_values:
-        inputs = []
-
-        shift = 0
-        for description, pred in zip(node.inputs, preds):
-            assert isinstance(description.dtype, Integer)
+    variable_inputs = {}
 
-            bit_width = pred.properties["original_bit_width"]
-            is_signed = description.dtype.is_signed
+    shift = 0
+    for index, (description, pred) in enumerate(zip(node.inputs, preds)):
+        assert isinstance(description.dtype, Integer)
 
-            value = (packed_value >> shift) & ((2**bit_width) - 1)
-            shift += bit_width
+        bit_width = pred.properties["original_bit_width"]
+        is_signed = description.dtype.is_signed
 
-            if is_signed:
-                value -= 2 ** (bit_width - 1)
+        values = (packed_values >> shift) & ((2**bit_width) - 1)
+        shift += bit_width
 
-            inputs.append(np.ones(description.shape, dtype=np.int64) * value)
+        if is_signed:
+            values -= 2 ** (bit_width - 1)
 
-        try:
-            evaluation = node(*inputs)
-            table.append(
-                evaluation if evaluation.min() != evaluation.max() else int(evaluation.min())
-            )
-        except Exception:  # pylint: disable=broad-except  # pragma: no cover
-            # here we try our best to fill the table
-            # if it fails, we append None and let flooding algorithm replace None values below
-            table.append(None)
+        values = values.reshape((-1,) + (1,) * len(description.shape))
+        variable_inputs[index] = np.broadcast_to(values, values.shape[:1] + description.shape)
 
+    np.seterr(divide="ignore")
+    table = evaluate_table_entries(node, preds, variable_inputs)
     np.seterr(divide="warn")
 
     flood_replace_none_values(table)
@@ -237,35 +312,27 @@ def construct_table(node: Node, preds: list[Node], configuration: Configuration)
         step = 1
 
     if offset_before_tlu == 0:
-        values = chain(
-            range(0, variable_input_dtype.max() + 1, step),
-            range(variable_input_dtype.min(), 0, step),
+        values = np.concatenate(
+            (
+                np.arange(0, variable_input_dtype.max() + 1, step, dtype=np.int64),
+                np.arange(variable_input_dtype.min(), 0, step, dtype=np.int64),
+            )
         )
     else:
-        values = chain(
-            range(-offset_before_tlu, variable_input_dtype.max() + 1 - offset_before_tlu, step),
+        values = np.arange(
+            -offset_before_tlu,
+            variable_input_dtype.max() + 1 - offset_before_tlu,
+            step,
+            dtype=np.int64,
         )
 
-    np.seterr(divide="ignore")
-
-    inputs: list[Any] = [pred() if pred.operation == Operation.Constant else None for pred in preds]
-    table: list[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
-    for value in values:
-        try:
-            inputs[variable_input_index] = np.ones(variable_input_shape, dtype=np.int64) * value
-            evaluation = node(*inputs)
-            table.append(
-                # if evaluation consist a single value, we can use
-                # the value instead of the full tensor to save memory
-                evaluation
-                if evaluation.min() != evaluation.max()
-                else int(evaluation.min())
-            )
-        except Exception:  # pylint: disable=broad-except
-            # here we try our best to fill the table
-            # if it fails, we append None and let flooding algorithm replace None values below
-            table.append(None)
+    values = values.reshape((-1,) + (1,) * len(variable_input_shape))
+    variable_inputs = {
+        variable_input_index: np.broadcast_to(values, values.shape[:1] + variable_input_shape),
+    }
 
+    np.seterr(divide="ignore")
+    table = evaluate_table_entries(node, preds, variable_inputs)
     np.seterr(divide="warn")
 
     flood_replace_none_values(table)
@@ -319,37 +386,32 @@ def construct_deduplicated_tables(
     if all(isinstance(value, int) for value in raw_table):
         return ((np.array(raw_table), None),)
 
-    node_complete_table = np.concatenate(
+    node_complete_table = np.stack(
         tuple(
-            np.expand_dims(
-                (
-                    array
-                    if isinstance(array, np.ndarray)
-                    else np.broadcast_to(array, node.output.shape)
-                ),
-                -1,
-            )
+            (array if isinstance(array, np.ndarray) else np.broadcast_to(array, node.output.shape))
             for array in raw_table
         ),
         axis=-1,
     )
 
-    all_cells_idx = product(*tuple(range(max_val) for max_val in node_complete_table.shape[:-1]))
-    tables_to_cell_idx: defaultdict[HashableNdarray, list[tuple[int, ...]]] = defaultdict(list)
+    # cells are grouped by the bytes of their tables, in the order they are first seen
+    cell_tables = np.ascontiguousarray(node_complete_table).reshape(-1, len(raw_table))
+    tables_to_cell_idx: dict[bytes, tuple[np.ndarray, list[tuple[int, ...]]]] = {}
 
     idx: tuple[int, ...]
-    all_idx_set = set()
-    for idx in all_cells_idx:
-        hashable_array = HashableNdarray(node_complete_table[idx])
-        tables_to_cell_idx[hashable_array].append(idx)
-        all_idx_set.add(idx)
-
-    assert_that(len(all_idx_set) == np.prod(node_complete_table.shape[:-1]))
-
-    return tuple(
-        (hashable_array.array, indices) for hashable_array, indices in tables_to_cell_idx.items()
+    for idx, cell_table in zip(np.ndindex(*node_complete_table.shape[:-1]), cell_tables):
+        key = cell_table.tobytes()
+        if key not in tables_to_cell_idx:
+            tables_to_cell_idx[key] = (cell_table, [])
+        tables_to_cell_idx[key][1].append(idx)
+
+    assert_that(
+        sum(len(indices) for _, indices in tables_to_cell_idx.values())
+        == np.prod(node_complete_table.shape[:-1])
     )
 
+    return tuple(tables_to_cell_idx.values())
+
 
 class _FromElementsOp(tensor.FromElementsOp):
     """Replace missing tensor.FromElementsOp.__init__."""
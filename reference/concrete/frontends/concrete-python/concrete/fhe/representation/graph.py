@@ -9,27 +9,89 @@ import tempfile
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping
 from copy import deepcopy
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
 
-import networkx as nx
 import numpy as np
-import scipy.special
-import z3
 
 from ..dtypes import Float, Integer, UnsignedInteger
+from ..internal.utils import LazyModule
 from .node import Node
 from .operation import Operation
 
+if TYPE_CHECKING:  # pragma: no cover
+    import networkx as nx
+    import z3
+else:
+    nx = LazyModule("networkx")
+
 P_ERROR_PER_ERROR_SIZE_CACHE: dict[float, dict[int, float]] = {}
 
+BOUND_MEASUREMENT_BATCH_SIZE = 1024
+BOUND_MEASUREMENT_MAXIMUM_BATCH_ELEMENTS = 2**24
+
+BOUND_PROPAGATION_MAXIMUM_EXHAUSTIVE_ELEMENTS = 2**20
+
+# operations whose result only consists of the elements of their inputs
+BOUND_PRESERVING_OPERATIONS = {
+    "assign_static",
+    "broadcast_to",
+    "concatenate",
+    "copy",
+    "expand_dims",
+    "flatten",
+    "identity",
+    "index_static",
+    "ravel",
+    "reshape",
+    "squeeze",
+    "transpose",
+}
+
+
+def read_only(value: Any) -> Any:
+    """
+    Get a read-only view of a value, to protect it from being modified in place.
+
+    Args:
+        value (Any):
+            value to protect
+
+    Returns:
+        Any:
+            read-only view of `value` if it's an `np.ndarray`, `value` itself otherwise
+    """
+
+    if not isinstance(value, np.ndarray):
+        return value
+
+    view = value.view()
+    view.flags.writeable = False
+    return view
+
+
+class ExecutionPlan(NamedTuple):
+    """
+    ExecutionPlan class, to represent the evaluation order of a `Graph`.
+    """
+
+    # nodes of the graph in topological order
+    nodes: tuple[Node, ...]
+
+    # positions of the ordered predecessors of each node within `nodes`
+    preds: tuple[tuple[int, ...], ...]
+
+    # index of the argument each node reads, or None if the node is not an input
+    input_slots: tuple[Optional[int], ...]
+
 
 class Graph:
     """
     Graph class, to represent computation graphs.
     """
 
-    graph: nx.MultiDiGraph
+    graph: "nx.MultiDiGraph"
 
     input_nodes: dict[int, Node]
     output_nodes: dict[int, Node]
@@ -38,16 +100,18 @@ class Graph:
 
     is_direct: bool
 
-    bit_width_constraints: Optional[z3.Optimize]
-    bit_width_assignments: Optional[z3.Model]
+    bit_width_constraints: Optional[list["z3.BoolRef"]]
+    bit_width_assignments: Optional[dict[str, int]]
 
     name: str
 
     location: str
 
+    _execution_plan: Optional[ExecutionPlan]
+
     def __init__(
         self,
-        graph: nx.MultiDiGraph,
+        graph: "nx.MultiDiGraph",
         input_nodes: dict[int, Node],
         output_nodes: dict[int, Node],
         name: str,
@@ -69,6 +133,8 @@ class Graph:
         self.name = name
         self.location = location
 
+        self._execution_plan = None
+
         self.prune_useless_nodes()
 
     def __call__(
@@ -83,7 +149,13 @@ class Graph:
         tuple[Union[np.bool_, np.integer, np.floating, np.ndarray], ...],
     ]:
         evaluation = self.evaluate(*args, p_error=p_error)
-        result = tuple(evaluation[node] for node in self.ordered_outputs())
+
+        # results of some nodes are read-only views of the results of their predecessors
+        # so we copy them to give the caller arrays which can be modified freely
+        result = tuple(
+            (value.copy() if isinstance(value, np.ndarray) and not value.flags.writeable else value)
+            for value in (evaluation[node] for node in self.ordered_outputs())
+        )
         return result if len(result) > 1 else result[0]
 
     def evaluate(
@@ -113,23 +185,27 @@ class Graph:
 
         assert isinstance(p_error, float)
 
-        node_results: dict[Node, Union[np.bool_, np.integer, np.floating, np.ndarray]] = {}
-        for node in nx.topological_sort(self.graph):
-            if node.operation == Operation.Input:
-                node_results[node] = node(args[self.input_indices[node]])
+        plan = self.execution_plan()
+
+        results: list[Union[np.bool_, np.integer, np.floating, np.ndarray]] = []
+        for node, pred_indices, input_slot in zip(plan.nodes, plan.preds, plan.input_slots):
+            if input_slot is not None:
+                results.append(node(args[input_slot]))
                 continue
 
-            pred_results = [deepcopy(node_results[pred]) for pred in self.ordered_preds_of(node)]
+            protect = deepcopy if node.mutates_inputs else read_only
+            pred_results = [protect(results[pred_index]) for pred_index in pred_indices]
 
             if p_error > 0.0 and node.converted_to_table_lookup:  # pragma: no cover
+                pred_nodes = [plan.nodes[pred_index] for pred_index in pred_indices]
                 variable_input_indices = [
                     idx
-                    for idx, pred in enumerate(self.ordered_preds_of(node))
+                    for idx, pred in enumerate(pred_nodes)
                     if pred.operation != Operation.Constant
                 ]
 
                 for index in variable_input_indices:
-                    pred_node = self.ordered_preds_of(node)[index]
+                    pred_node = pred_nodes[index]
                     if pred_node.operation != Operation.Input:
                         dtype = node.inputs[index].dtype
                         if isinstance(dtype, Integer):
@@ -137,6 +213,11 @@ class Graph:
                             # to learn more about the distribution of error
 
                             if p_error not in P_ERROR_PER_ERROR_SIZE_CACHE:
+                                # pylint: disable=import-outside-toplevel
+                                import scipy.special
+
+                                # pylint: enable=import-outside-toplevel
+
                                 std_score = math.sqrt(2) * scipy.special.erfcinv(p_error)
                                 p_error_per_error_size = {}
 
@@ -196,7 +277,7 @@ class Graph:
                             pred_results[index] = new_result
 
             try:
-                node_results[node] = node(*pred_results)
+                results.append(node(*pred_results))
             except Exception as error:
                 raise RuntimeError(
                     "Evaluation of the graph failed\n\n"
@@ -206,7 +287,142 @@ class Graph:
                     )
                 ) from error
 
-        return node_results
+        return dict(zip(plan.nodes, results))
+
+    def evaluate_batch(
+        self,
+        *args: np.ndarray,
+        before_node: Optional[Callable[[Node, list[np.ndarray]], None]] = None,
+    ) -> dict[Node, np.ndarray]:
+        """
+        Perform the computation `Graph` represents on many samples at once.
+
+        Each argument is the stack of the samples of the corresponding input along a new leading
+        axis. Elementwise nodes are evaluated once for the whole batch, other nodes are evaluated
+        sample by sample.
+
+        Args:
+            *args (List[np.ndarray]):
+                stacked inputs to the computation
+
+            before_node (Optional[Callable[[Node, List[np.ndarray]], None]], default = None):
+                function to call with each node and the stacked values of its predecessors
+                right before the node is evaluated (e.g., to adjust the node using its inputs)
+
+        Returns:
+            Dict[Node, np.ndarray]:
+                nodes and their stacked values during computation
+                (leading axis is of size 1 for the nodes which don't depend on any input)
+        """
+
+        plan = self.execution_plan()
+
+        results: list[np.ndarray] = []
+        for node, pred_indices, input_slot in zip(plan.nodes, plan.preds, plan.input_slots):
+            if input_slot is not None:
+                value = args[input_slot]
+                if value.shape[1:] != node.output.shape:
+                    message = (
+                        f"Batched evaluation of input '{node.label()}' failed because "
+                        f"the argument does not have the expected shape of {node.output.shape}"
+                    )
+                    raise ValueError(message)
+
+                results.append(value)
+                continue
+
+            pred_results = [results[pred_index] for pred_index in pred_indices]
+            if before_node is not None:
+                before_node(node, pred_results)
+
+            results.append(self._evaluate_node_batch(node, pred_results))
+
+        return dict(zip(plan.nodes, results))
+
+    @staticmethod
+    def _evaluate_node_batch(node: Node, pred_results: list[np.ndarray]) -> np.ndarray:
+        batch_size = max((pred_result.shape[0] for pred_result in pred_results), default=1)
+
+        def sample_of(pred_result: np.ndarray, index: int) -> Any:
+            sample = pred_result[index if pred_result.shape[0] != 1 else 0]
+            return deepcopy(sample) if node.mutates_inputs else read_only(sample)
+
+        def evaluate_sample(index: int) -> Union[np.bool_, np.integer, np.floating, np.ndarray]:
+            return node(*(sample_of(pred_result, index) for pred_result in pred_results))
+
+        result: Any = None
+        if node.is_elementwise:
+            if node.properties["name"] == "subgraph":
+                subgraph = node.properties["kwargs"]["subgraph"]
+                terminal_node = node.properties["kwargs"]["terminal_node"]
+                result = subgraph.evaluate_batch(*pred_results)[terminal_node]
+            else:
+                rank = len(node.output.shape)
+                result = node.evaluator(
+                    *(
+                        pred_result.reshape(
+                            pred_result.shape[:1]
+                            + (1,) * (rank - (pred_result.ndim - 1))
+                            + pred_result.shape[1:]
+                        )
+                        for pred_result in pred_results
+                    )
+                )
+        elif (
+            node.is_batchable
+            and len(pred_results) != 0
+            and all(pred_result.shape[0] == 1 for pred_result in pred_results[1:])
+        ):
+            result = node.evaluator(
+                pred_results[0],
+                *(sample_of(pred_result, 0) for pred_result in pred_results[1:]),
+            )
+        elif node.operation == Operation.Generic and node.properties["name"] == "loop":
+            result = Graph._evaluate_loop_batch(node, pred_results)
+
+        if result is not None:
+            # numpy promotes types of arrays and scalars differently
+            # so we make sure batched evaluation matches the evaluation of the first sample
+            probe = np.asarray(evaluate_sample(0))
+            if (
+                isinstance(result, np.ndarray)
+                and result.shape == (batch_size, *node.output.shape)
+                and result.dtype == probe.dtype
+                and np.array_equal(result[0], probe, equal_nan=probe.dtype.kind == "f")
+            ):
+                return result
+
+        results = [np.asarray(evaluate_sample(index)) for index in range(batch_size)]
+        if len({result.dtype for result in results}) != 1:
+            message = (
+                f"Batched evaluation of '{node.label()}' node failed "
+                f"because samples resulted in different types"
+            )
+            raise ValueError(message)
+
+        return np.stack(results)
+
+    @staticmethod
+    def _evaluate_loop_batch(
+        node: Node,
+        pred_results: list[np.ndarray],
+        on_iteration: Optional[Callable[[dict[Node, np.ndarray]], None]] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate a loop node on many samples at once, by evaluating its body on all of them.
+        """
+
+        body = node.properties["kwargs"]["body"]
+        output = body.ordered_outputs()[0]
+
+        state, *arguments = pred_results
+        for _ in range(node.properties["kwargs"]["iterations"]):
+            evaluation = body.evaluate_batch(state, *arguments)
+            if on_iteration is not None:
+                on_iteration(evaluation)
+            state = evaluation[output]
+
+        return state
 
     def draw(
         self,
@@ -415,8 +631,9 @@ class Graph:
         # after their type information is added, and we only have line numbers, not nodes
         highlighted_lines: dict[int, list[str]] = {}
 
-        # subgraphs to format after the main graph is formatted
+        # subgraphs and bodies of loops to format after the main graph is formatted
         subgraphs: dict[str, Graph] = {}
+        bodies: dict[str, Graph] = {}
 
         # format nodes
         for node in nx.lexicographical_topological_sort(self.graph):
@@ -449,6 +666,10 @@ class Graph:
             if node.operation == Operation.Generic and "subgraph" in node.properties["kwargs"]:
                 subgraphs[line] = node.properties["kwargs"]["subgraph"]
 
+            # if exists, save the body
+            if node.operation == Operation.Generic and node.properties["name"] == "loop":
+                bodies[line] = node.properties["kwargs"]["body"]
+
             # get formatted bounds
             bounds = ""
             if node.bounds is not None:
@@ -567,6 +788,25 @@ class Graph:
                 result += f"    {line}:\n\n"
                 result += "\n".join(f"        {line}" for line in subgraph_lines)
 
+        # format bodies of loops after the actual graph as well
+        if len(bodies) > 0:
+            result += "\n\n"
+            result += "Loop bodies:"
+            for line, body in bodies.items():
+                body_lines = body.format(
+                    maximum_constant_length=maximum_constant_length,
+                    highlighted_nodes={},
+                    show_types=show_types,
+                    show_bounds=show_bounds,  # bounds of bodies are measured over all iterations
+                    show_tags=show_tags,
+                    show_locations=show_locations,
+                    show_assigned_bit_widths=show_assigned_bit_widths,
+                ).split("\n")
+
+                result += "\n\n"
+                result += f"    {line}:\n\n"
+                result += "\n".join(f"        {line}" for line in body_lines)
+
         return result
 
     def format_bit_width_constraints(self) -> str:
@@ -596,9 +836,8 @@ class Graph:
         """
 
         lines = []
-        for variable in self.bit_width_assignments.decls():  # type: ignore
-            if variable.name().startswith(f"{self.name}.") or variable.name() == "input_output":
-                width = self.bit_width_assignments.get_interp(variable)  # type: ignore
+        for variable, width in self.bit_width_assignments.items():  # type: ignore
+            if variable.startswith(f"{self.name}.") or variable == "input_output":
                 lines.append(f"{variable} = {width}")
 
         def sorter(line: str) -> int:
@@ -629,6 +868,7 @@ class Graph:
     def measure_bounds(
         self,
         inputset: Union[Iterable[Any], Iterable[tuple[Any, ...]]],
+        batch_size: int = BOUND_MEASUREMENT_BATCH_SIZE,
     ) -> dict[Node, dict[str, Union[np.integer, np.floating]]]:
         """
         Evaluate the `Graph` using an inputset and measure bounds.
@@ -653,50 +893,322 @@ class Graph:
             def g(x, y):
                 ...
 
+        Samples are evaluated in batches (see `Graph.evaluate_batch`),
+        and batches which cannot be evaluated at once are evaluated sample by sample.
+
+        Bounds of the nodes in the bodies of loops are measured over all iterations,
+        and they are included in the result.
+
         Args:
             inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
                 inputset to use
 
+            batch_size (int, default = BOUND_MEASUREMENT_BATCH_SIZE):
+                maximum number of samples to evaluate at once
+
         Returns:
             Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
                 bounds of each node in the `Graph`
         """
 
-        bounds = {}
+        bounds: dict[Node, dict[str, Union[np.integer, np.floating]]] = {}
 
-        inputset_iterator = iter(inputset)
+        def update_bounds(node: Node, minimum: Any, maximum: Any):
+            if node not in bounds:
+                bounds[node] = {"min": minimum, "max": maximum}
+            else:
+                bounds[node] = {
+                    "min": np.minimum(bounds[node]["min"], minimum),
+                    "max": np.maximum(bounds[node]["max"], maximum),
+                }
 
-        sample = next(inputset_iterator)
-        if not isinstance(sample, tuple):
-            sample = (sample,)
+        elements_per_sample = sum(
+            int(np.prod(node.output.shape, dtype=np.int64)) for node in self.graph.nodes()
+        )
+        batch_size = max(
+            1,
+            min(
+                batch_size, BOUND_MEASUREMENT_MAXIMUM_BATCH_ELEMENTS // max(1, elements_per_sample)
+            ),
+        )
+
+        inputset_iterator = iter(inputset)
 
         index = 0
+        while True:
+            batch = [
+                sample if isinstance(sample, tuple) else (sample,)
+                for sample in islice(inputset_iterator, batch_size)
+            ]
+            if len(batch) == 0:
+                break
+
+            batch_bounds = self._measure_batch_bounds(batch) if len(batch) > 1 else None
+            if batch_bounds is not None:
+                for node, (minimum, maximum) in batch_bounds.items():
+                    update_bounds(node, minimum, maximum)
+                index += len(batch)
+                continue
+
+            for sample in batch:
+                try:
+                    evaluation = self.evaluate(*sample)
+                    for node, value in evaluation.items():
+                        update_bounds(node, value.min(), value.max())
+                    self._measure_loop_bounds(evaluation, update_bounds, is_batched=False)
+                except Exception as error:
+                    message = f"Bound measurement using inputset[{index}] failed"
+                    raise RuntimeError(message) from error
+
+                index += 1
+
+        return bounds
+
+    def _measure_batch_bounds(self, batch: list[tuple[Any, ...]]) -> Optional[dict[Node, tuple]]:
+        """
+        Measure bounds of a batch of samples at once, or return None if it's not possible.
+        """
+
+        stacked_inputs = self.stack_batch(batch)
+        if stacked_inputs is None:
+            return None
+
+        bounds: dict[Node, tuple] = {}
+
+        def update_bounds(node: Node, minimum: Any, maximum: Any):
+            if node in bounds:
+                minimum = np.minimum(bounds[node][0], minimum)
+                maximum = np.maximum(bounds[node][1], maximum)
+            bounds[node] = (minimum, maximum)
+
         try:
-            evaluation = self.evaluate(*sample)
+            evaluation = self.evaluate_batch(*stacked_inputs)
             for node, value in evaluation.items():
-                bounds[node] = {
-                    "min": value.min(),
-                    "max": value.max(),
-                }
+                update_bounds(node, value.min(), value.max())
+            self._measure_loop_bounds(evaluation, update_bounds)
+        except Exception:  # pylint: disable=broad-except
+            # batch is re-evaluated sample by sample to report the exact sample that failed
+            return None
 
-            for sample in inputset_iterator:
-                index += 1
-                if not isinstance(sample, tuple):
-                    sample = (sample,)
+        return bounds
+
+    def _measure_loop_bounds(
+        self,
+        evaluation: Mapping[Node, Any],
+        update_bounds: Callable[[Node, Any, Any], None],
+        is_batched: bool = True,
+    ):
+        """
+        Measure bounds of the nodes in the bodies of the loops of the `Graph`.
+
+        Bodies are evaluated on the values of the predecessors of their loops in `evaluation`,
+        and bounds of their nodes are measured over all iterations.
+        """
+
+        for node in self.query_nodes(operation_filter="loop"):
+            body = node.properties["kwargs"]["body"]
+
+            def on_iteration(body_evaluation: dict[Node, np.ndarray], body: Graph = body):
+                for body_node, value in body_evaluation.items():
+                    update_bounds(body_node, value.min(), value.max())
+                body._measure_loop_bounds(body_evaluation, update_bounds)
 
-                evaluation = self.evaluate(*sample)
-                for node, value in evaluation.items():
-                    bounds[node] = {
-                        "min": np.minimum(bounds[node]["min"], value.min()),
-                        "max": np.maximum(bounds[node]["max"], value.max()),
-                    }
+            pred_results = [
+                evaluation[pred] if is_batched else np.expand_dims(evaluation[pred], axis=0)
+                for pred in self.ordered_preds_of(node)
+            ]
+            self._evaluate_loop_batch(node, pred_results, on_iteration)
+
+    def stack_batch(self, batch: list[tuple[Any, ...]]) -> Optional[list[np.ndarray]]:
+        """
+        Stack the samples of a batch into the arguments of `Graph.evaluate_batch`.
 
-        except Exception as error:
-            message = f"Bound measurement using inputset[{index}] failed"
-            raise RuntimeError(message) from error
+        Args:
+            batch (List[Tuple[Any, ...]]):
+                samples to stack
+
+        Returns:
+            Optional[List[np.ndarray]]:
+                stacked samples of each input,
+                or None if the samples cannot be evaluated at once
+                (e.g., if they have different types or shapes)
+        """
+
+        if any(len(sample) != self.inputs_count for sample in batch):
+            return None
+
+        stacked_inputs = []
+        for index, input_node in enumerate(self.ordered_inputs()):
+            values = [sample[index] for sample in batch]
+
+            value_types = {type(value) for value in values}
+            if len(value_types) != 1:
+                return None
+            value_type = value_types.pop()
+
+            try:
+                if value_type is int:
+                    stacked = np.array(values, dtype=np.int64)
+                    int64_info = np.iinfo(np.int64)
+                    if stacked.min() == int64_info.min or stacked.max() == int64_info.max:
+                        return None
+                elif value_type is float:
+                    stacked = np.array(values, dtype=np.float64)
+                elif value_type in (list, np.ndarray) or issubclass(value_type, np.generic):
+                    arrays = [np.asarray(value) for value in values]
+                    if len({array.dtype for array in arrays}) != 1:
+                        return None
+                    stacked = np.stack(arrays)
+                else:
+                    return None
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+            if stacked.dtype.kind not in "biuf" or stacked.shape[1:] != input_node.output.shape:
+                return None
+
+            stacked_inputs.append(stacked)
+
+        return stacked_inputs
+
+    def measure_bounds_from_ranges(
+        self,
+        ranges: list[tuple[Any, Any]],
+        corners: Iterable[tuple[Any, ...]],
+    ) -> dict[Node, dict[str, Union[np.integer, np.floating]]]:
+        """
+        Propagate ranges of the inputs through the `Graph` to determine bounds.
+
+        Bounds are propagated with interval arithmetic for the operations which permit it
+        (e.g., additions, subtractions, multiplications, reshapes, sums),
+        and by evaluating the node on every value of its input range
+        for elementwise operations on a single small range.
+
+        Bounds of the remaining operations are measured by evaluating the `Graph` on the corners,
+        which is exact only if such operations are monotonic.
+
+        Args:
+            ranges (List[Tuple[Any, Any]]):
+                minimum and maximum value of each input, ordered by their indices
+
+            corners (Iterable[Tuple[Any, ...]]):
+                samples to evaluate the `Graph` on for the operations bounds can't be propagated
+
+        Returns:
+            Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
+                bounds of each node in the `Graph`
+        """
+
+        bounds = self.measure_bounds(corners)
+
+        plan = self.execution_plan()
+        intervals: list[tuple[Any, Any]] = []
+
+        for node, pred_indices, input_slot in zip(plan.nodes, plan.preds, plan.input_slots):
+            if input_slot is not None:
+                interval: Optional[tuple[Any, Any]] = ranges[input_slot]
+            else:
+                interval = self._propagate_interval(
+                    node,
+                    [plan.nodes[pred_index] for pred_index in pred_indices],
+                    [intervals[pred_index] for pred_index in pred_indices],
+                )
+
+            if interval is None:
+                interval = (bounds[node]["min"], bounds[node]["max"])
+            else:
+                # types of bounds are taken from the evaluation of the corners
+                minimum, maximum = interval
+                interval = (
+                    type(bounds[node]["min"])(minimum),
+                    type(bounds[node]["max"])(maximum),
+                )
+                bounds[node] = {"min": interval[0], "max": interval[1]}
+
+            intervals.append(interval)
 
         return bounds
 
+    @staticmethod
+    def _propagate_interval(
+        node: Node,
+        preds: list[Node],
+        pred_intervals: list[tuple[Any, Any]],
+    ) -> Optional[tuple[Any, Any]]:
+        """
+        Propagate intervals of the predecessors of an integer node, or return None if not possible.
+        """
+
+        if not isinstance(node.output.dtype, Integer) or any(
+            not isinstance(pred.output.dtype, Integer) for pred in preds
+        ):
+            return None
+
+        if node.operation == Operation.Constant:
+            return None
+
+        intervals = [(int(minimum), int(maximum)) for minimum, maximum in pred_intervals]
+        name = node.properties["name"]
+
+        if name in BOUND_PRESERVING_OPERATIONS and len(intervals) > 0:
+            return (
+                min(minimum for minimum, _ in intervals),
+                max(maximum for _, maximum in intervals),
+            )
+
+        if name == "add" and len(intervals) == 2:
+            (a_min, a_max), (b_min, b_max) = intervals
+            return a_min + b_min, a_max + b_max
+
+        if name == "subtract" and len(intervals) == 2:
+            (a_min, a_max), (b_min, b_max) = intervals
+            return a_min - b_max, a_max - b_min
+
+        if name == "multiply" and len(intervals) == 2:
+            (a_min, a_max), (b_min, b_max) = intervals
+            products = [a_min * b_min, a_min * b_max, a_max * b_min, a_max * b_max]
+            return min(products), max(products)
+
+        if name == "negative" and len(intervals) == 1:
+            ((minimum, maximum),) = intervals
+            return -maximum, -minimum
+
+        if name == "sum" and len(intervals) == 1:
+            ((minimum, maximum),) = intervals
+            input_size = int(np.prod(preds[0].output.shape, dtype=np.int64))
+            output_size = int(np.prod(node.output.shape, dtype=np.int64))
+            count = input_size // max(1, output_size)
+            return count * minimum, count * maximum
+
+        variable_indices = [
+            index for index, pred in enumerate(preds) if pred.operation != Operation.Constant
+        ]
+        if not node.is_elementwise or len(variable_indices) != 1:
+            return None
+
+        (variable_index,) = variable_indices
+        minimum, maximum = intervals[variable_index]
+
+        variable_size = int(np.prod(preds[variable_index].output.shape, dtype=np.int64))
+        if (maximum - minimum + 1) * variable_size > BOUND_PROPAGATION_MAXIMUM_EXHAUSTIVE_ELEMENTS:
+            return None
+
+        pred_results = []
+        for index, pred in enumerate(preds):
+            if index == variable_index:
+                values = np.arange(minimum, maximum + 1, dtype=np.int64)
+                values = values.reshape((-1,) + (1,) * len(pred.output.shape))
+                pred_results.append(np.broadcast_to(values, values.shape[:1] + pred.output.shape))
+            else:
+                pred_results.append(np.expand_dims(pred(), axis=0))
+
+        try:
+            result = Graph._evaluate_node_batch(node, pred_results)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        return result.min(), result.max()
+
     def update_with_bounds(self, bounds: dict[Node, dict[str, Union[np.integer, np.floating]]]):
         """
         Update `ValueDescription`s within the `Graph` according to measured bounds.
@@ -706,6 +1218,8 @@ class Graph:
                 bounds of each node in the `Graph`
         """
 
+        self.invalidate_execution_plan()
+
         for node in self.query_nodes(ordered=True):
             if node in bounds:
                 min_bound = bounds[node]["min"]
@@ -746,6 +1260,91 @@ class Graph:
                         input_idx = edge["input_idx"]
                         successor.inputs[input_idx] = node.output
 
+            if node.operation == Operation.Generic and node.properties["name"] == "loop":
+                self._update_loop_with_bounds(node, bounds)
+
+    def _update_loop_with_bounds(
+        self,
+        node: Node,
+        bounds: dict[Node, dict[str, Union[np.integer, np.floating]]],
+    ):
+        """
+        Update `ValueDescription`s within the body of a loop according to measured bounds.
+
+        Inputs of the body are extended to cover the values of the predecessors of the loop,
+        and the state is made signed everywhere if it's signed somewhere,
+        as it needs to have the same type throughout the loop.
+        """
+
+        body = node.properties["kwargs"]["body"]
+
+        body_bounds = dict(bounds)
+        for pred, body_input in zip(self.ordered_preds_of(node), body.ordered_inputs()):
+            if pred not in bounds:
+                continue
+
+            if body_input not in body_bounds:
+                body_bounds[body_input] = bounds[pred]
+            else:
+                body_bounds[body_input] = {
+                    "min": np.minimum(body_bounds[body_input]["min"], bounds[pred]["min"]),
+                    "max": np.maximum(body_bounds[body_input]["max"], bounds[pred]["max"]),
+                }
+
+        body.update_with_bounds(body_bounds)
+
+        state_nodes = [
+            state_node
+            for state_node in (body.ordered_inputs()[0], body.ordered_outputs()[0], node)
+            if state_node.bounds is not None and isinstance(state_node.output.dtype, Integer)
+        ]
+        if any(state_node.output.dtype.is_signed for state_node in state_nodes):  # type: ignore
+            for state_node in state_nodes:
+                dtype = state_node.output.dtype
+                assert isinstance(dtype, Integer)
+
+                # values are updated in place, as they are shared with successors of the nodes
+                dtype.update_to_represent(np.array(state_node.bounds), force_signed=True)
+
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Get the execution plan of the `Graph`.
+
+        Plan is computed once and reused by subsequent evaluations,
+        until it's invalidated by a pass mutating the graph.
+
+        Returns:
+            ExecutionPlan:
+                nodes in topological order, along with their predecessors and input slots
+        """
+
+        if self._execution_plan is not None:
+            return self._execution_plan
+
+        nodes = tuple(nx.lexicographical_topological_sort(self.graph))
+        positions = {node: position for position, node in enumerate(nodes)}
+
+        self._execution_plan = ExecutionPlan(
+            nodes=nodes,
+            preds=tuple(
+                tuple(positions[pred] for pred in self.ordered_preds_of(node)) for node in nodes
+            ),
+            input_slots=tuple(
+                self.input_indices[node] if node.operation == Operation.Input else None
+                for node in nodes
+            ),
+        )
+        return self._execution_plan
+
+    def invalidate_execution_plan(self):
+        """
+        Invalidate the execution plan of the `Graph`.
+
+        Passes adding or removing nodes or edges of the graph must call this method.
+        """
+
+        self._execution_plan = None
+
     def ordered_inputs(self) -> list[Node]:
         """
         Get the input nodes of the `Graph`, ordered by their indices.
@@ -791,6 +1390,7 @@ class Graph:
         """
         Remove unreachable nodes from the graph.
         """
+        self.invalidate_execution_plan()
         outputs = self.ordered_outputs()
         used = nx.ancestors(self.graph, outputs[0])
         for output in outputs[1:]:
@@ -6,10 +6,9 @@ import os
 import time
 import traceback
 from copy import deepcopy
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
-import z3
 
 from ..internal.utils import assert_that
 from ..values import ValueDescription
@@ -22,6 +21,9 @@ from .utils import (
     format_indexing_element,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    import z3
+
 
 class Node:
     """
@@ -41,7 +43,7 @@ class Node:
     tag: str
     created_at: float
 
-    bit_width_constraints: list[z3.Bool]
+    bit_width_constraints: list["z3.Bool"]
 
     @staticmethod
     def constant(constant: Any) -> "Node":
@@ -462,6 +464,7 @@ class Node:
             "expand_dims",
             "index_dynamic",
             "index_static",
+            "loop",
             "matmul",
             "maxpool",
             "multiply",
@@ -514,5 +517,79 @@ class Node:
             "zeros",
         ]
 
+    @property
+    def is_elementwise(self) -> bool:
+        """
+        Get whether the node is applied to each element of its (broadcasted) inputs independently.
+
+        Elementwise nodes can be evaluated on many samples at once
+        by stacking the samples along a new leading axis.
+
+        Returns:
+            bool:
+                True if the node is elementwise, False otherwise
+        """
+
+        if self.operation != Operation.Generic:
+            return False
+
+        if self.properties["attributes"].get("is_multivariate"):
+            # multivariate functions are required to be applied to each cell independently
+            return True
+
+        name = self.properties["name"]
+        if name == "tlu":
+            return np.issubdtype(self.properties["kwargs"]["table"].dtype, np.integer)
+
+        if name in [
+            "around",
+            "astype",
+            "clip",
+            "identity",
+            "relu",
+            "round",
+            "round_bit_pattern",
+            "subgraph",
+            "truncate_bit_pattern",
+            "where",
+        ]:
+            return True
+
+        operation = getattr(self.evaluator, "operation", None)
+        return isinstance(operation, np.ufunc) and len(self.properties["args"]) == 0
+
+    @property
+    def is_batchable(self) -> bool:
+        """
+        Get whether the evaluator of the node accepts extra leading axes on its first input.
+
+        Batchable nodes can be evaluated on many samples at once
+        by stacking the samples of their first input along a new leading axis,
+        as long as their other inputs are the same for all samples.
+
+        Returns:
+            bool:
+                True if the node is batchable, False otherwise
+        """
+
+        return self.operation == Operation.Generic and bool(
+            self.properties["attributes"].get("is_batchable")
+        )
+
+    @property
+    def mutates_inputs(self) -> bool:
+        """
+        Get whether the evaluator of the node modifies its inputs in place.
+
+        Returns:
+            bool:
+                True if the node modifies its inputs in place, False otherwise
+        """
+
+        return self.operation == Operation.Generic and self.properties["name"] in [
+            "assign_dynamic",
+            "assign_static",
+        ]
+
     def __lt__(self, other) -> bool:
         return self.created_at < other.created_at
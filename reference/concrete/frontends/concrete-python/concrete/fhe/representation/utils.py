@@ -10,6 +10,7 @@ import numpy as np
 from ..internal.utils import assert_that
 
 KWARGS_IGNORED_IN_FORMATTING: set[str] = {
+    "body",
     "subgraph",
     "terminal_node",
 }
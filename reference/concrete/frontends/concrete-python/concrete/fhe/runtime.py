@@ -0,0 +1,10 @@
+"""
+Client and server side of Concrete, to encrypt, run and decrypt already compiled programs.
+
+Heavy dependencies of tracing and compilation (e.g., `z3`, `scipy`, `networkx`) are only
+imported on first trace or compilation, so processes importing this module never load them.
+"""
+
+from .compilation import Client, ClientSpecs, EvaluationKeys, Keys, Server, Value
+
+__all__ = ["Client", "ClientSpecs", "EvaluationKeys", "Keys", "Server", "Value"]
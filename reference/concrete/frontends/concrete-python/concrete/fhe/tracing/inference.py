@@ -0,0 +1,237 @@
+"""
+Declaration of shape and dtype inference rules for traced numpy operations.
+
+Operations are traced on samples filled with ones, so every element of their results is the same.
+Instead of evaluating operations on full-size samples, inference rules evaluate them on the smallest
+slices of the samples which result in the same elements (e.g., a single row and column for matmul),
+and compute the shape of the result without evaluating anything.
+"""
+
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+
+def infer(
+    operation: Callable,
+    samples: list[Any],
+    kwargs: dict[str, Any],
+) -> Optional[tuple[Any, tuple[int, ...]]]:
+    """
+    Infer the result of an operation on samples filled with ones.
+
+    Args:
+        operation (Callable):
+            operation to infer the result of
+
+        samples (List[Any]):
+            samples the operation is applied to, filled with ones
+            (numpy scalars, arrays, or tuples of them)
+
+        kwargs (Dict[str, Any]):
+            kwargs of the operation
+
+    Returns:
+        Optional[Tuple[Any, Tuple[int, ...]]]:
+            element of the result of the operation (as a scalar or an array with the same dtype)
+            and the shape of the result, or None if the operation needs to be evaluated
+            (e.g., if it has no inference rule or if inference failed)
+    """
+
+    rule = INFERENCE_RULES.get(operation)
+    if rule is None and isinstance(operation, np.ufunc) and operation.nout == 1:
+        rule = _infer_elementwise
+
+    if rule is None:
+        return None
+
+    def is_empty(sample: Any) -> bool:
+        if isinstance(sample, tuple):
+            return any(is_empty(item) for item in sample)
+        return np.size(sample) == 0
+
+    if any(is_empty(sample) for sample in samples):
+        return None
+
+    try:
+        return rule(operation, *samples, **kwargs)
+    except Exception:  # pylint: disable=broad-except
+        # invalid operations are evaluated to report the error numpy reports
+        return None
+
+
+def _slice(sample: Any, kept_axes: set[int]) -> Any:
+    """
+    Slice a sample to a size of one along all of its axes but the kept ones.
+    """
+
+    if not isinstance(sample, np.ndarray) or sample.ndim == 0:
+        return sample
+
+    return sample[
+        tuple(slice(None) if axis in kept_axes else slice(0, 1) for axis in range(sample.ndim))
+    ]
+
+
+def _normalize_axes(axis: Any, ndim: int) -> tuple[int, ...]:
+    """
+    Normalize the axes of an operation to a tuple of non-negative axes.
+    """
+
+    if axis is None:
+        return tuple(range(ndim))
+
+    axes = tuple(axis) if isinstance(axis, (tuple, list)) else (axis,)
+    normalized = tuple(int(item) + ndim if item < 0 else int(item) for item in axes)
+
+    if any(not 0 <= item < ndim for item in normalized) or len(set(normalized)) != len(axes):
+        message = f"Axis {axis} is out of bounds for array of dimension {ndim}"
+        raise ValueError(message)
+
+    return normalized
+
+
+def _infer_elementwise(operation: Callable, *samples: Any, **kwargs: Any):
+    """
+    Infer the result of an operation applied to each element of its broadcasted inputs.
+    """
+
+    shape = np.broadcast_shapes(*(np.shape(sample) for sample in samples))
+    return operation(*(_slice(sample, set()) for sample in samples), **kwargs), shape
+
+
+def _infer_reduction(operation: Callable, sample: Any, **kwargs: Any):
+    """
+    Infer the result of a reduction (e.g., sum, max, min) along some axes of its input.
+    """
+
+    shape = np.shape(sample)
+    axes = _normalize_axes(kwargs.get("axis"), len(shape))
+
+    if kwargs.get("keepdims", False):
+        result_shape = tuple(1 if axis in axes else size for axis, size in enumerate(shape))
+    else:
+        result_shape = tuple(size for axis, size in enumerate(shape) if axis not in axes)
+
+    return operation(_slice(sample, set(axes)), **kwargs), result_shape
+
+
+def _infer_matmul(operation: Callable, lhs: Any, rhs: Any, **kwargs: Any):
+    """
+    Infer the result of a matrix multiplication.
+    """
+
+    lhs_shape = np.shape(lhs)
+    rhs_shape = np.shape(rhs)
+
+    if len(lhs_shape) == 0 or len(rhs_shape) == 0:
+        message = "Matrix multiplication of scalars is not possible"
+        raise ValueError(message)
+
+    lhs_matrix_shape = lhs_shape if len(lhs_shape) >= 2 else (1, *lhs_shape)
+    rhs_matrix_shape = rhs_shape if len(rhs_shape) >= 2 else (*rhs_shape, 1)
+
+    if lhs_matrix_shape[-1] != rhs_matrix_shape[-2]:
+        message = f"Shapes {lhs_shape} and {rhs_shape} cannot be multiplied"
+        raise ValueError(message)
+
+    batch_shape = np.broadcast_shapes(lhs_matrix_shape[:-2], rhs_matrix_shape[:-2])
+
+    result_shape = batch_shape
+    if len(lhs_shape) >= 2:
+        result_shape += (lhs_shape[-2],)
+    if len(rhs_shape) >= 2:
+        result_shape += (rhs_shape[-1],)
+
+    lhs_slice = _slice(lhs, {len(lhs_shape) - 1})
+    rhs_slice = _slice(rhs, {len(rhs_shape) - 2} if len(rhs_shape) >= 2 else {0})
+
+    return operation(lhs_slice, rhs_slice, **kwargs), result_shape
+
+
+def _infer_dot(operation: Callable, lhs: Any, rhs: Any, **kwargs: Any):
+    """
+    Infer the result of a dot product.
+    """
+
+    lhs_shape = np.shape(lhs)
+    rhs_shape = np.shape(rhs)
+
+    if len(lhs_shape) == 0 or len(rhs_shape) == 0:
+        return _infer_elementwise(operation, lhs, rhs, **kwargs)
+
+    contracted_rhs_axis = len(rhs_shape) - 2 if len(rhs_shape) >= 2 else 0
+    if lhs_shape[-1] != rhs_shape[contracted_rhs_axis]:
+        message = f"Shapes {lhs_shape} and {rhs_shape} are not aligned"
+        raise ValueError(message)
+
+    result_shape = (
+        lhs_shape[:-1] + rhs_shape[:contracted_rhs_axis] + rhs_shape[contracted_rhs_axis + 1 :]
+    )
+
+    lhs_slice = _slice(lhs, {len(lhs_shape) - 1})
+    rhs_slice = _slice(rhs, {contracted_rhs_axis})
+
+    return operation(lhs_slice, rhs_slice, **kwargs), result_shape
+
+
+def _infer_concatenate(operation: Callable, samples: tuple[Any, ...], **kwargs: Any):
+    """
+    Infer the result of a concatenation.
+    """
+
+    shapes = [np.shape(sample) for sample in samples]
+    axis = kwargs.get("axis", 0)
+
+    if axis is None:
+        result_shape: tuple[int, ...] = (sum(int(np.prod(shape)) for shape in shapes),)
+    else:
+        ndim = len(shapes[0])
+        if ndim == 0 or any(len(shape) != ndim for shape in shapes):
+            message = "All the input arrays must have same number of dimensions"
+            raise ValueError(message)
+
+        (axis,) = _normalize_axes(axis, ndim)
+        if any(
+            shape[:axis] + shape[axis + 1 :] != shapes[0][:axis] + shapes[0][axis + 1 :]
+            for shape in shapes
+        ):
+            message = "All the input array dimensions except for the concatenation axis must match"
+            raise ValueError(message)
+
+        result_shape = (
+            shapes[0][:axis] + (sum(shape[axis] for shape in shapes),) + shapes[0][axis + 1 :]
+        )
+
+    return operation(tuple(_slice(sample, set()) for sample in samples), **kwargs), result_shape
+
+
+def _infer_view(operation: Callable, sample: Any, **kwargs: Any):
+    """
+    Infer the result of an operation which only changes the shape of its input (e.g., reshape).
+    """
+
+    # samples are broadcasted scalars, so such operations create views without copying anything
+    result = np.asarray(operation(sample, **kwargs))
+    return result[(0,) * result.ndim], result.shape
+
+
+INFERENCE_RULES: dict[Any, Callable[..., tuple[Any, tuple[int, ...]]]] = {
+    # numpy ufuncs (e.g., np.add, np.sin) are inferred elementwise even if they are not listed
+    np.around: _infer_elementwise,
+    np.clip: _infer_elementwise,
+    np.copy: _infer_elementwise,
+    np.round: _infer_elementwise,
+    np.where: _infer_elementwise,
+    np.max: _infer_reduction,
+    np.min: _infer_reduction,
+    np.sum: _infer_reduction,
+    np.dot: _infer_dot,
+    np.matmul: _infer_matmul,
+    np.concatenate: _infer_concatenate,
+    np.broadcast_to: _infer_view,
+    np.expand_dims: _infer_view,
+    np.reshape: _infer_view,
+    np.squeeze: _infer_view,
+    np.transpose: _infer_view,
+}
@@ -4,17 +4,22 @@ Declaration of `Tracer` class.
 
 import inspect
 from copy import deepcopy
-from typing import Any, Callable, ClassVar, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union, cast
 
-import networkx as nx
 import numpy as np
 from numpy.typing import DTypeLike
 
 from ..dtypes import BaseDataType, Float, Integer
-from ..internal.utils import assert_that
+from ..internal.utils import LazyModule, assert_that
 from ..representation import Graph, Node, Operation
 from ..representation.utils import format_indexing_element
 from ..values import ValueDescription
+from .inference import infer
+
+if TYPE_CHECKING:  # pragma: no cover
+    import networkx as nx
+else:
+    nx = LazyModule("networkx")
 
 
 class Tracer:
@@ -76,11 +81,17 @@ class Tracer:
             arguments[param] = Tracer(node, [])
             input_indices[node] = index
 
+        # functions can be traced while tracing another function (e.g., bodies of loops)
+        # so the state of the outer tracing is restored once the function is traced
+        was_direct, was_tracing = Tracer._is_direct, Tracer._is_tracing
+
         Tracer._is_direct = is_direct
 
         Tracer._is_tracing = True
-        output_tracers: Any = function(**arguments)
-        Tracer._is_tracing = False
+        try:
+            output_tracers: Any = function(**arguments)
+        finally:
+            Tracer._is_direct, Tracer._is_tracing = was_direct, was_tracing
 
         if not isinstance(output_tracers, tuple):
             output_tracers = (output_tracers,)
@@ -112,7 +123,7 @@ class Tracer:
         def create_graph_from_output_tracers(
             arguments: dict[str, Tracer],
             output_tracers: tuple[Tracer, ...],
-        ) -> nx.MultiDiGraph:
+        ) -> "nx.MultiDiGraph":
             graph = nx.MultiDiGraph()
 
             visited_tracers: set[Tracer] = set()
@@ -159,7 +170,9 @@ class Tracer:
         input_nodes = {
             input_indices[node]: node
             for node in graph.nodes()
-            if len(graph.pred[node]) == 0 and node.operation == Operation.Input
+            if len(graph.pred[node]) == 0
+            and node.operation == Operation.Input
+            and node in input_indices
         }
         output_nodes = {
             output_idx: tracer.computation for output_idx, tracer in enumerate(output_tracers)
@@ -418,10 +431,20 @@ class Tracer:
             if output.shape == ():
                 return dtype(1)
 
-            return np.ones(output.shape, dtype=dtype)
+            # broadcasted scalar, to avoid allocating full-size samples
+            return np.broadcast_to(dtype(1), output.shape)
 
         sample = [sampler(arg) for arg in args]
-        evaluation = operation(*sample, **kwargs)
+
+        # output is inferred from its shape and a single element when possible
+        # as evaluating the operation on full-size samples is expensive for large tensors
+        inferred = infer(operation, sample, kwargs)
+        if inferred is not None:
+            element, shape = inferred
+            output_value = ValueDescription.of(element)
+            output_value.shape = shape
+        else:
+            output_value = ValueDescription.of(operation(*sample, **kwargs))
 
         def extract_tracers(arg: Any, tracers: list[Tracer]):
             if isinstance(arg, tuple):
@@ -435,7 +458,6 @@ class Tracer:
         for arg in args:
             extract_tracers(arg, tracers)
 
-        output_value = ValueDescription.of(evaluation)
         output_value.is_encrypted = any(tracer.output.is_encrypted for tracer in tracers)
 
         if Tracer._is_direct and isinstance(output_value.dtype, Integer):
@@ -849,7 +871,9 @@ class Tracer:
                 else indexing_element
             )
 
-        output_value.shape = np.zeros(output_value.shape)[tuple(sample_index)].shape  # type: ignore
+        output_value.shape = np.broadcast_to(np.float64(0), output_value.shape)[  # type: ignore
+            tuple(sample_index)
+        ].shape
 
         if any(isinstance(indexing_element, Tracer) for indexing_element in index):
             dynamic_indices = []
@@ -2,6 +2,7 @@
 Tests of `DebugArtifacts` class.
 """
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -45,6 +46,8 @@ def test_artifacts_export(helpers):
 
         assert (tmpdir / "mlir.txt").exists()
         assert (tmpdir / "client_parameters.json").exists()
+        assert (tmpdir / "profile.json").exists()
+        assert (tmpdir / "profile.trace.json").exists()
 
         artifacts.export()
 
@@ -61,3 +64,45 @@ def test_artifacts_export(helpers):
 
         assert (tmpdir / "mlir.txt").exists()
         assert (tmpdir / "client_parameters.json").exists()
+        assert (tmpdir / "profile.json").exists()
+        assert (tmpdir / "profile.trace.json").exists()
+
+
+def test_artifacts_compilation_profile(helpers):
+    """
+    Test compilation profile of `DebugArtifacts` class.
+    """
+
+    configuration = helpers.configuration()
+    artifacts = DebugArtifacts()
+
+    @compiler({"x": "encrypted"})
+    def f(x):
+        return (x**2) // 3
+
+    inputset = range(10)
+    circuit = f.compile(inputset, configuration, artifacts)
+
+    profile = artifacts.compilation_profile
+    assert profile is not None
+
+    phases = {(phase.name, phase.function) for phase in profile.phases}
+    assert ("tracing", "f") in phases
+    assert ("fusing", "f") in phases
+    assert ("bound_measurement", "f") in phases
+    assert ("AssignBitWidths", None) in phases
+    assert ("mlir_conversion", "f") in phases
+    assert all(phase.duration >= 0 for phase in profile.phases)
+
+    summary = circuit.statistics["compilation_profile"]
+    assert summary["functions"]["f"]["tracing"]["node_count"] > 0
+    assert summary["duration"] == sum(phase.duration for phase in profile.phases)
+
+    trace = json.loads(profile.to_chrome_trace())
+    assert len(trace["traceEvents"]) == len(profile.phases)
+    assert {event["name"] for event in trace["traceEvents"]} >= {"f.tracing", "AssignBitWidths"}
+
+    exported = json.loads(profile.to_json())
+    assert [phase["name"] for phase in exported["phases"]] == [
+        phase.name for phase in profile.phases
+    ]
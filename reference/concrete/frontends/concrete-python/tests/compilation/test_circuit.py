@@ -3,6 +3,7 @@ Tests of `Circuit` class.
 """
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -490,6 +491,204 @@ def test_server_loading_via_mlir_kwargs(helpers):
         assert server.complexity < circuit.complexity
 
 
+def test_server_compilation_cache(helpers):
+    """
+    Test reusing compilation artifacts using the compilation cache.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+
+        configuration = helpers.configuration().fork(compilation_cache_location=tmp_dir_path)
+
+        circuit = f.compile(inputset, configuration)
+        assert len(list(tmp_dir_path.glob("entry-*"))) == 1
+
+        cached_circuit = f.compile(inputset, configuration)
+        assert len(list(tmp_dir_path.glob("entry-*"))) == 1
+
+        assert cached_circuit.complexity == circuit.complexity
+        assert cached_circuit.encrypt_run_decrypt(3) == 9
+
+        # different options result in a different entry
+        f.compile(inputset, configuration.fork(p_error=0.001, global_p_error=None))
+        assert len(list(tmp_dir_path.glob("entry-*"))) == 2
+
+        # least recently used entries are evicted
+        f.compile(
+            inputset,
+            configuration.fork(compilation_cache_size=0, p_error=0.01, global_p_error=None),
+        )
+        assert len(list(tmp_dir_path.glob("entry-*"))) == 0
+
+
+def test_server_reuses_circuits(helpers):
+    """
+    Test reusing loaded circuits across `run` calls of `Server` class.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted", "y": "clear"})
+    def f(x, y):
+        return x + y
+
+    inputset = fhe.inputset(fhe.uint4, fhe.uint4)
+    circuit = f.compile(inputset, configuration)
+
+    server = circuit.server
+    for x, y in [(1, 2), (3, 4), (5, 6)]:
+        encrypted_x, _ = circuit.encrypt(x, None)
+        result = server.run(encrypted_x, y, evaluation_keys=circuit.keys.evaluation)
+        assert circuit.decrypt(result) == x + y
+
+    # pylint: disable=protected-access
+    server_circuits = server._get_circuits_of_thread("server")
+    assert list(server_circuits) == ["f"]
+    assert server_circuits["f"] is server._get_server_circuit("f")
+    assert server._plaintext_inputs["f"] == [False, True]
+
+    # other threads get their own circuits, loaded from the same program
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other_server_circuit = pool.submit(server._get_server_circuit, "f").result()
+    assert other_server_circuit is not server_circuits["f"]
+    # pylint: enable=protected-access
+
+
+def test_server_run_concurrently(helpers):
+    """
+    Test `run` method of `Server` class called from many threads at once.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x + 1
+
+    circuit = f.compile(range(2**4), configuration)
+    circuit.keygen()
+
+    samples = [x % 2**4 for x in range(512)]
+    encrypted = circuit.encrypt_batch([(x,) for x in samples])
+
+    def run(argument):
+        return circuit.server.run(argument, evaluation_keys=circuit.keys.evaluation)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, encrypted))
+
+    assert circuit.decrypt_batch(results) == [x + 1 for x in samples]
+
+
+def test_client_reuses_client_program(helpers):
+    """
+    Test reusing client program across `encrypt` and `decrypt` calls of `Client` class.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x + 1
+
+    inputset = fhe.inputset(fhe.uint4)
+    circuit = f.compile(inputset, configuration)
+
+    client = circuit.client
+    client.keygen()
+
+    # pylint: disable=protected-access
+
+    assert client.decrypt(client.encrypt(3)) == 3
+    client_program = client._client_program
+    client_circuit = client._client_circuits["f"]
+
+    assert client.decrypt(client.encrypt(4)) == 4
+    assert client._client_program is client_program
+    assert client._client_circuits["f"] is client_circuit
+
+    # client program is recreated when keys change
+    client.keygen(force=True)
+    assert client.decrypt(client.encrypt(5)) == 5
+    assert client._client_program is not client_program
+
+    # pylint: enable=protected-access
+
+
+def test_circuit_encrypt_decrypt_batch(helpers):
+    """
+    Test `encrypt_batch` and `decrypt_batch` methods of `Circuit` class.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def f(x, y):
+        return x + y
+
+    inputset = [
+        (np.random.randint(0, 2**4), np.random.randint(0, 2**5, size=(2,))) for _ in range(100)
+    ]
+    circuit = f.compile(inputset, configuration)
+
+    samples = [(x, [x, 2 * x]) for x in range(10)]
+    encrypted = circuit.encrypt_batch(samples, max_workers=3)
+    assert len(encrypted) == len(samples)
+
+    results = [circuit.run(*args) for args in encrypted]
+    decrypted = circuit.decrypt_batch(results, max_workers=3)
+
+    for (x, y), result in zip(samples, decrypted):
+        assert np.array_equal(result, x + np.array(y))
+
+    with pytest.raises(ValueError) as excinfo:
+        circuit.encrypt_batch([(1, [1, 2]), (100, [1, 2])])
+
+    assert str(excinfo.value) == (
+        "Sample 1 is invalid: "
+        "Expected argument 0 to be EncryptedScalar<uint6> but it's EncryptedScalar<uint7>"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        circuit.encrypt_batch([(1, [1, 2]), (1,)])
+
+    assert str(excinfo.value) == "Sample 1 is invalid: Expected 2 inputs but got 1"
+
+
+def test_circuit_encrypt_decrypt_batch_concurrently(helpers):
+    """
+    Test `encrypt_batch` and `encrypt` methods of `Circuit` class called from many threads at once.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x + 1
+
+    circuit = f.compile(range(2**4), configuration)
+    circuit.keygen()
+
+    def roundtrip(offset):
+        samples = [(x,) for x in range(offset, offset + 8)]
+        encrypted = circuit.encrypt_batch(samples, max_workers=2)
+        encrypted.append(circuit.encrypt(offset))
+        return circuit.decrypt_batch([circuit.run(args) for args in encrypted], max_workers=2)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(roundtrip, range(8)))
+
+    for offset, decrypted in enumerate(results):
+        assert decrypted == [x + 1 for x in range(offset, offset + 8)] + [offset + 1]
+
+
 def test_circuit_run_with_unused_arg(helpers):
     """
     Test `encrypt_run_decrypt` method of `Circuit` class with unused arguments.
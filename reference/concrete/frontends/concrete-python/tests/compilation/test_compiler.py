@@ -500,3 +500,143 @@ module {
         circuit3.mlir.strip(),
     )
     compiler.reset()
+
+
+def test_compiler_trace_streamed_inputset(helpers):
+    """
+    Test `trace` method of `Compiler` class with a streamed inputset.
+    """
+
+    def f(x, y):
+        return (x + y) // 2
+
+    configuration = helpers.configuration().fork(stream_inputset=True)
+
+    streamed = Compiler(f, {"x": "encrypted", "y": "clear"})
+    streamed.trace(((i % 50, i % 7) for i in range(10_000)), configuration)
+    streamed_graph = streamed.trace(((i, 100) for i in range(3)), configuration)
+
+    # streamed inputsets are not accumulated
+    assert streamed._func_def.inputset == []  # pylint: disable=protected-access
+
+    accumulated = Compiler(f, {"x": "encrypted", "y": "clear"})
+    accumulated.trace([(i % 50, i % 7) for i in range(10_000)], helpers.configuration())
+    accumulated_graph = accumulated.trace([(i, 100) for i in range(3)], helpers.configuration())
+
+    assert streamed_graph.format() == accumulated_graph.format()
+
+
+def test_compiler_trace_streamed_inputset_with_auto_adjustment(helpers):
+    """
+    Test `trace` method of `Compiler` class with a streamed inputset and auto adjusted rounders.
+    """
+
+    rounder = fhe.AutoRounder(target_msbs=3)
+
+    def f(x):
+        return fhe.round_bit_pattern(x, lsbs_to_remove=rounder)
+
+    configuration = helpers.configuration().fork(
+        stream_inputset=True,
+        inputset_reservoir_size=100,
+        auto_adjust_rounders=True,
+    )
+
+    compiler = Compiler(f, {"x": "encrypted"})
+    with pytest.raises(ValueError) as excinfo:
+        compiler.trace((i for i in range(1000)), configuration)
+
+    assert str(excinfo.value) == (
+        "Automatic adjustment of rounders and truncators with streamed inputsets "
+        "requires an inputset that can be iterated multiple times "
+        "(e.g., a list or a range) but an iterator is provided"
+    )
+
+    graph = compiler.trace(range(1000), configuration)
+
+    # only the reservoir is kept for adjustment
+    assert len(compiler._func_def.inputset) == 100  # pylint: disable=protected-access
+    assert rounder.is_adjusted
+
+    # but bounds are measured using the whole inputset
+    assert graph.ordered_inputs()[0].bounds == (0, 999)
+
+
+def test_compiler_call_with_streamed_inputset(helpers):
+    """
+    Test `__call__` method of `Compiler` class before tracing with a streamed inputset.
+    """
+
+    def f(x):
+        return x * 2
+
+    configuration = helpers.configuration().fork(stream_inputset=True)
+
+    compiler = Compiler(f, {"x": "encrypted"})
+    for x in range(100):
+        compiler(x)
+
+    # pylint: disable=protected-access
+    assert compiler._func_def.inputset == []
+    assert len(compiler._func_def._unmeasured_samples) == 100
+
+    graph = compiler.trace(range(3), configuration)
+
+    # samples of calls are measured once, then dropped
+    assert compiler._func_def.inputset == []
+    assert compiler._func_def._unmeasured_samples == []
+    # pylint: enable=protected-access
+
+    assert graph.ordered_inputs()[0].bounds == (0, 99)
+
+
+def test_compiler_trace_declared_ranges(helpers):
+    """
+    Test `trace` method of `Compiler` class with declared ranges instead of an inputset.
+    """
+
+    def f(x, y):
+        return (x + 1) * 2 - y
+
+    configuration = helpers.configuration()
+
+    compiler = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+    graph = compiler.trace(
+        {"x": fhe.Interval(0, 999_999), "y": fhe.Corners(3, 10)},
+        configuration,
+    )
+
+    # only the corners are sampled
+    assert len(compiler._func_def.inputset) == 4  # pylint: disable=protected-access
+
+    x, y = graph.ordered_inputs()
+    assert x.bounds == (0, 999_999)
+    assert y.bounds == (3, 10)
+
+    (output,) = graph.ordered_outputs()
+    assert output.bounds == (2 - 10, 2_000_000 - 3)
+
+
+def test_compiler_trace_bad_declared_ranges(helpers):
+    """
+    Test `trace` method of `Compiler` class with bad declared ranges.
+    """
+
+    def f(x, y):
+        return x + y
+
+    configuration = helpers.configuration()
+
+    compiler = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+    with pytest.raises(ValueError) as excinfo:
+        compiler.trace({"x": fhe.Interval(0, 10)}, configuration)
+
+    assert str(excinfo.value) == (
+        "Ranges of function 'f' should be an Interval or Corners for each of its parameters "
+        "['x', 'y'] but got {'x': Interval(0, 10)}"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.Interval(10, 0)
+
+    assert str(excinfo.value) == "Interval cannot have its minimum 10 above its maximum 0"
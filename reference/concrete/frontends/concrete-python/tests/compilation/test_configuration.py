@@ -37,6 +37,16 @@ from ..conftest import USE_MULTI_PRECISION
             RuntimeError,
             "Simulating encrypt/run/decrypt cannot be used without enabling unsafe features",
         ),
+        pytest.param(
+            {"auto_schedule_max_in_flight": 0},
+            ValueError,
+            "Maximum number of evaluations in flight must be positive (got 0)",
+        ),
+        pytest.param(
+            {"auto_schedule_max_queue_size": -1},
+            ValueError,
+            "Maximum queue size of evaluations must be positive (got -1)",
+        ),
     ],
 )
 def test_configuration_bad_init(kwargs, expected_error, expected_message):
@@ -2,8 +2,10 @@
 Tests of everything related to modules.
 """
 
+import asyncio
 import inspect
 import tempfile
+import threading
 from concurrent.futures import Future
 from pathlib import Path
 from typing import ClassVar
@@ -1037,3 +1039,116 @@ def test_run_auto_schedule():
 
     result = module.inc.decrypt(b)
     assert result == sample_x
+
+
+def test_run_coroutine():
+    """
+    Test `run_coroutine` chaining evaluations in the running event loop.
+    """
+
+    module = IncDec.Module.compile(IncDec.to_compile)
+
+    sample_x = 2
+    encrypted_x = module.inc.encrypt(sample_x)
+
+    async def main():
+        a = module.inc.run_coroutine(encrypted_x)
+        b = module.inc.run_async(encrypted_x)
+        c = module.dec.run_coroutine(a, priority=1)
+        d = module.dec.run_coroutine(b)
+        return await asyncio.gather(c, d)
+
+    c, d = asyncio.run(main())
+    assert isinstance(c, type(encrypted_x))
+    assert isinstance(d, type(encrypted_x))
+
+    assert module.inc.decrypt(c) == sample_x
+    assert module.inc.decrypt(d) == sample_x
+
+
+def test_run_coroutine_cancel():
+    """
+    Test cancelling `run_coroutine` cancels evaluations which didn't start yet.
+    """
+
+    configuration = fhe.Configuration(auto_schedule_max_in_flight=1)
+    module = IncDec.Module.compile(IncDec.to_compile, configuration)
+
+    encrypted_x = module.inc.encrypt(2)
+    scheduler = module.inc.scheduler
+    cancelled_before = scheduler.statistics["cancelled"]
+
+    release = threading.Event()
+
+    async def main():
+        blocking = scheduler.submit(release.wait)
+        while scheduler.statistics["in_flight"] == 0:
+            await asyncio.sleep(0.001)
+
+        task = asyncio.ensure_future(module.inc.run_coroutine(encrypted_x))
+        while scheduler.statistics["queue_depth"] == 0:
+            await asyncio.sleep(0.001)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        release.set()
+        await asyncio.wrap_future(blocking)
+
+        # the cancelled evaluation is skipped by the scheduler
+        return await module.inc.run_coroutine(encrypted_x)
+
+    result = asyncio.run(main())
+    assert module.inc.decrypt(result) == 3
+    assert scheduler.statistics["cancelled"] == cancelled_before + 1
+
+
+def test_parallel_function_evaluation(helpers):
+    """
+    Test that evaluating the functions of a module in parallel gives the same module.
+    """
+
+    @fhe.module()
+    class Module:
+        @fhe.function({"x": "encrypted"})
+        def square(x):
+            return x**2
+
+        @fhe.function({"x": "encrypted", "y": "encrypted"})
+        def add(x, y):
+            # functions of the module are composable, so the noise of the sum is refreshed
+            return fhe.refresh(x + y)
+
+        @fhe.function({"x": "encrypted"})
+        def univariate(x):
+            # lambdas cannot be pickled, so this function is evaluated in the main process
+            return fhe.univariate(lambda x: x // 3)(x)
+
+    inputsets = {
+        "square": range(10),
+        "add": [(np.random.randint(0, 10), np.random.randint(0, 10)) for _ in range(100)],
+        "univariate": range(20),
+    }
+
+    configuration = helpers.configuration()
+    sequential = Module.compile(inputsets, configuration)
+
+    artifacts = fhe.ModuleDebugArtifacts()
+    parallel = Module.compile(
+        inputsets,
+        configuration.fork(parallel_function_evaluation=True, function_evaluation_workers=2),
+        module_artifacts=artifacts,
+    )
+
+    assert parallel.mlir == sequential.mlir
+    assert artifacts.functions["square"].final_graph is Module.square.graph
+    assert "final" in artifacts.functions["add"].textual_representations_of_graphs
+
+    phases = {(phase.name, phase.function) for phase in artifacts.compilation_profile.phases}
+    assert ("parallel_function_evaluation", None) in phases
+    assert ("bound_measurement", "square") in phases
+    assert ("bound_measurement", "univariate") in phases
+
+    assert parallel.square.encrypt_run_decrypt(3) == 9
+    assert parallel.univariate.encrypt_run_decrypt(7) == 2
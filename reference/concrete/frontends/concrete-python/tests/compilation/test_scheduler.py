@@ -0,0 +1,213 @@
+"""
+Tests of `FheScheduler` class.
+"""
+
+import threading
+import time
+
+import pytest
+
+from concrete import fhe
+from concrete.fhe.compilation.scheduler import FheScheduler
+
+
+def test_scheduler_priority():
+    """
+    Test evaluations with higher priorities run first.
+    """
+
+    scheduler = FheScheduler(max_in_flight=1)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    order = []
+
+    blocking = scheduler.submit(block)
+    started.wait()
+
+    futures = [
+        scheduler.submit(order.append, "low", priority=-1),
+        scheduler.submit(order.append, "normal-1"),
+        scheduler.submit(order.append, "high", priority=1),
+        scheduler.submit(order.append, "normal-2"),
+    ]
+    assert scheduler.statistics["queue_depth"] == 4
+    assert scheduler.statistics["in_flight"] == 1
+
+    release.set()
+    blocking.result()
+    for future in futures:
+        future.result()
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+
+    statistics = scheduler.statistics
+    assert statistics["submitted"] == 5
+    assert statistics["completed"] == 5
+    assert statistics["queue_depth"] == 0
+    assert statistics["max_queue_depth"] == 4
+    assert statistics["max_wait_time"] > 0
+
+    scheduler.shutdown()
+
+
+def test_scheduler_max_in_flight():
+    """
+    Test the number of evaluations running at the same time is bounded.
+    """
+
+    scheduler = FheScheduler(max_in_flight=2)
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def work():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    for future in [scheduler.submit(work) for _ in range(10)]:
+        future.result()
+
+    assert max_running <= 2
+    scheduler.shutdown()
+
+
+def test_scheduler_full_queue():
+    """
+    Test submissions to a full queue are rejected or block.
+    """
+
+    release = threading.Event()
+
+    rejecting = FheScheduler(max_in_flight=1, max_queue_size=1, reject_when_full=True)
+    blocking = rejecting.submit(release.wait)
+    while rejecting.statistics["in_flight"] != 1:
+        time.sleep(0.001)
+
+    queued = rejecting.submit(lambda: 1)
+    with pytest.raises(RuntimeError) as excinfo:
+        rejecting.submit(lambda: 2)
+
+    assert str(excinfo.value) == (
+        "Cannot submit evaluations to a scheduler with a full queue (1 evaluations waiting)"
+    )
+    assert rejecting.statistics["rejected"] == 1
+
+    release.set()
+    blocking.result()
+    assert queued.result() == 1
+    rejecting.shutdown()
+
+    release.clear()
+
+    waiting = FheScheduler(max_in_flight=1, max_queue_size=1)
+    blocking = waiting.submit(release.wait)
+    while waiting.statistics["in_flight"] != 1:
+        time.sleep(0.001)
+
+    queued = waiting.submit(lambda: 1)
+    with pytest.raises(TimeoutError):
+        waiting.submit(lambda: 2, timeout=0.01)
+
+    release.set()
+    assert waiting.submit(lambda: 3).result() == 3
+    assert queued.result() == 1
+    waiting.shutdown()
+
+
+def test_scheduler_cancel_and_shutdown():
+    """
+    Test queued evaluations can be cancelled, and shut down schedulers reject evaluations.
+    """
+
+    scheduler = FheScheduler(max_in_flight=1)
+
+    release = threading.Event()
+    blocking = scheduler.submit(release.wait)
+    while scheduler.statistics["in_flight"] != 1:
+        time.sleep(0.001)
+
+    cancelled = scheduler.submit(lambda: 1)
+    assert cancelled.cancel()
+
+    pending = scheduler.submit(lambda: 2)
+
+    release.set()
+    blocking.result()
+    assert pending.result() == 2
+
+    scheduler.shutdown()
+    assert scheduler.statistics["cancelled"] == 1
+
+    with pytest.raises(RuntimeError) as excinfo:
+        scheduler.submit(lambda: 3)
+
+    assert str(excinfo.value) == "Cannot submit evaluations to a scheduler which is shut down"
+
+
+def test_scheduler_errors():
+    """
+    Test errors of evaluations are set on their futures.
+    """
+
+    scheduler = FheScheduler()
+
+    def fail():
+        message = "evaluation failed"
+        raise RuntimeError(message)
+
+    with pytest.raises(RuntimeError, match="evaluation failed"):
+        scheduler.submit(fail).result()
+
+    assert scheduler.statistics["completed"] == 1
+    scheduler.shutdown()
+
+    with pytest.raises(ValueError) as excinfo:
+        FheScheduler(max_in_flight=0)
+
+    assert str(excinfo.value) == "Maximum number of evaluations in flight must be positive (got 0)"
+
+
+def test_scheduler_shared_across_modules():
+    """
+    Test modules with the same scheduling options share a scheduler.
+    """
+
+    @fhe.module()
+    class Module1:
+        @fhe.function({"x": "encrypted"})
+        def inc(x):
+            return x + 1
+
+    @fhe.module()
+    class Module2:
+        @fhe.function({"x": "encrypted"})
+        def dec(x):
+            return x - 1
+
+    configuration = fhe.Configuration(auto_schedule_run=True, auto_schedule_max_in_flight=2)
+    module1 = Module1.compile({"inc": range(10)}, configuration)
+    module2 = Module2.compile({"dec": range(1, 11)}, configuration)
+
+    assert module1.inc.scheduler is module2.dec.scheduler
+    assert module1.inc.scheduler.max_in_flight == 2
+
+    # each module has its own keys, so each one only runs and decrypts its own ciphertexts
+    incremented = module1.inc.run_async(module1.inc.encrypt(3), priority=1)
+    decremented = module2.dec.run_async(module2.dec.encrypt(3))
+
+    assert module1.inc.decrypt(module1.inc.run_async(incremented)) == 5
+    assert module2.dec.decrypt(module2.dec.run_async(decremented)) == 1
+
+    assert module1.inc.scheduler.statistics["completed"] >= 4
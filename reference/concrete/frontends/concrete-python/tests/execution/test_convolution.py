@@ -4,6 +4,7 @@ Tests of execution of convolution operation.
 
 import numpy as np
 import pytest
+import torch
 
 from concrete import fhe
 from concrete.fhe.representation.node import Node
@@ -467,3 +468,63 @@ def test_inconsistent_input_types(
         )
 
     assert str(excinfo.value) == expected_message
+
+
+@pytest.mark.parametrize(
+    "input_shape,weight_shape,pads,strides,dilations,group",
+    [
+        pytest.param((2, 3, 10), (4, 3, 3), (1, 1), (2,), (1,), 1),
+        pytest.param((2, 4, 7, 9), (6, 2, 3, 2), (1, 0, 1, 0), (2, 1), (1, 2), 2),
+        pytest.param((1, 6, 5, 5), (6, 1, 3, 3), (1, 1, 1, 1), (1, 1), (1, 1), 6),
+        pytest.param((1, 2, 4, 5, 6), (3, 2, 2, 2, 3), (0, 1, 1, 0, 1, 1), (1, 2, 1), (2, 1, 1), 1),
+    ],
+)
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int64,
+        np.float64,
+    ],
+)
+def test_conv_evaluation(input_shape, weight_shape, pads, strides, dilations, group, dtype):
+    """
+    Test evaluation of convolution matches torch, including with extra leading axes.
+    """
+
+    evaluate = fhe.extensions.convolution._evaluate_conv  # pylint: disable=protected-access
+
+    n_dim = len(weight_shape) - 2
+    conv_func = f"conv{n_dim}d"
+    torch_conv = getattr(torch.nn.functional, conv_func)
+
+    x = np.random.randint(-(2**6), 2**6, size=input_shape).astype(dtype)
+    weight = np.random.randint(-(2**3), 2**3, size=weight_shape).astype(dtype)
+    bias = np.random.randint(-(2**6), 2**6, size=(weight_shape[0],)).astype(dtype)
+
+    torch_dtype = torch.float64 if dtype == np.float64 else torch.long
+    expected = torch_conv(
+        torch.tensor(x, dtype=torch_dtype),
+        torch.tensor(weight, dtype=torch_dtype),
+        torch.tensor(bias, dtype=torch_dtype),
+        stride=strides,
+        padding=pads[:n_dim],
+        dilation=dilations,
+        groups=group,
+    ).numpy()
+    actual = evaluate(x, weight, bias, pads, strides, dilations, group, conv_func)
+
+    assert actual.dtype == expected.dtype
+    assert np.array_equal(actual, expected)
+
+    samples = [x, -x, x // 2]
+    batched = evaluate(np.stack(samples), weight, bias, pads, strides, dilations, group, conv_func)
+
+    assert np.array_equal(
+        batched,
+        np.stack(
+            [
+                evaluate(sample, weight, bias, pads, strides, dilations, group, conv_func)
+                for sample in samples
+            ]
+        ),
+    )
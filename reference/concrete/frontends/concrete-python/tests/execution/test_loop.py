@@ -0,0 +1,221 @@
+"""
+Tests of execution of loop extension.
+"""
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.mark.parametrize(
+    "iterations,sample,expected_output",
+    [
+        (0, 3, 3),
+        (1, 3, 7),
+        (5, 3, 7),
+        (5, np.array([1, 2]), np.array([11, 1])),
+    ],
+)
+def test_plain_loop(iterations, sample, expected_output):
+    """
+    Test plain evaluation of loop extension.
+    """
+
+    output = fhe.loop(iterations, lambda state, x: (state + x) % 16, sample, sample + 1)
+    assert np.array_equal(output, expected_output)
+
+
+@pytest.mark.parametrize(
+    "function,parameters",
+    [
+        pytest.param(
+            lambda x: fhe.loop(10, lambda state, x: (state + x) % 8, x, x),
+            {
+                "x": {"status": "encrypted", "range": [0, 7]},
+            },
+            id="fhe.loop(10, lambda state, x: (state + x) % 8, x, x)",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(3, lambda state, x: state + x, x, x),
+            {
+                "x": {"status": "encrypted", "range": [0, 15]},
+            },
+            id="fhe.loop(3, lambda state, x: state + x, x, x)",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(5, lambda state: state // 2, x),
+            {
+                "x": {"status": "encrypted", "range": [0, 63], "shape": (3,)},
+            },
+            id="fhe.loop(5, lambda state: state // 2, x)",
+        ),
+        pytest.param(
+            lambda x, y: fhe.loop(4, lambda state, y: np.abs(state - y), x, y) + 1,
+            {
+                "x": {"status": "encrypted", "range": [0, 15]},
+                "y": {"status": "clear", "range": [0, 3]},
+            },
+            id="fhe.loop(4, lambda state, y: np.abs(state - y), x, y) + 1",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(
+                3,
+                lambda state, x: fhe.loop(2, lambda inner, x: (inner * x) % 7, state, x),
+                x,
+                x,
+            ),
+            {
+                "x": {"status": "encrypted", "range": [0, 6], "shape": (2, 2)},
+            },
+            id="nested",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(6, lambda state: fhe.refresh(state - 1), fhe.zeros(()) + x),
+            {
+                "x": {"status": "encrypted", "range": [-4, 4]},
+            },
+            id="signed",
+        ),
+    ],
+)
+def test_loop(function, parameters, helpers):
+    """
+    Test encrypted evaluation of loop extension.
+    """
+
+    parameter_encryption_statuses = helpers.generate_encryption_statuses(parameters)
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, parameter_encryption_statuses)
+
+    inputset = helpers.generate_inputset(parameters)
+    circuit = compiler.compile(inputset, configuration)
+
+    for _ in range(4):
+        sample = helpers.generate_sample(parameters)
+        helpers.check_execution(circuit, function, sample, retries=3)
+
+
+def test_loop_graph_size(helpers):
+    """
+    Test size of the graph of loop extension doesn't depend on the number of iterations.
+    """
+
+    configuration = helpers.configuration()
+
+    def count_nodes(iterations):
+        compiler = fhe.Compiler(
+            lambda x: fhe.loop(iterations, lambda state, x: (state + x) % 8, x, x),
+            {"x": "encrypted"},
+        )
+        graph = compiler.trace(range(8), configuration)
+
+        loops = graph.query_nodes(operation_filter="loop")
+        assert len(loops) == 1
+
+        body = loops[0].properties["kwargs"]["body"]
+        return len(graph.graph.nodes()), len(body.graph.nodes())
+
+    assert count_nodes(1) == count_nodes(10) == count_nodes(1000)
+
+
+def test_loop_bounds(helpers):
+    """
+    Test bounds of the body of loop extension are measured over all iterations.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: fhe.loop(3, lambda state: state * 2, x), {"x": "encrypted"})
+    graph = compiler.trace(range(4), configuration)
+
+    bounds = graph.measure_bounds(range(4))
+
+    (loop,) = graph.query_nodes(operation_filter="loop")
+    assert bounds[loop] == {"min": 0, "max": 24}
+
+    body = loop.properties["kwargs"]["body"]
+    (state,) = body.ordered_inputs()
+    (output,) = body.ordered_outputs()
+
+    assert bounds[state] == {"min": 0, "max": 12}
+    assert bounds[output] == {"min": 0, "max": 24}
+
+    assert graph.measure_bounds(range(4), batch_size=1) == bounds
+
+
+@pytest.mark.parametrize(
+    "function,encryption_status,expected_error,expected_message",
+    [
+        pytest.param(
+            lambda x: fhe.loop(-1, lambda state: state + 1, x),
+            {"x": "encrypted"},
+            ValueError,
+            "Loop iterations should be a non-negative integer but it's -1",
+            id="negative-iterations",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(2.5, lambda state: state + 1, x),
+            {"x": "encrypted"},
+            ValueError,
+            "Loop iterations should be a non-negative integer but it's 2.5",
+            id="float-iterations",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(2, lambda state: state + 1, x),
+            {"x": "clear"},
+            ValueError,
+            (
+                "Loop state should be encrypted "
+                "(e.g., it can be initialized with `fhe.zeros` or `fhe.ones`)"
+            ),
+            id="clear-state",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(2, lambda state: np.concatenate((state, state)), x),
+            {"x": "encrypted"},
+            ValueError,
+            (
+                "Loop body should return an encrypted value of shape (3,) "
+                "to be used as the state of the next iteration "
+                "but it returned EncryptedTensor<uint1, shape=(6,)>"
+            ),
+            id="shape-change",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(2, lambda state: state + x, x),
+            {"x": "encrypted"},
+            ValueError,
+            (
+                "Loop body cannot use values traced outside of it, "
+                "they need to be passed to the loop as arguments"
+            ),
+            id="captured-value",
+        ),
+        pytest.param(
+            lambda x: fhe.loop(2, lambda state, doubled=x * 2: state + doubled, x),
+            {"x": "encrypted"},
+            ValueError,
+            (
+                "Loop body cannot use values traced outside of it, "
+                "they need to be passed to the loop as arguments"
+            ),
+            id="captured-computed-value",
+        ),
+    ],
+)
+def test_bad_loop(function, encryption_status, expected_error, expected_message, helpers):
+    """
+    Test loop extension with bad parameters.
+    """
+
+    configuration = helpers.configuration()
+    compiler = fhe.Compiler(function, encryption_status)
+
+    with pytest.raises(expected_error) as excinfo:
+        compiler.trace([np.array([0, 1, 1])], configuration)
+
+    assert str(excinfo.value) == expected_message
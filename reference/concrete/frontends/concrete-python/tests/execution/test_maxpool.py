@@ -4,8 +4,10 @@ Tests of execution of maxpool operation.
 
 import numpy as np
 import pytest
+import torch
 
 from concrete import fhe
+from concrete.fhe.extensions.maxpool import _evaluate as evaluate_maxpool
 
 
 @pytest.mark.parametrize(
@@ -420,3 +422,61 @@ Expected input to be of type np.ndarray or Tracer but it's str
         # pylint: enable=line-too-long
         str(excinfo.value),
     )
+
+
+@pytest.mark.parametrize(
+    "shape,kernel_shape,strides,pads,dilations,ceil_mode",
+    [
+        pytest.param((1, 1, 12), (3,), (1,), (0, 0), (1,), False),
+        pytest.param((2, 3, 7, 9), (3, 2), (2, 1), (1, 1, 1, 1), (1, 2), False),
+        pytest.param((2, 3, 7, 9), (3, 3), (2, 2), (1, 1, 1, 1), (1, 1), True),
+        pytest.param((1, 1, 8, 8), (2, 2), (3, 3), (0, 0, 0, 0), (1, 1), True),
+        pytest.param((1, 2, 5, 6, 7), (2, 2, 3), (2, 1, 2), (1, 0, 1, 1, 0, 1), (1, 1, 1), False),
+    ],
+)
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int64,
+        np.float64,
+    ],
+)
+def test_maxpool_evaluation(shape, kernel_shape, strides, pads, dilations, ceil_mode, dtype):
+    """
+    Test evaluation of maxpool matches torch, including with extra leading axes.
+    """
+
+    evaluate = evaluate_maxpool
+    torch_maxpool = getattr(torch.nn.functional, f"max_pool{len(kernel_shape)}d")
+
+    x = np.random.randint(-(2**10), 2**10, size=shape).astype(dtype)
+
+    expected = (
+        torch_maxpool(
+            torch.from_numpy(x.astype(np.float64)),
+            kernel_shape,
+            strides,
+            pads[: len(pads) // 2],
+            dilations,
+            ceil_mode,
+        )
+        .numpy()
+        .astype(dtype)
+    )
+    actual = evaluate(x, kernel_shape, strides, pads, dilations, ceil_mode)
+
+    assert actual.dtype == expected.dtype
+    assert np.array_equal(actual, expected)
+
+    samples = [x, -x, x // 2]
+    batched = evaluate(np.stack(samples), kernel_shape, strides, pads, dilations, ceil_mode)
+
+    assert np.array_equal(
+        batched,
+        np.stack(
+            [
+                evaluate(sample, kernel_shape, strides, pads, dilations, ceil_mode)
+                for sample in samples
+            ]
+        ),
+    )
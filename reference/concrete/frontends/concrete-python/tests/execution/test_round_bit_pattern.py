@@ -7,6 +7,7 @@ import pytest
 
 from concrete import fhe
 from concrete.fhe.compilation.configuration import Exactness
+from concrete.fhe.extensions.adjustment import adjust
 from concrete.fhe.representation.utils import format_constant
 
 
@@ -525,6 +526,61 @@ def test_auto_rounding_construct_in_function():
     )
 
 
+@pytest.mark.parametrize(
+    "inputset,single_pass",
+    [
+        pytest.param(
+            range(1000),
+            True,
+        ),
+        pytest.param(
+            # samples of different types cannot be evaluated at once
+            [np.int64(i) if i % 2 == 0 else i for i in range(1000)],
+            False,
+        ),
+    ],
+)
+def test_auto_adjustment(inputset, single_pass):
+    """
+    Test AutoRounders and AutoTruncators which depend on each other are adjusted together.
+    """
+
+    rounder1 = fhe.AutoRounder(target_msbs=4)
+    rounder2 = fhe.AutoRounder(target_msbs=3)
+    truncator = fhe.AutoTruncator(target_msbs=2)
+
+    calls = 0
+
+    def function(x):
+        nonlocal calls
+        calls += 1
+
+        a = fhe.round_bit_pattern(x + 1000, lsbs_to_remove=rounder1)
+        b = fhe.round_bit_pattern(a // 3, lsbs_to_remove=rounder2)
+        return fhe.truncate_bit_pattern(b * 5, lsbs_to_remove=truncator)
+
+    adjust(function, inputset)
+
+    # x + 1000 is within [1000, 1999], so 11 bits, and a is within [1024, 2048]
+    assert rounder1.lsbs_to_remove == 7
+
+    # a // 3 is within [341, 682], so 10 bits, and b is within [384, 640]
+    assert rounder2.lsbs_to_remove == 7
+
+    # b * 5 is within [1920, 3200], so 12 bits
+    assert truncator.lsbs_to_remove == 10
+
+    assert rounder1.is_adjusted
+    assert rounder2.is_adjusted
+    assert truncator.is_adjusted
+
+    if single_pass:
+        # function is only traced, and the inputset is evaluated once using the graph
+        assert calls == 1
+    else:
+        assert calls > len(inputset)
+
+
 def test_overflowing_round_bit_pattern_with_lsbs_to_remove_of_one(helpers):
     """
     Test round bit pattern where overflow is detected when only one bit is to be removed.
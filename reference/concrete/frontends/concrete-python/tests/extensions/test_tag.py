@@ -2,6 +2,8 @@
 Tests of 'tag' extension.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from concrete import fhe
@@ -62,3 +64,35 @@ Subgraphs:
         """.strip(),
         circuit.format(show_bounds=False),
     )
+
+
+def test_tag_in_another_thread(helpers):
+    """
+    Test tag extension while tracing in a thread other than the one which imported it.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        with fhe.tag("abc"):
+            x = x + 1
+        return x * 2
+
+    def trace():
+        return f.trace(range(10), configuration=helpers.configuration())
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        graph = pool.submit(trace).result()
+
+    helpers.check_str(
+        """
+
+%0 = x                       # EncryptedScalar<uint4>
+%1 = 1                       # ClearScalar<uint1>            @ abc
+%2 = add(%0, %1)             # EncryptedScalar<uint4>        @ abc
+%3 = 2                       # ClearScalar<uint2>
+%4 = multiply(%2, %3)        # EncryptedScalar<uint5>
+return %4
+
+        """.strip(),
+        graph.format(show_bounds=False),
+    )
@@ -2,9 +2,11 @@
 Tests of utilities related to the entire project.
 """
 
+import sys
+
 import pytest
 
-from concrete.fhe.internal.utils import assert_that, unreachable
+from concrete.fhe.internal.utils import LazyModule, assert_that, unreachable
 
 
 def test_assert_that():
@@ -27,3 +29,21 @@ def test_unreachable():
         unreachable()
 
     assert str(excinfo.value) == "Entered unreachable code"
+
+
+def test_lazy_module():
+    """
+    Test `LazyModule` class.
+    """
+
+    name = "concrete.fhe.internal.lazily_imported_module_which_does_not_exist"
+    module = LazyModule(name)
+
+    # nothing is imported until an attribute is accessed
+    assert name not in sys.modules
+    with pytest.raises(ModuleNotFoundError):
+        _ = module.attribute
+
+    decimal = LazyModule("decimal")
+    assert decimal.Decimal("1.5") + 1 == decimal.Decimal("2.5")
+    assert decimal.Decimal is sys.modules["decimal"].Decimal
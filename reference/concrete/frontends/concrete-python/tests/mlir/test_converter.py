@@ -4,13 +4,18 @@ Tests of `Converter` class.
 
 # pylint: disable=import-error,no-name-in-module
 
+from collections import OrderedDict
+
 import numpy as np
 import pytest
+import z3
 from concrete.compiler import CompilationContext
 
 from concrete import fhe
 from concrete.fhe.compilation.configuration import ParameterSelectionStrategy
-from concrete.fhe.mlir import GraphConverter
+from concrete.fhe.compilation.profiling import CompilationProfile
+from concrete.fhe.mlir import GraphConverter, utils
+from concrete.fhe.mlir.processors import assign_bit_widths
 
 from ..conftest import USE_MULTI_PRECISION
 
@@ -2245,3 +2250,117 @@ def test_converter_process_single_precision(function, parameters, expected_graph
             del node.properties["original_bit_width"]
 
     helpers.check_str(expected_graph, graph.format())
+
+
+@pytest.mark.parametrize(
+    "function,parameters",
+    [
+        pytest.param(
+            lambda x: (x // 2) + np.array([[0, 1, 2], [3, 0, 1]]),
+            {
+                "x": {"range": [0, 63], "status": "encrypted", "shape": (2, 3)},
+            },
+            id="(x // 2) + [[0, 1, 2], [3, 0, 1]]",
+        ),
+        pytest.param(
+            lambda x: np.sin(x).astype(np.int64) * 3,
+            {
+                "x": {"range": [-20, 20], "status": "encrypted", "shape": (4,)},
+            },
+            id="np.sin(x).astype(np.int64) * 3",
+        ),
+        pytest.param(
+            lambda x, y: fhe.multivariate(lambda x, y: (x * y) % 7)(x, y) + 1,
+            {
+                "x": {"range": [0, 7], "status": "encrypted", "shape": (3,)},
+                "y": {"range": [0, 7], "status": "encrypted"},
+            },
+            id="fhe.multivariate(lambda x, y: (x * y) % 7)(x, y) + 1",
+        ),
+    ],
+)
+def test_converter_stacked_table_construction(function, parameters, helpers, monkeypatch):
+    """
+    Test constructing tables by evaluating stacked candidates gives the same tables
+    as evaluating candidates one by one.
+    """
+
+    parameter_encryption_statuses = helpers.generate_encryption_statuses(parameters)
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, parameter_encryption_statuses)
+
+    inputset = helpers.generate_inputset(parameters)
+
+    def convert():
+        graph = compiler.trace(inputset, configuration)
+
+        compilation_context = CompilationContext.new()
+        mlir_context = compilation_context.mlir_context()
+
+        return str(GraphConverter(configuration).convert(graph, mlir_context))
+
+    stacked_mlir = convert()
+
+    failed_batches = []
+
+    class UnstackableGraph:
+        """
+        Graph whose nodes cannot be evaluated on stacked candidates.
+        """
+
+        @staticmethod
+        def _evaluate_node_batch(node, pred_results):
+            failed_batches.append((node, pred_results))
+            message = "Stacked candidates cannot be evaluated"
+            raise RuntimeError(message)
+
+    # table construction falls back to evaluating candidates one by one
+    monkeypatch.setattr(utils, "Graph", UnstackableGraph)
+    one_by_one_mlir = convert()
+
+    assert len(failed_batches) != 0
+    helpers.check_str(stacked_mlir, one_by_one_mlir)
+
+
+def test_converter_bit_width_solver(monkeypatch):
+    """
+    Test solving bit-width constraints component by component.
+    """
+
+    monkeypatch.setattr(assign_bit_widths, "SOLUTION_CACHE", OrderedDict())
+
+    def solve(prefix):
+        a, b, c, d = (z3.Int(f"{prefix}.{name}") for name in "abcd")
+        constraints = [
+            a >= 3,
+            b >= 5,
+            c >= 4,
+            a == c,
+            b >= a + 2,
+            d >= 7,
+        ]
+
+        profile = CompilationProfile()
+        with profile.activate():
+            solver = assign_bit_widths.BitWidthSolver(constraints)
+            solution = solver.minimize([a, b, c, d])
+
+        values = [solution[variable.get_id()] for variable in (a, b, c, d)]
+        return values, profile.counters
+
+    values, counters = solve("f")
+    assert values == [4, 6, 4, 7]
+    assert counters == {
+        "bit_width_assignment.components": 2,
+        "bit_width_assignment.components_solved_without_z3": 1,
+        "bit_width_assignment.components_solved_with_z3": 1,
+    }
+
+    values, counters = solve("g")
+    assert values == [4, 6, 4, 7]
+    assert counters == {
+        "bit_width_assignment.components": 2,
+        "bit_width_assignment.components_solved_without_z3": 1,
+        "bit_width_assignment.component_cache_hits": 1,
+    }
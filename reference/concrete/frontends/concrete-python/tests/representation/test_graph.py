@@ -498,3 +498,147 @@ def test_graph_inputs_outputs_count(
 
     assert graph.inputs_count == expected_inputs_count
     assert graph.outputs_count == expected_outputs_count
+
+
+@pytest.mark.parametrize(
+    "function,encryption_status,inputset",
+    [
+        pytest.param(
+            lambda x: x + 3,
+            {"x": "encrypted"},
+            range(3000),
+        ),
+        pytest.param(
+            lambda x, y: x * y // 100,
+            {"x": "encrypted", "y": "encrypted"},
+            [(i, i % 30) for i in range(3000)],
+        ),
+        pytest.param(
+            lambda x: (np.sin(x) * 10).astype(np.int64) + 3,
+            {"x": "encrypted"},
+            range(3000),
+        ),
+        pytest.param(
+            lambda x: (x.astype(np.float32) * np.float64(0.5)).astype(np.int64),
+            {"x": "encrypted"},
+            range(100),
+        ),
+        pytest.param(
+            lambda x: np.sum(x.reshape(2, 3) ** 2, axis=0),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.tensor[fhe.uint3, 6], size=500),  # type: ignore
+        ),
+        pytest.param(
+            lambda x, y: np.concatenate((x, y)) + fhe.round_bit_pattern(x[0], 2),
+            {"x": "encrypted", "y": "clear"},
+            fhe.inputset(fhe.tensor[fhe.uint6, 3], fhe.tensor[fhe.uint3, 2], size=500),  # type: ignore
+        ),
+        pytest.param(
+            lambda x: fhe.LookupTable([3, 1, 2, 0])[x] + np.maximum(x, 2),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.tensor[fhe.uint2, 2, 2], size=500),  # type: ignore
+        ),
+        pytest.param(
+            lambda x: fhe.maxpool(
+                fhe.conv(x, np.arange(18).reshape(2, 1, 3, 3) % 5 - 2, pads=(1, 1, 1, 1)),
+                kernel_shape=(2, 2),
+                strides=(2, 2),
+            ),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.tensor[fhe.uint3, 1, 1, 6, 6], size=500),  # type: ignore
+        ),
+        pytest.param(
+            lambda x, y: fhe.loop(5, lambda state, y: (state * y + 1) % 13, x, y),
+            {"x": "encrypted", "y": "clear"},
+            fhe.inputset(fhe.tensor[fhe.uint4, 3], fhe.uint3, size=500),  # type: ignore
+        ),
+    ],
+)
+def test_graph_measure_bounds_batched(function, encryption_status, inputset, helpers):
+    """
+    Test `measure_bounds` method of `Graph` class measures the same bounds with batches.
+    """
+
+    configuration = helpers.configuration()
+
+    inputset = list(inputset)
+
+    compiler = fhe.Compiler(function, encryption_status)
+    graph = compiler.trace(inputset[:1], configuration)
+
+    batched_bounds = graph.measure_bounds(inputset)
+    sample_by_sample_bounds = graph.measure_bounds(inputset, batch_size=1)
+
+    assert batched_bounds.keys() == sample_by_sample_bounds.keys()
+    for node, bounds in sample_by_sample_bounds.items():
+        for key in ["min", "max"]:
+            assert batched_bounds[node][key] == bounds[key]
+            assert type(batched_bounds[node][key]) is type(bounds[key])
+
+
+def test_graph_measure_bounds_batched_failure(helpers):
+    """
+    Test `measure_bounds` method of `Graph` class reports the failing sample with batches.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: (x / (x - 1500)).astype(np.int64), {"x": "encrypted"})
+    graph = compiler.trace([0], configuration)
+
+    inputset = range(2000)
+    with pytest.raises(RuntimeError) as excinfo:
+        graph.measure_bounds(inputset)
+
+    assert str(excinfo.value) == "Bound measurement using inputset[1500] failed"
+
+
+def test_graph_execution_plan(helpers):
+    """
+    Test `execution_plan` method of `Graph` class.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x, y: (x + y) * x, {"x": "encrypted", "y": "clear"})
+    graph = compiler.trace(fhe.inputset(fhe.uint3, fhe.uint3), configuration)
+
+    plan = graph.execution_plan()
+    assert graph.execution_plan() is plan
+
+    for node, pred_indices, input_slot in zip(plan.nodes, plan.preds, plan.input_slots):
+        assert [plan.nodes[index] for index in pred_indices] == graph.ordered_preds_of(node)
+        assert input_slot == graph.input_indices.get(node)
+        assert all(index < plan.nodes.index(node) for index in pred_indices)
+
+    assert graph(3, 4) == (3 + 4) * 3
+
+    graph.prune_useless_nodes()
+    assert graph.execution_plan() is not plan
+
+
+def test_graph_evaluate_protects_results(helpers):
+    """
+    Test `evaluate` method of `Graph` class doesn't let nodes modify results of other nodes.
+    """
+
+    def function(x):
+        y = x + 1
+        z = y * 2
+        y[0] = 0
+        return y, z
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    graph = compiler.trace(fhe.inputset(fhe.tensor[fhe.uint3, 3]), configuration)  # type: ignore
+
+    sample = np.array([1, 2, 3])
+    y, z = graph(sample)
+
+    assert np.array_equal(sample, [1, 2, 3])
+    assert np.array_equal(y, [0, 3, 4])
+    assert np.array_equal(z, [4, 6, 8])
+
+    assert y.flags.writeable
+    assert z.flags.writeable
@@ -0,0 +1,75 @@
+"""
+Tests of `runtime` module.
+"""
+
+import json
+import subprocess
+import sys
+
+# dependencies which are only needed to trace and compile
+HEAVY_MODULES = ["torch", "z3", "scipy", "networkx"]
+
+IMPORT_RUNTIME = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from concrete.fhe.runtime import Client, ClientSpecs, EvaluationKeys, Keys, Server, Value
+runtime_import_time = time.perf_counter() - start
+
+loaded = sorted(set(name.split(".")[0] for name in sys.modules))
+
+start = time.perf_counter()
+for name in {heavy_modules}:
+    __import__(name)
+heavy_import_time = time.perf_counter() - start
+
+print(json.dumps({{
+    "loaded": loaded,
+    "runtime_import_time": runtime_import_time,
+    "heavy_import_time": heavy_import_time,
+}}))
+"""
+
+
+def import_runtime() -> dict:
+    """
+    Import `concrete.fhe.runtime` in a new process.
+    """
+
+    code = IMPORT_RUNTIME.format(heavy_modules=HEAVY_MODULES)
+    # runs the current interpreter on a script built from constants, no untrusted input
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_runtime_does_not_load_heavy_modules():
+    """
+    Test importing `concrete.fhe.runtime` doesn't load the dependencies of compilation.
+    """
+
+    result = import_runtime()
+
+    loaded_heavy_modules = [name for name in HEAVY_MODULES if name in result["loaded"]]
+    assert loaded_heavy_modules == []
+
+    # not importing them saves more time than the import of the runtime takes
+    assert result["runtime_import_time"] < result["heavy_import_time"]
+
+
+def test_runtime_exposes_client_and_server():
+    """
+    Test `concrete.fhe.runtime` exposes the same classes as `concrete.fhe`.
+    """
+
+    from concrete import fhe  # pylint: disable=import-outside-toplevel
+    from concrete.fhe import runtime  # pylint: disable=import-outside-toplevel
+
+    for name in ["Client", "ClientSpecs", "EvaluationKeys", "Keys", "Server", "Value"]:
+        assert getattr(runtime, name) is getattr(fhe, name)
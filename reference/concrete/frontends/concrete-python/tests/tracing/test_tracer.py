@@ -7,8 +7,9 @@ import pytest
 
 from concrete.fhe.dtypes import UnsignedInteger
 from concrete.fhe.tracing import Tracer
+from concrete.fhe.tracing.inference import infer
 from concrete.fhe.tracing.typing import uint4
-from concrete.fhe.values import EncryptedTensor
+from concrete.fhe.values import EncryptedTensor, ValueDescription
 
 
 def bad_assignment(x):
@@ -178,3 +179,77 @@ def test_tracer_warning_trace(function, parameters, expected_message, capsys):
 
     captured = capsys.readouterr()
     assert captured.out.strip() == expected_message
+
+
+def ones(*shape, dtype=np.int64):
+    """
+    Create a sample filled with ones.
+    """
+
+    return np.ones(shape, dtype=dtype)
+
+
+@pytest.mark.parametrize(
+    "operation,samples,kwargs",
+    [
+        pytest.param(np.add, [ones(3, 1), ones(4)], {}),
+        pytest.param(np.negative, [ones(2, 3)], {}),
+        pytest.param(np.true_divide, [ones(2, 3), np.float32(1)], {}),
+        pytest.param(np.sqrt, [ones(2, 3, dtype=np.float32)], {}),
+        pytest.param(np.where, [ones(2, 1), ones(3), np.int64(1)], {}),
+        pytest.param(np.clip, [ones(2, 3), np.int64(1), np.int64(1)], {}),
+        pytest.param(np.around, [ones(2, 3, dtype=np.float64)], {"decimals": 2}),
+        pytest.param(np.sum, [ones(2, 3)], {}),
+        pytest.param(np.sum, [ones(2, 3, 4)], {"axis": (0, 2), "keepdims": True}),
+        pytest.param(np.max, [ones(2, 3)], {"axis": -1}),
+        pytest.param(np.min, [np.int64(1)], {}),
+        pytest.param(np.matmul, [ones(2, 3, 4), ones(4, 5)], {}),
+        pytest.param(np.matmul, [ones(4), ones(3, 4, 5)], {}),
+        pytest.param(np.matmul, [ones(3, 4), ones(4)], {}),
+        pytest.param(np.dot, [ones(3, 4), ones(2, 4, 5)], {}),
+        pytest.param(np.dot, [ones(4), ones(4)], {}),
+        pytest.param(np.dot, [ones(2, 3), np.int64(1)], {}),
+        pytest.param(np.concatenate, [(ones(2, 3), ones(4, 3))], {}),
+        pytest.param(np.concatenate, [(ones(2, 3), ones(2, 1))], {"axis": -1}),
+        pytest.param(np.concatenate, [(ones(2, 3), ones(4))], {"axis": None}),
+        pytest.param(np.reshape, [ones(2, 3)], {"newshape": (3, -1)}),
+        pytest.param(np.transpose, [ones(2, 3, 4)], {"axes": (1, 0, 2)}),
+        pytest.param(np.expand_dims, [ones(2, 3)], {"axis": 1}),
+        pytest.param(np.squeeze, [ones(1, 3, 1)], {}),
+        pytest.param(np.broadcast_to, [ones(2, 3)], {"shape": (4, 2, 3)}),
+    ],
+)
+def test_tracer_inference(operation, samples, kwargs):
+    """
+    Test inferred results of numpy operations match their evaluation.
+    """
+
+    inferred = infer(operation, samples, kwargs)
+    assert inferred is not None
+
+    element, shape = inferred
+
+    inferred_value = ValueDescription.of(element)
+    inferred_value.shape = shape
+
+    assert inferred_value == ValueDescription.of(operation(*samples, **kwargs))
+
+
+@pytest.mark.parametrize(
+    "operation,samples,kwargs",
+    [
+        pytest.param(np.add, [ones(3), ones(4)], {}),
+        pytest.param(np.sum, [ones(2, 3)], {"axis": 2}),
+        pytest.param(np.matmul, [ones(2, 3), ones(2, 3)], {}),
+        pytest.param(np.concatenate, [(ones(2, 3), ones(2, 1))], {}),
+        pytest.param(np.reshape, [ones(2, 3)], {"newshape": (4, -1)}),
+        pytest.param(np.add, [ones(0, 3), ones(3)], {}),
+        pytest.param(np.cumsum, [ones(2, 3)], {}),
+    ],
+)
+def test_tracer_inference_fallback(operation, samples, kwargs):
+    """
+    Test numpy operations which cannot be inferred are left for evaluation.
+    """
+
+    assert infer(operation, samples, kwargs) is None